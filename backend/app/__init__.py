@@ -25,12 +25,40 @@ def create_app(config_name=None):
     # Load configuration
     app.config.from_object(config[config_name])
 
+    # Take the client address from the trusted reverse proxies' headers
+    if app.config['TRUSTED_PROXY_HOPS'] > 0:
+        from werkzeug.middleware.proxy_fix import ProxyFix
+        hops = app.config['TRUSTED_PROXY_HOPS']
+        app.wsgi_app = ProxyFix(app.wsgi_app, x_for=hops, x_proto=hops)
+
+    if app.config['JSON_ENCODER'] == 'orjson':
+        from app.utils.json_provider import OrjsonProvider
+        app.json = OrjsonProvider(app)
+
     # Initialize extensions
     initialize_extensions(app)
 
     # Register blueprints
     register_blueprints(app)
 
+    # Register CLI commands
+    from app.cli import register_commands
+    register_commands(app)
+
+    # Set up the public response cache
+    from app.services.response_cache import response_cache
+    response_cache.init_app(app)
+
+    # Set up password checks and login throttling
+    from app.services.password_pool import password_pool
+    from app.services.login_throttle import login_throttle
+    password_pool.init_app(app)
+    login_throttle.init_app(app)
+
+    # Start buffering recording views
+    from app.services.view_counter import view_counter
+    view_counter.init_app(app)
+
     # Register error handlers
     from app.utils.errors import register_error_handlers as register_custom_error_handlers
     register_custom_error_handlers(app)
@@ -45,14 +73,36 @@ def create_app(config_name=None):
 
 def initialize_extensions(app):
     """Initialize Flask extensions."""
+    from app.utils.database import (
+        engine_options, install_sqlite_pragmas, sqlite_pragmas, log_effective_settings
+    )
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = engine_options(app.config)
     db.init_app(app)
+    with app.app_context():
+        for engine in db.engines.values():
+            install_sqlite_pragmas(engine, sqlite_pragmas(app.config))
+
+    from app.utils.replicas import replica_router
+    replica_router.init_app(app, db)
+
     migrate.init_app(app, db)
     jwt.init_app(app)
     cors.init_app(app, origins=app.config['CORS_ORIGINS'])
 
+    from app.utils.instrumentation import sql_instrumentation
+    sql_instrumentation.init_app(app)
+
     # Import models to ensure they are registered with SQLAlchemy
     with app.app_context():
-        from app.models import AdminUser, Speaker, Tag, Session, Recording
+        from app.models import AdminUser, Speaker, Tag, Session, Recording, CacheVersion, RecordingArchive, SessionListing
+
+        from app.services.admin_identity import admin_identity
+        admin_identity.init_app(app)
+
+        from app.utils.metrics import metrics
+        metrics.init_app(app)
+
+        log_effective_settings(app, db.engine)
 
 
 def register_blueprints(app):
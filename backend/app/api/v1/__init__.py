@@ -12,7 +12,10 @@ def register_blueprints(app):
     Args:
         app: Flask application instance
     """
-    from app.api.v1 import auth, public, admin_sessions, admin_recordings, admin_speakers, admin_tags
+    from app.api.v1 import (
+        auth, public, admin_sessions, admin_recordings, admin_speakers, admin_tags, admin_cache,
+        admin_export
+    )
 
     # Register sub-blueprints
     api_v1.register_blueprint(auth.bp)
@@ -21,6 +24,8 @@ def register_blueprints(app):
     api_v1.register_blueprint(admin_recordings.bp)
     api_v1.register_blueprint(admin_speakers.bp)
     api_v1.register_blueprint(admin_tags.bp)
+    api_v1.register_blueprint(admin_cache.bp)
+    api_v1.register_blueprint(admin_export.bp)
 
     # Register main v1 blueprint with app
     app.register_blueprint(api_v1)
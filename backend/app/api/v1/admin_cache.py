@@ -0,0 +1,34 @@
+"""Admin endpoints for the public response cache."""
+from flask import Blueprint, jsonify
+
+from app.services.response_cache import response_cache
+from app.utils.decorators import admin_required
+
+bp = Blueprint('admin_cache', __name__, url_prefix='/admin/cache')
+
+
+@bp.route('', methods=['GET'])
+@admin_required
+def get_cache_stats():
+    """
+    Get response cache statistics.
+
+    Hit and miss counters are per worker process.
+
+    Returns:
+        200: Backend name, entry count, hits, misses and hit ratio
+    """
+    return jsonify(response_cache.stats()), 200
+
+
+@bp.route('', methods=['DELETE'])
+@admin_required
+def clear_cache():
+    """
+    Drop every cached public response.
+
+    Returns:
+        204: Cache cleared
+    """
+    response_cache.clear()
+    return '', 204
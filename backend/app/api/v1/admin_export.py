@@ -0,0 +1,60 @@
+"""Admin endpoints for bulk data export."""
+from datetime import date
+from flask import Blueprint, request, Response, stream_with_context
+
+from app.services import ExportService
+from app.services.export_service import FORMATS
+from app.utils.decorators import admin_required
+
+bp = Blueprint('admin_export', __name__, url_prefix='/admin/export')
+
+
+@bp.route('/<entity>', methods=['GET'])
+@admin_required
+def export(entity):
+    """
+    Export every row of sessions, recordings, speakers or tags, streamed.
+
+    Args:
+        entity: sessions, recordings, speakers or tags
+
+    Query Parameters:
+        format: csv (default) or ndjson
+        status: Filter sessions by status
+        speaker_id: Filter sessions by speaker
+        organ_tag_id: Filter sessions or recordings by organ tag
+        type_tag_id: Filter sessions or recordings by type tag
+        level_tag_id: Filter sessions or recordings by level tag
+        year: Filter recordings by recording year
+        search: Search sessions or recordings
+        category: Filter tags by category
+        active_only: Only export active tags (true/false)
+
+    Returns:
+        200: CSV with a header row, or one JSON object per line
+        400: Unsupported format
+        404: Unknown entity
+    """
+    fmt = request.args.get('format', 'csv')
+
+    # Get filters from query parameters
+    filters = {}
+    for name in ('status', 'speaker_id', 'organ_tag_id', 'type_tag_id', 'level_tag_id',
+                 'search', 'category'):
+        if request.args.get(name):
+            filters[name] = request.args.get(name)
+    if request.args.get('year', type=int):
+        filters['year'] = request.args.get('year', type=int)
+    if request.args.get('active_only', '').lower() == 'true':
+        filters['active_only'] = True
+
+    chunks = ExportService.generate(entity, fmt, filters)
+
+    filename = f'{entity}-{date.today().isoformat()}.{fmt}'
+    return Response(
+        stream_with_context(chunks),
+        mimetype=FORMATS[fmt],
+        headers={
+            'Content-Disposition': f'attachment; filename={filename}'
+        }
+    )
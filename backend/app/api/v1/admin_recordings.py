@@ -1,26 +1,22 @@
 """Admin endpoints for recording management."""
 from flask import Blueprint, request, jsonify
-from flask_jwt_extended import jwt_required
 from marshmallow import ValidationError as MarshmallowValidationError
 
 from app.services import RecordingService
-from app.schemas import (
-    RecordingCreateSchema,
-    RecordingUpdateSchema,
-    RecordingResponseSchema
-)
+from app.schemas import RecordingCreateSchema, RecordingUpdateSchema
+from app.schemas.serializers import serialize_recording_with_session
 from app.utils.errors import ValidationError
+from app.utils.decorators import admin_required
 
 bp = Blueprint('admin_recordings', __name__, url_prefix='/admin/recordings')
 
 # Initialize schemas
 recording_create_schema = RecordingCreateSchema()
 recording_update_schema = RecordingUpdateSchema()
-recording_response_schema = RecordingResponseSchema()
 
 
 @bp.route('', methods=['POST'])
-@jwt_required()
+@admin_required
 def create_recording():
     """
     Add a recording to a session.
@@ -42,25 +38,11 @@ def create_recording():
     # Create recording
     recording = RecordingService.add_recording(data['session_id'], data)
 
-    # Serialize response
-    recording_dict = recording.to_dict()
-    if recording.session:
-        recording_dict['session'] = {
-            'id': recording.session.id,
-            'title': recording.session.title,
-            'summary': recording.session.summary,
-            'date': recording.session.date.isoformat(),
-            'time': recording.session.time.isoformat(),
-            'duration_minutes': recording.session.duration_minutes,
-            'status': recording.session.status,
-            'speaker': recording.session.speaker.to_dict() if recording.session.speaker else None
-        }
-
-    return jsonify(recording_response_schema.dump(recording_dict)), 201
+    return jsonify(serialize_recording_with_session(recording)), 201
 
 
 @bp.route('/<recording_id>', methods=['PUT'])
-@jwt_required()
+@admin_required
 def update_recording(recording_id):
     """
     Update a recording.
@@ -85,25 +67,11 @@ def update_recording(recording_id):
     # Update recording
     recording = RecordingService.update_recording(recording_id, data)
 
-    # Serialize response
-    recording_dict = recording.to_dict()
-    if recording.session:
-        recording_dict['session'] = {
-            'id': recording.session.id,
-            'title': recording.session.title,
-            'summary': recording.session.summary,
-            'date': recording.session.date.isoformat(),
-            'time': recording.session.time.isoformat(),
-            'duration_minutes': recording.session.duration_minutes,
-            'status': recording.session.status,
-            'speaker': recording.session.speaker.to_dict() if recording.session.speaker else None
-        }
-
-    return jsonify(recording_response_schema.dump(recording_dict)), 200
+    return jsonify(serialize_recording_with_session(recording)), 200
 
 
 @bp.route('/<recording_id>', methods=['DELETE'])
-@jwt_required()
+@admin_required
 def delete_recording(recording_id):
     """
     Delete a recording.
@@ -1,29 +1,25 @@
 """Admin endpoints for session management."""
 from flask import Blueprint, request, jsonify
-from flask_jwt_extended import jwt_required, get_jwt_identity
+from flask_jwt_extended import get_jwt_identity
 from marshmallow import ValidationError as MarshmallowValidationError
 
 from app.services import SessionService
-from app.schemas import (
-    SessionCreateSchema,
-    SessionUpdateSchema,
-    SessionResponseSchema,
-    SessionListSchema
-)
+from app.services.session_service import SESSION_FIELDSETS
+from app.schemas import SessionCreateSchema, SessionUpdateSchema
+from app.schemas.serializers import serialize_session
 from app.utils.errors import ValidationError
-from math import ceil
+from app.utils.pagination import get_pagination_params, total_pages
+from app.utils.decorators import admin_required
 
 bp = Blueprint('admin_sessions', __name__, url_prefix='/admin/sessions')
 
 # Initialize schemas
 session_create_schema = SessionCreateSchema()
 session_update_schema = SessionUpdateSchema()
-session_response_schema = SessionResponseSchema()
-session_list_schema = SessionListSchema()
 
 
 @bp.route('', methods=['GET'])
-@jwt_required()
+@admin_required
 def list_sessions():
     """
     List all sessions (admin view - any status).
@@ -34,8 +30,11 @@ def list_sessions():
         organ_tag_id: Filter by organ tag
         type_tag_id: Filter by type tag
         level_tag_id: Filter by level tag
+        fields: full (default), card, or comma-separated fields (e.g. title,speaker.name)
         page: Page number (default: 1)
         per_page: Items per page (default: 20)
+        cursor: Cursor from next_cursor (enables keyset pagination)
+        include_total: Count matching rows in cursor mode (true/false)
 
     Returns:
         200: Paginated list of sessions
@@ -53,45 +52,31 @@ def list_sessions():
     if request.args.get('level_tag_id'):
         filters['level_tag_id'] = request.args.get('level_tag_id')
 
-    # Get pagination parameters
-    page = request.args.get('page', 1, type=int)
-    per_page = request.args.get('per_page', 20, type=int)
+    fieldset = SESSION_FIELDSETS.from_request(request.args)
 
-    pagination = {
-        'page': page,
-        'per_page': per_page
-    }
+    # Get pagination parameters
+    pagination = get_pagination_params()
 
     # Get sessions
-    sessions, total = SessionService.list_sessions(filters, pagination)
+    sessions, total, next_cursor = SessionService.list_sessions(
+        filters, pagination, fieldset.load_options
+    )
 
     # Serialize with nested relationships
-    sessions_data = []
-    for session in sessions:
-        session_dict = session.to_dict()
-        session_dict['speaker'] = session.speaker.to_dict() if session.speaker else None
-        session_dict['organ_tag'] = session.organ_tag.to_dict() if session.organ_tag else None
-        session_dict['type_tag'] = session.type_tag.to_dict() if session.type_tag else None
-        session_dict['level_tag'] = session.level_tag.to_dict() if session.level_tag else None
-        if session.recording:
-            session_dict['recording'] = session.recording.to_dict()
-        session_dict['has_recording'] = session.recording is not None
-        sessions_data.append(session_response_schema.dump(session_dict))
-
-    # Create response
-    response_data = session_list_schema.dump({
+    sessions_data = [fieldset.serialize(session) for session in sessions]
+
+    return jsonify({
         'items': sessions_data,
         'total': total,
-        'page': page,
-        'per_page': per_page,
-        'pages': ceil(total / per_page) if per_page > 0 else 0
-    })
-
-    return jsonify(response_data), 200
+        'page': pagination['page'],
+        'per_page': pagination['per_page'],
+        'pages': total_pages(total, pagination['per_page']),
+        'next_cursor': next_cursor
+    }), 200
 
 
 @bp.route('', methods=['POST'])
-@jwt_required()
+@admin_required
 def create_session():
     """
     Create a new session.
@@ -115,19 +100,11 @@ def create_session():
     # Create session
     session = SessionService.create_session(data, current_user_id)
 
-    # Serialize response
-    session_dict = session.to_dict()
-    session_dict['speaker'] = session.speaker.to_dict() if session.speaker else None
-    session_dict['organ_tag'] = session.organ_tag.to_dict() if session.organ_tag else None
-    session_dict['type_tag'] = session.type_tag.to_dict() if session.type_tag else None
-    session_dict['level_tag'] = session.level_tag.to_dict() if session.level_tag else None
-    session_dict['has_recording'] = False
-
-    return jsonify(session_response_schema.dump(session_dict)), 201
+    return jsonify(serialize_session(session)), 201
 
 
 @bp.route('/<session_id>', methods=['GET'])
-@jwt_required()
+@admin_required
 def get_session(session_id):
     """
     Get session detail.
@@ -141,21 +118,11 @@ def get_session(session_id):
     """
     session = SessionService.get_session(session_id)
 
-    # Serialize with nested relationships
-    session_dict = session.to_dict()
-    session_dict['speaker'] = session.speaker.to_dict() if session.speaker else None
-    session_dict['organ_tag'] = session.organ_tag.to_dict() if session.organ_tag else None
-    session_dict['type_tag'] = session.type_tag.to_dict() if session.type_tag else None
-    session_dict['level_tag'] = session.level_tag.to_dict() if session.level_tag else None
-    if session.recording:
-        session_dict['recording'] = session.recording.to_dict()
-    session_dict['has_recording'] = session.recording is not None
-
-    return jsonify(session_response_schema.dump(session_dict)), 200
+    return jsonify(serialize_session(session)), 200
 
 
 @bp.route('/<session_id>', methods=['PUT'])
-@jwt_required()
+@admin_required
 def update_session(session_id):
     """
     Update a session.
@@ -180,21 +147,11 @@ def update_session(session_id):
     # Update session
     session = SessionService.update_session(session_id, data)
 
-    # Serialize response
-    session_dict = session.to_dict()
-    session_dict['speaker'] = session.speaker.to_dict() if session.speaker else None
-    session_dict['organ_tag'] = session.organ_tag.to_dict() if session.organ_tag else None
-    session_dict['type_tag'] = session.type_tag.to_dict() if session.type_tag else None
-    session_dict['level_tag'] = session.level_tag.to_dict() if session.level_tag else None
-    if session.recording:
-        session_dict['recording'] = session.recording.to_dict()
-    session_dict['has_recording'] = session.recording is not None
-
-    return jsonify(session_response_schema.dump(session_dict)), 200
+    return jsonify(serialize_session(session)), 200
 
 
 @bp.route('/<session_id>', methods=['DELETE'])
-@jwt_required()
+@admin_required
 def delete_session(session_id):
     """
     Delete a session (only draft sessions can be deleted).
@@ -212,7 +169,7 @@ def delete_session(session_id):
 
 
 @bp.route('/<session_id>/publish', methods=['POST'])
-@jwt_required()
+@admin_required
 def publish_session(session_id):
     """
     Publish a session.
@@ -227,21 +184,11 @@ def publish_session(session_id):
     """
     session = SessionService.publish_session(session_id)
 
-    # Serialize response
-    session_dict = session.to_dict()
-    session_dict['speaker'] = session.speaker.to_dict() if session.speaker else None
-    session_dict['organ_tag'] = session.organ_tag.to_dict() if session.organ_tag else None
-    session_dict['type_tag'] = session.type_tag.to_dict() if session.type_tag else None
-    session_dict['level_tag'] = session.level_tag.to_dict() if session.level_tag else None
-    if session.recording:
-        session_dict['recording'] = session.recording.to_dict()
-    session_dict['has_recording'] = session.recording is not None
-
-    return jsonify(session_response_schema.dump(session_dict)), 200
+    return jsonify(serialize_session(session)), 200
 
 
 @bp.route('/<session_id>/unpublish', methods=['POST'])
-@jwt_required()
+@admin_required
 def unpublish_session(session_id):
     """
     Unpublish a session (revert to draft).
@@ -256,21 +203,11 @@ def unpublish_session(session_id):
     """
     session = SessionService.unpublish_session(session_id)
 
-    # Serialize response
-    session_dict = session.to_dict()
-    session_dict['speaker'] = session.speaker.to_dict() if session.speaker else None
-    session_dict['organ_tag'] = session.organ_tag.to_dict() if session.organ_tag else None
-    session_dict['type_tag'] = session.type_tag.to_dict() if session.type_tag else None
-    session_dict['level_tag'] = session.level_tag.to_dict() if session.level_tag else None
-    if session.recording:
-        session_dict['recording'] = session.recording.to_dict()
-    session_dict['has_recording'] = session.recording is not None
-
-    return jsonify(session_response_schema.dump(session_dict)), 200
+    return jsonify(serialize_session(session)), 200
 
 
 @bp.route('/<session_id>/complete', methods=['POST'])
-@jwt_required()
+@admin_required
 def complete_session(session_id):
     """
     Mark session as completed and add recording.
@@ -299,21 +236,11 @@ def complete_session(session_id):
         data.get('pdf_url')
     )
 
-    # Serialize response
-    session_dict = session.to_dict()
-    session_dict['speaker'] = session.speaker.to_dict() if session.speaker else None
-    session_dict['organ_tag'] = session.organ_tag.to_dict() if session.organ_tag else None
-    session_dict['type_tag'] = session.type_tag.to_dict() if session.type_tag else None
-    session_dict['level_tag'] = session.level_tag.to_dict() if session.level_tag else None
-    if session.recording:
-        session_dict['recording'] = session.recording.to_dict()
-    session_dict['has_recording'] = session.recording is not None
-
-    return jsonify(session_response_schema.dump(session_dict)), 200
+    return jsonify(serialize_session(session)), 200
 
 
 @bp.route('/upcoming', methods=['GET'])
-@jwt_required()
+@admin_required
 def list_upcoming_sessions():
     """
     List upcoming sessions (admin view).
@@ -322,6 +249,7 @@ def list_upcoming_sessions():
         organ_tag_id: Filter by organ tag
         type_tag_id: Filter by type tag
         level_tag_id: Filter by level tag
+        fields: full (default), card, or comma-separated fields (e.g. title,speaker.name)
 
     Returns:
         200: List of upcoming sessions
@@ -335,27 +263,19 @@ def list_upcoming_sessions():
     if request.args.get('level_tag_id'):
         filters['level_tag_id'] = request.args.get('level_tag_id')
 
+    fieldset = SESSION_FIELDSETS.from_request(request.args)
+
     # Get sessions
-    sessions = SessionService.list_upcoming_sessions(filters)
+    sessions = SessionService.list_upcoming_sessions(filters, fieldset.load_options)
 
     # Serialize with nested relationships
-    sessions_data = []
-    for session in sessions:
-        session_dict = session.to_dict()
-        session_dict['speaker'] = session.speaker.to_dict() if session.speaker else None
-        session_dict['organ_tag'] = session.organ_tag.to_dict() if session.organ_tag else None
-        session_dict['type_tag'] = session.type_tag.to_dict() if session.type_tag else None
-        session_dict['level_tag'] = session.level_tag.to_dict() if session.level_tag else None
-        if session.recording:
-            session_dict['recording'] = session.recording.to_dict()
-        session_dict['has_recording'] = session.recording is not None
-        sessions_data.append(session_response_schema.dump(session_dict))
+    sessions_data = [fieldset.serialize(session) for session in sessions]
 
     return jsonify({'sessions': sessions_data}), 200
 
 
 @bp.route('/past', methods=['GET'])
-@jwt_required()
+@admin_required
 def list_past_sessions():
     """
     List past sessions (admin view) with search and pagination.
@@ -366,8 +286,11 @@ def list_past_sessions():
         type_tag_id: Filter by type tag
         level_tag_id: Filter by level tag
         search: Search in title, summary, abstract, speaker name, tag labels
+        fields: full (default), card, or comma-separated fields (e.g. title,speaker.name)
         page: Page number (default: 1)
         per_page: Items per page (default: 20)
+        cursor: Cursor from next_cursor (enables keyset pagination)
+        include_total: Count matching rows in cursor mode (true/false)
 
     Returns:
         200: Paginated list of past sessions
@@ -386,34 +309,23 @@ def list_past_sessions():
         filters['search'] = request.args.get('search')
 
     # Get pagination parameters
-    page = request.args.get('page', 1, type=int)
-    per_page = request.args.get('per_page', 20, type=int)
+    pagination = get_pagination_params()
 
-    pagination = {
-        'page': page,
-        'per_page': per_page
-    }
+    fieldset = SESSION_FIELDSETS.from_request(request.args)
 
     # Get sessions with pagination
-    sessions, total = SessionService.list_past_sessions(filters, pagination)
+    sessions, total, next_cursor = SessionService.list_past_sessions(
+        filters, pagination, fieldset.load_options
+    )
 
     # Serialize with nested relationships
-    sessions_data = []
-    for session in sessions:
-        session_dict = session.to_dict()
-        session_dict['speaker'] = session.speaker.to_dict() if session.speaker else None
-        session_dict['organ_tag'] = session.organ_tag.to_dict() if session.organ_tag else None
-        session_dict['type_tag'] = session.type_tag.to_dict() if session.type_tag else None
-        session_dict['level_tag'] = session.level_tag.to_dict() if session.level_tag else None
-        if session.recording:
-            session_dict['recording'] = session.recording.to_dict()
-        session_dict['has_recording'] = session.recording is not None
-        sessions_data.append(session_response_schema.dump(session_dict))
+    sessions_data = [fieldset.serialize(session) for session in sessions]
 
     return jsonify({
         'items': sessions_data,
         'total': total,
-        'page': page,
-        'per_page': per_page,
-        'total_pages': ceil(total / per_page) if per_page > 0 else 0
+        'page': pagination['page'],
+        'per_page': pagination['per_page'],
+        'total_pages': total_pages(total, pagination['per_page']),
+        'next_cursor': next_cursor
     }), 200
@@ -1,43 +1,44 @@
 """Admin endpoints for speaker management."""
 from flask import Blueprint, request, jsonify
-from flask_jwt_extended import jwt_required
 from marshmallow import ValidationError as MarshmallowValidationError
 
 from app.services import SpeakerService
-from app.schemas import (
-    SpeakerCreateSchema,
-    SpeakerUpdateSchema,
-    SpeakerResponseSchema
-)
+from app.services.speaker_service import SPEAKER_FIELDSETS
+from app.schemas import SpeakerCreateSchema, SpeakerUpdateSchema
+from app.schemas.serializers import dump_speaker
 from app.utils.errors import ValidationError
+from app.utils.decorators import admin_required
 
 bp = Blueprint('admin_speakers', __name__, url_prefix='/admin/speakers')
 
 # Initialize schemas
 speaker_create_schema = SpeakerCreateSchema()
 speaker_update_schema = SpeakerUpdateSchema()
-speaker_response_schema = SpeakerResponseSchema()
 
 
 @bp.route('', methods=['GET'])
-@jwt_required()
+@admin_required
 def list_speakers():
     """
     List all speakers.
 
+    Query Parameters:
+        fields: full (default), card, or comma-separated fields (e.g. id,name)
+
     Returns:
         200: List of all speakers
     """
-    speakers = SpeakerService.list_speakers()
+    fieldset = SPEAKER_FIELDSETS.from_request(request.args)
+    speakers = SpeakerService.list_speakers(fieldset.load_options)
 
     # Serialize
-    speakers_data = [speaker_response_schema.dump(speaker.to_dict()) for speaker in speakers]
+    speakers_data = [fieldset.serialize(speaker) for speaker in speakers]
 
     return jsonify({'speakers': speakers_data}), 200
 
 
 @bp.route('', methods=['POST'])
-@jwt_required()
+@admin_required
 def create_speaker():
     """
     Create a new speaker.
@@ -58,11 +59,11 @@ def create_speaker():
     # Create speaker
     speaker = SpeakerService.create_speaker(data)
 
-    return jsonify(speaker_response_schema.dump(speaker.to_dict())), 201
+    return jsonify(dump_speaker(speaker)), 201
 
 
 @bp.route('/<speaker_id>', methods=['PUT'])
-@jwt_required()
+@admin_required
 def update_speaker(speaker_id):
     """
     Update a speaker.
@@ -87,11 +88,11 @@ def update_speaker(speaker_id):
     # Update speaker
     speaker = SpeakerService.update_speaker(speaker_id, data)
 
-    return jsonify(speaker_response_schema.dump(speaker.to_dict())), 200
+    return jsonify(dump_speaker(speaker)), 200
 
 
 @bp.route('/<speaker_id>', methods=['DELETE'])
-@jwt_required()
+@admin_required
 def delete_speaker(speaker_id):
     """
     Delete a speaker (only if not associated with any sessions).
@@ -1,28 +1,28 @@
 """Admin endpoints for tag management."""
 from flask import Blueprint, request, jsonify
-from flask_jwt_extended import jwt_required
 from marshmallow import ValidationError as MarshmallowValidationError
 
 from app.services import TagService
+from app.services.tag_service import TAG_FIELDSETS
 from app.schemas import (
     TagCreateSchema,
     TagUpdateSchema,
-    TagResponseSchema,
     TagUsageResponseSchema
 )
+from app.schemas.serializers import dump_tag
 from app.utils.errors import ValidationError
+from app.utils.decorators import admin_required
 
 bp = Blueprint('admin_tags', __name__, url_prefix='/admin/tags')
 
 # Initialize schemas
 tag_create_schema = TagCreateSchema()
 tag_update_schema = TagUpdateSchema()
-tag_response_schema = TagResponseSchema()
 tag_usage_schema = TagUsageResponseSchema()
 
 
 @bp.route('', methods=['GET'])
-@jwt_required()
+@admin_required
 def list_tags():
     """
     List all tags.
@@ -30,23 +30,25 @@ def list_tags():
     Query Parameters:
         category: Filter by category (organ, type, level)
         active_only: Only return active tags (true/false)
+        fields: full (default), card, or comma-separated fields (e.g. id,label)
 
     Returns:
         200: List of tags
     """
     category = request.args.get('category')
     active_only = request.args.get('active_only', '').lower() == 'true'
+    fieldset = TAG_FIELDSETS.from_request(request.args)
 
     tags = TagService.list_tags(category=category, active_only=active_only)
 
     # Serialize
-    tags_data = [tag_response_schema.dump(tag.to_dict()) for tag in tags]
+    tags_data = [fieldset.serialize(tag) for tag in tags]
 
     return jsonify({'tags': tags_data}), 200
 
 
 @bp.route('', methods=['POST'])
-@jwt_required()
+@admin_required
 def create_tag():
     """
     Create a new tag.
@@ -67,11 +69,11 @@ def create_tag():
     # Create tag
     tag = TagService.create_tag(data)
 
-    return jsonify(tag_response_schema.dump(tag.to_dict())), 201
+    return jsonify(dump_tag(tag)), 201
 
 
 @bp.route('/<tag_id>', methods=['PUT'])
-@jwt_required()
+@admin_required
 def update_tag(tag_id):
     """
     Update a tag.
@@ -96,11 +98,11 @@ def update_tag(tag_id):
     # Update tag
     tag = TagService.update_tag(tag_id, data)
 
-    return jsonify(tag_response_schema.dump(tag.to_dict())), 200
+    return jsonify(dump_tag(tag)), 200
 
 
 @bp.route('/<tag_id>', methods=['DELETE'])
-@jwt_required()
+@admin_required
 def delete_tag(tag_id):
     """
     Delete a tag. If in use, optionally replace with another tag first.
@@ -122,7 +124,7 @@ def delete_tag(tag_id):
 
 
 @bp.route('/<tag_id>/usage', methods=['GET'])
-@jwt_required()
+@admin_required
 def get_tag_usage(tag_id):
     """
     Get tag usage information.
@@ -1,17 +1,21 @@
 """Authentication endpoints."""
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, current_app, request, jsonify
 from flask_jwt_extended import (
     create_access_token,
     create_refresh_token,
     jwt_required,
     get_jwt_identity,
-    get_jwt
+    current_user
 )
 from marshmallow import ValidationError as MarshmallowValidationError
 
+from app.extensions import db
 from app.models import AdminUser
 from app.schemas import LoginRequestSchema, TokenResponseSchema, AdminUserResponseSchema
-from app.utils.errors import AuthError, NotFoundError
+from app.services.admin_identity import admin_identity
+from app.services.login_throttle import login_throttle
+from app.services.password_pool import password_pool
+from app.utils.errors import AuthError
 
 bp = Blueprint('auth', __name__, url_prefix='/auth')
 
@@ -36,6 +40,8 @@ def login():
         200: Login successful with JWT tokens
         400: Validation error
         401: Invalid credentials
+        429: Too many failed attempts for this email or IP
+        503: Too many password checks in progress
     """
     # Validate request data
     try:
@@ -43,12 +49,25 @@ def login():
     except MarshmallowValidationError as e:
         raise AuthError('Invalid login credentials', 'INVALID_CREDENTIALS')
 
-    # Find user by email
+    # Refuse throttled emails and IPs before spending any bcrypt time. Behind a
+    # reverse proxy, ProxyFix (TRUSTED_PROXY_HOPS) has set the client's address
+    ip = request.remote_addr or 'unknown'
+    login_throttle.check(data['email'], ip)
+
+    # Find user by email; the password is checked on the password pool
     user = AdminUser.query.filter_by(email=data['email']).first()
-    if not user or not user.check_password(data['password']):
+    if not user or not password_pool.check(data['password'], user.password_hash):
+        login_throttle.failed(data['email'], ip)
         raise AuthError('Invalid email or password', 'INVALID_CREDENTIALS')
+    login_throttle.succeeded(data['email'])
+
+    # Upgrade hashes made with a different bcrypt cost than configured
+    if user.needs_rehash():
+        user.password_hash = password_pool.hash(data['password'], current_app.config['BCRYPT_ROUNDS'])
+        db.session.commit()
 
-    # Create JWT tokens
+    # Create JWT tokens; the cached snapshot supplies the role claim
+    admin_identity.remember(user)
     access_token = create_access_token(identity=user.id)
     refresh_token = create_refresh_token(identity=user.id)
 
@@ -116,16 +135,8 @@ def get_current_user():
 
     Returns:
         200: User information
-        401: Invalid or expired token
-        404: User not found
+        401: Invalid or expired token, or the user no longer exists
     """
-    current_user_id = get_jwt_identity()
-
-    # Get user from database
-    user = AdminUser.query.get(current_user_id)
-    if not user:
-        raise NotFoundError('User not found', 'USER_NOT_FOUND')
-
-    # Return user data
-    response_data = admin_user_schema.dump(user)
+    # Resolved from the admin identity cache when the token was verified
+    response_data = admin_user_schema.dump(current_user)
     return jsonify(response_data), 200
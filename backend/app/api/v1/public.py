@@ -1,103 +1,60 @@
 """Public endpoints for website visitors."""
-from flask import Blueprint, request, jsonify, Response
-from datetime import date
-from sqlalchemy import or_, desc, asc, extract
+from flask import Blueprint, request, jsonify, Response, stream_with_context
 
 from app.services import SessionService, RecordingService, CalendarService, TagService
-from app.schemas import SessionResponseSchema, RecordingResponseSchema, TagResponseSchema
+from app.services.session_service import RECORDING_SORTS, SESSION_FIELDSETS, RECORDING_FIELDSETS
+from app.services.session_listings import session_listings, RELEVANCE
+from app.services.tag_service import TAG_FIELDSETS
+from app.services.response_cache import response_cache, SESSIONS, RECORDINGS, SPEAKERS, TAGS, VIEWS
+from app.services.catalog import catalog
+from app.services.facet_service import FacetService
+from app.services.home_snapshot import home_snapshot
+from app.services.recording_archive import recording_archive
+from app.services.tag_registry import tag_registry
+from app.services.view_counter import view_counter
+from app.schemas.serializers import serialize_session, serialize_recording_with_session
+from app.models import Recording
+from app.utils.conditional import conditional, entity_version
 from app.utils.errors import NotFoundError
+from app.utils.pagination import get_pagination_params, total_pages
 
 bp = Blueprint('public', __name__, url_prefix='/public')
 
-# Initialize schemas
-session_schema = SessionResponseSchema()
-recording_schema = RecordingResponseSchema()
-tag_schema = TagResponseSchema()
-
-
-def serialize_session(session):
-    """Helper to serialize a session with all relationships."""
-    session_dict = session.to_dict()
-    session_dict['speaker'] = session.speaker.to_dict() if session.speaker else None
-    session_dict['organ_tag'] = session.organ_tag.to_dict() if session.organ_tag else None
-    session_dict['type_tag'] = session.type_tag.to_dict() if session.type_tag else None
-    session_dict['level_tag'] = session.level_tag.to_dict() if session.level_tag else None
-    if session.recording:
-        session_dict['recording'] = session.recording.to_dict()
-    session_dict['has_recording'] = session.recording is not None
-    return session_schema.dump(session_dict)
-
-
-def serialize_recording_with_session(recording):
-    """Helper to serialize a recording with full session info including tags."""
-    recording_dict = recording.to_dict()
-    if recording.session:
-        session = recording.session
-        recording_dict['session'] = {
-            'id': session.id,
-            'title': session.title,
-            'summary': session.summary,
-            'abstract': session.abstract,
-            'objectives': session.objectives,
-            'date': session.date.isoformat(),
-            'time': session.time.isoformat(),
-            'duration_minutes': session.duration_minutes,
-            'status': session.status,
-            'speaker': session.speaker.to_dict() if session.speaker else None,
-            'organ_tag': session.organ_tag.to_dict() if session.organ_tag else None,
-            'type_tag': session.type_tag.to_dict() if session.type_tag else None,
-            'level_tag': session.level_tag.to_dict() if session.level_tag else None,
-        }
-        # Also add flattened fields for easier frontend access
-        recording_dict['title'] = session.title
-        recording_dict['abstract'] = session.abstract
-        recording_dict['objectives'] = session.objectives
-        recording_dict['date'] = session.date.isoformat()
-        recording_dict['duration_minutes'] = session.duration_minutes
-        recording_dict['speaker'] = session.speaker.to_dict() if session.speaker else None
-        recording_dict['organ_tag'] = session.organ_tag.to_dict() if session.organ_tag else None
-        recording_dict['type_tag'] = session.type_tag.to_dict() if session.type_tag else None
-        recording_dict['level_tag'] = session.level_tag.to_dict() if session.level_tag else None
-    return recording_schema.dump(recording_dict)
+
+def content_version():
+    """Fingerprint the entities public session and recording payloads are built from."""
+    return entity_version(SESSIONS, RECORDINGS, SPEAKERS, TAGS)
+
+
+def recording_listing_tags():
+    """Entity types the requested recordings listing depends on beyond its content."""
+    # Only the most_viewed order changes with every flush of view counts
+    return (VIEWS,) if request.args.get('sort_by') == 'most_viewed' else ()
+
+
+def recording_listing_version():
+    """Fingerprint the requested recordings listing."""
+    return entity_version(SESSIONS, RECORDINGS, SPEAKERS, TAGS, *recording_listing_tags())
 
 
 @bp.route('/home', methods=['GET'])
+@conditional(home_snapshot.fingerprint)
 def get_home_data():
     """
     Get landing page data (recent sessions and recordings).
 
+    Served from the precomputed home snapshot.
+
     Returns:
         200: Home page data with recent sessions and recordings
+        304: Not modified since the ETag in If-None-Match
     """
-    from app.models import Recording, Session
-
-    # Get upcoming published sessions (limit 4)
-    upcoming_sessions = SessionService.list_upcoming_sessions()[:4]
-
-    # Get recent recordings (limit 4)
-    recent_recordings = Recording.query.order_by(
-        Recording.recorded_date.desc()
-    ).limit(4).all()
-
-    # Get stats
-    total_sessions = Session.query.count()
-    total_recordings = Recording.query.count()
-
-    # Serialize data
-    sessions_data = [serialize_session(s) for s in upcoming_sessions]
-    recordings_data = [serialize_recording_with_session(r) for r in recent_recordings]
-
-    return jsonify({
-        'upcoming_sessions': sessions_data,
-        'recent_recordings': recordings_data,
-        'stats': {
-            'total_sessions': total_sessions,
-            'total_recordings': total_recordings
-        }
-    }), 200
+    return Response(home_snapshot.body(), mimetype='application/json')
 
 
 @bp.route('/sessions/upcoming', methods=['GET'])
+@response_cache.cached(SESSIONS, RECORDINGS, SPEAKERS, TAGS)
+@conditional(content_version)
 def list_upcoming_sessions():
     """
     List published upcoming sessions with optional filters and search.
@@ -107,72 +64,96 @@ def list_upcoming_sessions():
         type_tag_id: Filter by type tag
         level_tag_id: Filter by level tag
         search: Search in title, summary, abstract, speaker name, tag labels
+        sort_by: relevance orders a search by best match (page numbers only);
+            otherwise soonest first
+        fields: full (default), card, or comma-separated fields (e.g. title,speaker.name)
         page: Page number (default: 1)
         per_page: Items per page (default: 20)
+        cursor: Cursor from next_cursor (enables keyset pagination)
+        include_total: Count matching rows in cursor mode (true/false)
 
     Returns:
         200: Paginated list of upcoming sessions
+        304: Not modified since the ETag in If-None-Match
     """
-    from app.models import Session, Speaker, Tag
-
-    # Build base query for published upcoming sessions
-    query = Session.query.filter(
-        Session.status == 'published',
-        Session.date >= date.today()
-    )
-
-    # Apply tag filters
+    # Get filters from query parameters
+    filters = {}
     if request.args.get('organ_tag_id'):
-        query = query.filter(Session.organ_tag_id == request.args.get('organ_tag_id'))
+        filters['organ_tag_id'] = request.args.get('organ_tag_id')
     if request.args.get('type_tag_id'):
-        query = query.filter(Session.type_tag_id == request.args.get('type_tag_id'))
+        filters['type_tag_id'] = request.args.get('type_tag_id')
     if request.args.get('level_tag_id'):
-        query = query.filter(Session.level_tag_id == request.args.get('level_tag_id'))
-
-    # Apply search filter
-    search = request.args.get('search', '').strip()
-    if search:
-        search_pattern = f'%{search}%'
-        query = query.outerjoin(Speaker, Session.speaker_id == Speaker.id)
-        query = query.outerjoin(Tag, or_(
-            Session.organ_tag_id == Tag.id,
-            Session.type_tag_id == Tag.id,
-            Session.level_tag_id == Tag.id
-        ))
-        query = query.filter(or_(
-            Session.title.ilike(search_pattern),
-            Session.summary.ilike(search_pattern),
-            Session.abstract.ilike(search_pattern),
-            Speaker.name.ilike(search_pattern),
-            Tag.label.ilike(search_pattern)
-        )).distinct()
-
-    # Order by date ascending (soonest first)
-    query = query.order_by(Session.date, Session.time)
-
-    # Get pagination parameters
-    page = request.args.get('page', 1, type=int)
-    per_page = request.args.get('per_page', 20, type=int)
-
-    # Get total count before pagination
-    total = query.count()
-
-    # Paginate
-    sessions = query.offset((page - 1) * per_page).limit(per_page).all()
+        filters['level_tag_id'] = request.args.get('level_tag_id')
+    if request.args.get('search'):
+        filters['search'] = request.args.get('search')
+
+    fieldset = SESSION_FIELDSETS.from_request(request.args)
+
+    # Paginate, ordered by date ascending (soonest first) or, for searches, by
+    # relevance. The catalog is built from the session_listings read model;
+    # searches query the read model directly
+    sort_by = RELEVANCE if 'search' in filters and request.args.get('sort_by') == RELEVANCE else None
+    pagination = get_pagination_params()
+    page = catalog.upcoming_sessions(filters, pagination, fieldset.load_options)
+    if page is None:
+        page = session_listings.upcoming(filters, pagination, fieldset.load_options, sort_by)
+    sessions, total, next_cursor = page
 
     # Serialize
-    sessions_data = [serialize_session(s) for s in sessions]
+    sessions_data = [fieldset.serialize(s) for s in sessions]
 
     return jsonify({
         'items': sessions_data,
         'total': total,
-        'page': page,
-        'per_page': per_page,
-        'total_pages': (total + per_page - 1) // per_page if per_page > 0 else 0
+        'page': pagination['page'],
+        'per_page': pagination['per_page'],
+        'total_pages': total_pages(total, pagination['per_page']),
+        'next_cursor': next_cursor
     }), 200
 
 
+def facet_filters():
+    """Read the facet filters and search of the current request."""
+    filters = {}
+    if request.args.get('organ_tag_id'):
+        filters['organ_tag_id'] = request.args.get('organ_tag_id')
+    if request.args.get('type_tag_id'):
+        filters['type_tag_id'] = request.args.get('type_tag_id')
+    if request.args.get('level_tag_id'):
+        filters['level_tag_id'] = request.args.get('level_tag_id')
+    if request.args.get('year', type=int):
+        filters['year'] = request.args.get('year', type=int)
+    if request.args.get('search'):
+        filters['search'] = request.args.get('search')
+    return filters
+
+
+@bp.route('/sessions/upcoming/facets', methods=['GET'])
+@response_cache.cached(SESSIONS, SPEAKERS, TAGS)
+@conditional(content_version)
+def get_upcoming_session_facets():
+    """
+    Count upcoming sessions per tag and year under the current filters.
+
+    Each facet's counts apply every filter except its own.
+
+    Query Parameters:
+        organ_tag_id: Filter by organ tag
+        type_tag_id: Filter by type tag
+        level_tag_id: Filter by level tag
+        year: Filter by session year
+        search: Search in title, summary, abstract, speaker name, tag labels
+
+    Returns:
+        200: Total, counts per active organ/type/level tag, and counts per year
+        304: Not modified since the ETag in If-None-Match
+    """
+    return jsonify(FacetService.counts('sessions', facet_filters())), 200
+
+
 @bp.route('/sessions/<session_id>', methods=['GET'])
+@response_cache.cached(SESSIONS, RECORDINGS, SPEAKERS, TAGS)
+@conditional(content_version)
 def get_session_detail(session_id):
     """
     Get session detail.
@@ -182,6 +163,7 @@ def get_session_detail(session_id):
 
     Returns:
         200: Session detail
+        304: Not modified since the ETag in If-None-Match
         404: Session not found or not published
     """
     session = SessionService.get_session(session_id)
@@ -193,7 +175,14 @@ def get_session_detail(session_id):
     return jsonify(serialize_session(session)), 200
 
 
+def session_calendar_version():
+    """Fingerprint the ICS file of the requested session."""
+    return CalendarService.session_version(request.view_args['session_id'])
+
+
 @bp.route('/sessions/<session_id>/calendar', methods=['GET'])
+@response_cache.cached(SESSIONS, SPEAKERS, TAGS)
+@conditional(session_calendar_version)
 def download_calendar(session_id):
     """
     Download ICS calendar file for a session.
@@ -203,16 +192,10 @@ def download_calendar(session_id):
 
     Returns:
         200: ICS file download
+        304: Not modified since the ETag in If-None-Match
         404: Session not found or not published
     """
-    session = SessionService.get_session(session_id)
-
-    # Only allow access to published sessions
-    if session.status != 'published':
-        raise NotFoundError('Session not found or not available', 'SESSION_NOT_FOUND')
-
-    # Generate ICS content
-    ics_content = CalendarService.generate_ics(session)
+    ics_content = CalendarService.generate_ics(session_id)
 
     # Return as downloadable file
     filename = f"session-{session_id}.ics"
@@ -225,7 +208,40 @@ def download_calendar(session_id):
     )
 
 
+def calendar_feed_version():
+    """Fingerprint the entities the calendar feed is built from."""
+    return entity_version(SESSIONS, SPEAKERS, TAGS)
+
+
+@bp.route('/calendar.ics', methods=['GET'])
+@response_cache.cached(SESSIONS, SPEAKERS, TAGS)
+@conditional(calendar_feed_version)
+def calendar_feed():
+    """
+    Subscribable calendar feed of all upcoming published sessions.
+
+    Query Parameters:
+        organ_tag_id: Filter by organ tag
+        type_tag_id: Filter by type tag
+        level_tag_id: Filter by level tag
+
+    Returns:
+        200: ICS feed, streamed
+        304: Not modified since the ETag in If-None-Match
+    """
+    filters = CalendarService.feed_filters(request.args)
+    return Response(
+        stream_with_context(CalendarService.generate_feed(filters)),
+        mimetype='text/calendar',
+        headers={
+            'Content-Disposition': 'inline; filename=digipath-sessions.ics'
+        }
+    )
+
+
 @bp.route('/recordings', methods=['GET'])
+@response_cache.cached(RECORDINGS, SESSIONS, SPEAKERS, request_tags=recording_listing_tags)
+@conditional(recording_listing_version)
 def list_recordings():
     """
     List recordings with optional filters, search, and sorting.
@@ -236,79 +252,101 @@ def list_recordings():
         level_tag_id: Filter by level tag
         year: Filter by recording year
         search: Search in title, speaker name, tags
-        sort_by: Sort by (newest, oldest, most_viewed) - default: newest
+        sort_by: Sort by (newest, oldest, most_viewed, or relevance for searches,
+            page numbers only) - default: newest
+        fields: full (default), card, or comma-separated fields (e.g. views_count,session.title)
         page: Page number (default: 1)
         per_page: Items per page (default: 20)
+        cursor: Cursor from next_cursor (enables keyset pagination)
+        include_total: Count matching rows in cursor mode (true/false)
 
     Returns:
         200: Paginated list of recordings
+        304: Not modified since the ETag in If-None-Match
     """
-    from app.models import Recording, Session, Speaker, Tag
-
-    # Build query
-    query = Recording.query.join(Session)
-
-    # Apply tag filters
+    # Get filters from query parameters
+    filters = {}
     if request.args.get('organ_tag_id'):
-        query = query.filter(Session.organ_tag_id == request.args.get('organ_tag_id'))
+        filters['organ_tag_id'] = request.args.get('organ_tag_id')
     if request.args.get('type_tag_id'):
-        query = query.filter(Session.type_tag_id == request.args.get('type_tag_id'))
+        filters['type_tag_id'] = request.args.get('type_tag_id')
     if request.args.get('level_tag_id'):
-        query = query.filter(Session.level_tag_id == request.args.get('level_tag_id'))
-
-    # Apply year filter
-    year = request.args.get('year', type=int)
-    if year:
-        query = query.filter(extract('year', Recording.recorded_date) == year)
-
-    # Apply search filter
-    search = request.args.get('search', '').strip()
-    if search:
-        search_pattern = f'%{search}%'
-        query = query.outerjoin(Speaker, Session.speaker_id == Speaker.id)
-        query = query.outerjoin(Tag, or_(
-            Session.organ_tag_id == Tag.id,
-            Session.type_tag_id == Tag.id,
-            Session.level_tag_id == Tag.id
-        ))
-        query = query.filter(or_(
-            Session.title.ilike(search_pattern),
-            Session.summary.ilike(search_pattern),
-            Speaker.name.ilike(search_pattern),
-            Tag.label.ilike(search_pattern)
-        )).distinct()
-
-    # Apply sorting
-    sort_by = request.args.get('sort_by', 'newest')
-    if sort_by == 'oldest':
-        query = query.order_by(asc(Recording.recorded_date))
-    elif sort_by == 'most_viewed':
-        query = query.order_by(desc(Recording.views_count))
-    else:  # newest (default)
-        query = query.order_by(desc(Recording.recorded_date))
-
-    # Get pagination parameters
-    page = request.args.get('page', 1, type=int)
-    per_page = request.args.get('per_page', 20, type=int)
-
-    # Get total count
-    total = query.count()
-
-    # Paginate
-    recordings = query.offset((page - 1) * per_page).limit(per_page).all()
+        filters['level_tag_id'] = request.args.get('level_tag_id')
+    if request.args.get('year', type=int):
+        filters['year'] = request.args.get('year', type=int)
+    if request.args.get('search'):
+        filters['search'] = request.args.get('search')
+
+    # Apply sorting (newest by default, relevance only for searches) and paginate.
+    # The catalog is built from the session_listings read model; searches and
+    # most_viewed query it directly
+    sort_by = request.args.get('sort_by')
+    if sort_by == RELEVANCE and 'search' not in filters:
+        sort_by = 'newest'
+    if sort_by not in RECORDING_SORTS and sort_by != RELEVANCE:
+        sort_by = 'newest'
+    fieldset = RECORDING_FIELDSETS.from_request(request.args)
+    pagination = get_pagination_params()
+    page = catalog.recordings(filters, sort_by, pagination, fieldset.load_options)
+    if page is None:
+        page = session_listings.recordings(filters, sort_by, pagination, fieldset.load_options)
+    recordings, total, next_cursor = page
 
     # Serialize recordings
-    recordings_data = [serialize_recording_with_session(r) for r in recordings]
+    recordings_data = [fieldset.serialize(r) for r in recordings]
 
     return jsonify({
         'items': recordings_data,
         'total': total,
-        'page': page,
-        'per_page': per_page,
-        'total_pages': (total + per_page - 1) // per_page if per_page > 0 else 0
+        'page': pagination['page'],
+        'per_page': pagination['per_page'],
+        'total_pages': total_pages(total, pagination['per_page']),
+        'next_cursor': next_cursor
     }), 200
 
 
+@bp.route('/recordings/facets', methods=['GET'])
+@response_cache.cached(RECORDINGS, SESSIONS, SPEAKERS, TAGS)
+@conditional(content_version)
+def get_recording_facets():
+    """
+    Count recordings per tag and year under the current filters.
+
+    Each facet's counts apply every filter except its own.
+
+    Query Parameters:
+        organ_tag_id: Filter by organ tag
+        type_tag_id: Filter by type tag
+        level_tag_id: Filter by level tag
+        year: Filter by recording year
+        search: Search in title, speaker name, tags
+
+    Returns:
+        200: Total, counts per active organ/type/level tag, and counts per year
+        304: Not modified since the ETag in If-None-Match
+    """
+    return jsonify(FacetService.counts('recordings', facet_filters())), 200
+
+
+def recording_archive_version():
+    """Fingerprint the recordings the archive index counts."""
+    return entity_version(RECORDINGS)
+
+
+@bp.route('/recordings/years', methods=['GET'])
+@response_cache.cached(RECORDINGS)
+@conditional(recording_archive_version)
+def get_recording_years():
+    """
+    List the years and months that have recordings, with their counts.
+
+    Returns:
+        200: Years, newest first, each with its count and per-month counts
+        304: Not modified since the ETag in If-None-Match
+    """
+    return jsonify({'years': recording_archive.years()}), 200
+
+
 @bp.route('/recordings/<recording_id>', methods=['GET'])
 def get_recording_detail(recording_id):
     """
@@ -321,48 +359,55 @@ def get_recording_detail(recording_id):
         200: Recording detail with full session info
         404: Recording not found
     """
-    from app.models import Recording, Session
-    from app.extensions import db
-
-    # Try to find by recording ID first
-    recording = Recording.query.get(recording_id)
-
-    # If not found, try to find by session_id
+    # Try to find by recording ID first, then by session_id
+    query = SessionService.recording_listing_query()
+    recording = query.filter(Recording.id == recording_id).first()
     if not recording:
-        recording = Recording.query.filter_by(session_id=recording_id).first()
+        recording = query.filter(Recording.session_id == recording_id).first()
 
     if not recording:
         raise NotFoundError('Recording not found', 'RECORDING_NOT_FOUND')
 
-    # Increment view count
-    recording.views_count += 1
-    db.session.commit()
+    # Report views not yet flushed, this one included
+    recording_data = serialize_recording_with_session(recording)
+    recording_data['views_count'] += view_counter.pending(recording.id) + 1
+
+    # Count the view; it is written to the database in the next batch
+    view_counter.record(recording.id)
 
-    return jsonify(serialize_recording_with_session(recording)), 200
+    return jsonify(recording_data), 200
 
 
 @bp.route('/tags', methods=['GET'])
+@response_cache.cached(TAGS)
+@conditional(tag_registry.fingerprint)
 def get_tags():
     """
     Get active tags. Supports grouped response or single-category list.
 
+    Query Parameters:
+        category: Return a flat list of one category (organ, type, level)
+        fields: full (default), card, or comma-separated fields (e.g. id,label)
+
     Returns:
         200: Tags grouped by category (organ, type, level) by default
         200: Flat list when ?category=<organ|type|level> is provided
+        304: Not modified since the ETag in If-None-Match
     """
     category = request.args.get('category')
+    serialize = TAG_FIELDSETS.from_request(request.args).serialize
 
     # If category specified, return a flat list (needed by filter panels)
     if category:
         tags = TagService.list_tags(category=category, active_only=True)
-        return jsonify([tag_schema.dump(tag) for tag in tags]), 200
+        return jsonify([serialize(tag) for tag in tags]), 200
 
     # Default: grouped response
     tags_grouped = TagService.get_tags_grouped()
     response_data = {
-        'organ': [tag_schema.dump(tag) for tag in tags_grouped['organ']],
-        'type': [tag_schema.dump(tag) for tag in tags_grouped['type']],
-        'level': [tag_schema.dump(tag) for tag in tags_grouped['level']]
+        'organ': [serialize(tag) for tag in tags_grouped['organ']],
+        'type': [serialize(tag) for tag in tags_grouped['type']],
+        'level': [serialize(tag) for tag in tags_grouped['level']]
     }
 
     return jsonify(response_data), 200
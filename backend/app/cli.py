@@ -0,0 +1,214 @@
+"""Flask CLI commands for maintenance tasks."""
+import sys
+from datetime import date
+import click
+from flask.cli import AppGroup
+from sqlalchemy import text
+from app.extensions import db
+
+search_index_cli = AppGroup('search-index', help='Manage the full-text search index.')
+home_snapshot_cli = AppGroup('home-snapshot', help='Manage the precomputed home page document.')
+catalog_cli = AppGroup('catalog', help='Manage the in-memory index of published content.')
+recording_archive_cli = AppGroup('recording-archive', help='Manage the recording counts per month.')
+session_listings_cli = AppGroup('session-listings', help='Manage the read model of the public listings.')
+replicas_cli = AppGroup('replicas', help='Inspect the read replicas.')
+
+
+@search_index_cli.command('rebuild')
+def rebuild_search_index():
+    """Recreate the search index from the sessions table."""
+    from app.services.search_index import search_index
+
+    count = search_index.rebuild()
+    db.session.commit()
+    click.echo(f'Indexed {count} session(s).')
+
+
+@home_snapshot_cli.command('rebuild')
+def rebuild_home_snapshot():
+    """Rebuild the home page document in every worker."""
+    from app.services.home_snapshot import home_snapshot
+
+    size = home_snapshot.rebuild()
+    click.echo(f'Rebuilt home snapshot ({size} bytes).')
+
+
+@catalog_cli.command('rebuild')
+def rebuild_catalog():
+    """Rebuild the listing indexes in every worker."""
+    from app.services.catalog import catalog
+
+    sessions, recordings = catalog.rebuild()
+    click.echo(f'Indexed {sessions} published session(s) and {recordings} recording(s).')
+
+
+@catalog_cli.command('check')
+def check_catalog():
+    """Compare the listing indexes against the read model's queries."""
+    from app.services.catalog import catalog
+
+    mismatches = catalog.check()
+    for listing in mismatches:
+        click.echo(f'differs: {listing}')
+    if not mismatches:
+        click.echo('Indexes match the read model.')
+        return
+
+    click.echo(f'{len(mismatches)} listing(s) differ.', err=True)
+    sys.exit(1)
+
+
+@recording_archive_cli.command('rebuild')
+def rebuild_recording_archive():
+    """Recount the recording archive from the recordings table."""
+    from app.services.recording_archive import recording_archive
+
+    months = recording_archive.rebuild()
+    db.session.commit()
+    click.echo(f'Counted recordings in {months} month(s).')
+
+
+def rebuild_listings() -> int:
+    """Recreate the listing read model and expire the public ETags built on it."""
+    from app.models import CacheVersion
+    from app.services.response_cache import SESSIONS, RECORDINGS, SPEAKERS, TAGS
+    from app.services.session_listings import session_listings
+
+    count = session_listings.rebuild()
+    CacheVersion.bump(SESSIONS, RECORDINGS, SPEAKERS, TAGS)
+    db.session.commit()
+    return count
+
+
+@session_listings_cli.command('rebuild')
+def rebuild_session_listings():
+    """Recreate the listing read model from the source tables."""
+    click.echo(f'Copied {rebuild_listings()} session(s).')
+
+
+@session_listings_cli.command('check')
+@click.option('--fix', is_flag=True, help='Rebuild the read model if it has drifted.')
+def check_session_listings(fix):
+    """Compare the listing read model against the source tables."""
+    from app.services.session_listings import session_listings
+
+    drift = session_listings.check()
+    for kind, session_ids in drift.items():
+        for session_id in session_ids:
+            click.echo(f'{kind}: {session_id}')
+    total = sum(len(session_ids) for session_ids in drift.values())
+    if not total:
+        click.echo('Read model is consistent.')
+        return
+
+    click.echo(f'{total} session(s) out of date.', err=True)
+    if fix:
+        click.echo(f'Copied {rebuild_listings()} session(s).')
+    else:
+        sys.exit(1)
+
+
+@replicas_cli.command('status')
+def replicas_status():
+    """Check whether each read replica has caught up with the primary."""
+    from app.utils.replicas import replica_router
+
+    if not replica_router.enabled:
+        click.echo('No read replicas configured (REPLICA_DATABASE_URLS).')
+        return
+    for name, status in replica_router.status().items():
+        if status['healthy']:
+            state = 'healthy'
+        elif status['lagging'] is None:
+            state = 'unreachable'
+        else:
+            state = f"lagging ({', '.join(status['lagging'])})"
+        click.echo(f'{name}: {state}')
+
+
+def listing_queries():
+    """
+    Build the public listing queries as the endpoints issue them.
+
+    Returns:
+        List of (name, query) pairs, ordered and limited to one page
+    """
+    from app.services.session_service import SessionService, RECENT_SESSION_SORT
+    from app.services.session_listings import (
+        session_listings, UPCOMING_LISTING_SORT, RECORDING_LISTING_SORTS
+    )
+
+    def page(query, sort_keys):
+        return query.order_by(*[
+            column.desc() if descending else column.asc()
+            for column, descending in sort_keys
+        ]).limit(20)
+
+    tag_filter = {'organ_tag_id': 'tag-id'}
+    return [
+        ('upcoming sessions', page(session_listings.upcoming_query(), UPCOMING_LISTING_SORT)),
+        ('upcoming sessions by tag', page(session_listings.upcoming_query(tag_filter), UPCOMING_LISTING_SORT)),
+        ('past sessions', page(SessionService.past_query(), RECENT_SESSION_SORT)),
+        ('past sessions by tag', page(SessionService.past_query(tag_filter), RECENT_SESSION_SORT)),
+        ('recordings newest', page(session_listings.recordings_query(), RECORDING_LISTING_SORTS['newest'])),
+        ('recordings oldest', page(session_listings.recordings_query(), RECORDING_LISTING_SORTS['oldest'])),
+        ('recordings most viewed', page(
+            session_listings.recordings_query(), RECORDING_LISTING_SORTS['most_viewed']
+        )),
+        ('recordings by tag', page(
+            session_listings.recordings_query(tag_filter), RECORDING_LISTING_SORTS['newest']
+        )),
+        ('recordings by year', page(
+            session_listings.recordings_query({'year': date.today().year}), RECORDING_LISTING_SORTS['newest']
+        )),
+    ]
+
+
+# Tables a listing query must never read in full
+LISTING_TABLES = ('sessions', 'recordings', 'session_listings')
+
+
+def is_full_scan(dialect: str, line: str) -> bool:
+    """Return whether a plan line reads a whole listing table without an index."""
+    if dialect == 'sqlite':
+        return any(line.startswith(f'SCAN {table}') and 'USING' not in line
+                   for table in LISTING_TABLES)
+    return any(f'Seq Scan on {table}' in line for table in LISTING_TABLES)
+
+
+@click.command('explain-listings')
+@click.option('--fail-on-scan', is_flag=True,
+              help='Exit with status 1 if a listing query scans a whole table.')
+def explain_listings(fail_on_scan):
+    """Print the query plan of every public listing query."""
+    dialect = db.engine.dialect.name
+    prefix = 'EXPLAIN QUERY PLAN ' if dialect == 'sqlite' else 'EXPLAIN '
+    scans = []
+
+    for name, query in listing_queries():
+        sql = str(query.statement.compile(dialect=db.engine.dialect, compile_kwargs={'literal_binds': True}))
+        rows = db.session.execute(text(prefix + sql)).all()
+        # SQLite returns (id, parent, notused, detail); other databases one text column
+        lines = [row[-1] for row in rows]
+
+        click.echo(f'== {name}')
+        for line in lines:
+            click.echo(f'   {line}')
+            if is_full_scan(dialect, line):
+                scans.append(name)
+
+    if scans:
+        click.echo(f"Full table scans in: {', '.join(sorted(set(scans)))}", err=True)
+        if fail_on_scan:
+            sys.exit(1)
+
+
+def register_commands(app):
+    """Register CLI commands."""
+    app.cli.add_command(search_index_cli)
+    app.cli.add_command(home_snapshot_cli)
+    app.cli.add_command(catalog_cli)
+    app.cli.add_command(recording_archive_cli)
+    app.cli.add_command(session_listings_cli)
+    app.cli.add_command(replicas_cli)
+    app.cli.add_command(explain_listings)
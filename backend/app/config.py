@@ -2,6 +2,7 @@
 import os
 from datetime import timedelta
 from dotenv import load_dotenv
+from app.utils.replicas import replica_binds
 
 # Load environment variables from .env file
 load_dotenv()
@@ -23,18 +24,117 @@ class Config:
     )
     SQLALCHEMY_TRACK_MODIFICATIONS = False
 
+    # Read replicas - comma-separated URLs, bound as replica_0, replica_1, ...
+    # Public GET reads go to a healthy replica; everything else to the primary
+    SQLALCHEMY_BINDS = replica_binds(os.getenv('REPLICA_DATABASE_URLS', ''))
+    REPLICA_BLUEPRINTS = ('api_v1.public',)
+    REPLICA_STICKY_SECONDS = int(os.getenv('REPLICA_STICKY_SECONDS', 5))
+    REPLICA_CHECK_INTERVAL = int(os.getenv('REPLICA_CHECK_INTERVAL', 5))
+    REPLICA_WRITE_MARKER = os.getenv(
+        'REPLICA_WRITE_MARKER',
+        os.path.join(BASE_DIR, '.replica_write_marker')
+    )
+
+    # Database tuning - SQLite pragmas set on every connection
+    SQLITE_JOURNAL_MODE = os.getenv('SQLITE_JOURNAL_MODE', 'WAL')
+    SQLITE_SYNCHRONOUS = os.getenv('SQLITE_SYNCHRONOUS', 'NORMAL')
+    SQLITE_BUSY_TIMEOUT_MS = int(os.getenv('SQLITE_BUSY_TIMEOUT_MS', 5000))
+    SQLITE_MMAP_SIZE = int(os.getenv('SQLITE_MMAP_SIZE', 256 * 1024 * 1024))
+    # Negative values are KiB, positive values pages
+    SQLITE_CACHE_SIZE = int(os.getenv('SQLITE_CACHE_SIZE', -64000))
+
+    # Database tuning - connection pool for server databases, and a PostgreSQL
+    # statement timeout (0 disables)
+    DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', 5))
+    DB_MAX_OVERFLOW = int(os.getenv('DB_MAX_OVERFLOW', 10))
+    DB_POOL_TIMEOUT = int(os.getenv('DB_POOL_TIMEOUT', 30))
+    DB_POOL_RECYCLE = int(os.getenv('DB_POOL_RECYCLE', 1800))
+    DB_POOL_PRE_PING = os.getenv('DB_POOL_PRE_PING', 'true').lower() == 'true'
+    DB_STATEMENT_TIMEOUT_MS = int(os.getenv('DB_STATEMENT_TIMEOUT_MS', 30000))
+
     # JWT
     JWT_SECRET_KEY = os.getenv('JWT_SECRET_KEY', 'jwt-secret-key-change-in-production')
     JWT_ACCESS_TOKEN_EXPIRES = timedelta(seconds=int(os.getenv('JWT_ACCESS_TOKEN_EXPIRES', 3600)))
     JWT_ALGORITHM = 'HS256'
 
+    # Password hashing - bcrypt cost for new hashes (older hashes are upgraded at
+    # login), and the per-worker process pool bcrypt runs on (0 runs it inline)
+    BCRYPT_ROUNDS = int(os.getenv('BCRYPT_ROUNDS', 12))
+    PASSWORD_POOL_WORKERS = int(os.getenv('PASSWORD_POOL_WORKERS', 2))
+    PASSWORD_POOL_QUEUE_LIMIT = int(os.getenv('PASSWORD_POOL_QUEUE_LIMIT', 8))
+
+    # Reverse proxies in front of the app whose X-Forwarded-For/-Proto headers are
+    # trusted for the client address (0: clients connect directly). gunicorn.conf.py
+    # defaults it to 1 for the nginx deployment
+    TRUSTED_PROXY_HOPS = int(os.getenv('TRUSTED_PROXY_HOPS', 0))
+
+    # Login throttling - failed attempts allowed per email and per client IP within
+    # a sliding window; backend is memory (per worker), sqlite (shared) or none.
+    # gunicorn.conf.py defaults it to sqlite so limits hold across workers
+    LOGIN_THROTTLE_BACKEND = os.getenv('LOGIN_THROTTLE_BACKEND', 'memory')
+    LOGIN_THROTTLE_WINDOW = int(os.getenv('LOGIN_THROTTLE_WINDOW', 900))
+    LOGIN_MAX_FAILURES_PER_EMAIL = int(os.getenv('LOGIN_MAX_FAILURES_PER_EMAIL', 5))
+    LOGIN_MAX_FAILURES_PER_IP = int(os.getenv('LOGIN_MAX_FAILURES_PER_IP', 20))
+    LOGIN_THROTTLE_PATH = os.getenv(
+        'LOGIN_THROTTLE_PATH',
+        os.path.join(BASE_DIR, 'login_throttle.db')
+    )
+
+    # Admin identity cache - seconds an admin user snapshot is reused (0 disables)
+    ADMIN_IDENTITY_TTL = int(os.getenv('ADMIN_IDENTITY_TTL', 30))
+
     # CORS
     CORS_ORIGINS = os.getenv('CORS_ORIGINS', 'http://localhost:3000').split(',')
 
+    # Response JSON encoder - default (stdlib json) or orjson (needs the orjson package)
+    JSON_ENCODER = os.getenv('JSON_ENCODER', 'default')
+
+    # SQL instrumentation - Server-Timing headers, per-request log lines (at INFO)
+    # and a slow-query log with query plans
+    SQL_INSTRUMENTATION = os.getenv('SQL_INSTRUMENTATION', 'true').lower() == 'true'
+    SQL_LOG_LEVEL = os.getenv('SQL_LOG_LEVEL', 'WARNING')
+    SQL_SLOW_QUERY_MS = int(os.getenv('SQL_SLOW_QUERY_MS', 200))
+    SQL_EXPLAIN_SLOW_QUERIES = os.getenv('SQL_EXPLAIN_SLOW_QUERIES', 'true').lower() == 'true'
+    # Log bound parameter values of slow statements (only their types otherwise)
+    SQL_LOG_PARAMETERS = os.getenv('SQL_LOG_PARAMETERS', 'false').lower() == 'true'
+
+    # Prometheus metrics at /metrics - set PROMETHEUS_MULTIPROC_DIR to aggregate
+    # across gunicorn workers (gunicorn.conf.py does this)
+    METRICS_ENABLED = os.getenv('METRICS_ENABLED', 'true').lower() == 'true'
+    # Bearer token scrapers must send; /metrics is not mounted without one
+    METRICS_TOKEN = os.getenv('METRICS_TOKEN', '')
+
     # Pagination
     DEFAULT_PAGE_SIZE = 20
     MAX_PAGE_SIZE = 100
 
+    # Tag registry - seconds between staleness checks against cache_versions
+    TAG_REGISTRY_CHECK_INTERVAL = int(os.getenv('TAG_REGISTRY_CHECK_INTERVAL', 5))
+
+    # Recording views - seconds between batched flushes (0 writes every view through)
+    VIEW_COUNTER_FLUSH_INTERVAL = int(os.getenv('VIEW_COUNTER_FLUSH_INTERVAL', 10))
+
+    # Home snapshot - seconds between staleness checks, and maximum age before a rebuild
+    HOME_SNAPSHOT_CHECK_INTERVAL = int(os.getenv('HOME_SNAPSHOT_CHECK_INTERVAL', 5))
+    HOME_SNAPSHOT_MAX_AGE = int(os.getenv('HOME_SNAPSHOT_MAX_AGE', 300))
+
+    # In-memory listing indexes - seconds between staleness checks against cache_versions
+    CATALOG_ENABLED = os.getenv('CATALOG_ENABLED', 'true').lower() == 'true'
+    CATALOG_CHECK_INTERVAL = int(os.getenv('CATALOG_CHECK_INTERVAL', 5))
+
+    # Rendered single-session ICS files kept per worker
+    ICS_CACHE_MAX_ENTRIES = int(os.getenv('ICS_CACHE_MAX_ENTRIES', 1024))
+
+    # Public response cache - backend is memory (per worker), sqlite (shared) or none.
+    # gunicorn.conf.py defaults it to sqlite: memory purges only reach one worker
+    RESPONSE_CACHE_BACKEND = os.getenv('RESPONSE_CACHE_BACKEND', 'memory')
+    RESPONSE_CACHE_TTL = int(os.getenv('RESPONSE_CACHE_TTL', 60))
+    RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv('RESPONSE_CACHE_MAX_ENTRIES', 1024))
+    RESPONSE_CACHE_PATH = os.getenv(
+        'RESPONSE_CACHE_PATH',
+        os.path.join(BASE_DIR, 'response_cache.db')
+    )
+
 
 class DevelopmentConfig(Config):
     """Development configuration."""
@@ -55,8 +155,13 @@ class TestingConfig(Config):
 
     DEBUG = True
     TESTING = True
-    SQLALCHEMY_DATABASE_URI = f'sqlite:///{os.path.join(BASE_DIR, "digipath_test.db")}'
+    SQLALCHEMY_DATABASE_URI = os.getenv(
+        'TEST_DATABASE_URL',
+        f'sqlite:///{os.path.join(BASE_DIR, "digipath_test.db")}'
+    )
     JWT_ACCESS_TOKEN_EXPIRES = timedelta(seconds=60)
+    VIEW_COUNTER_FLUSH_INTERVAL = 0
+    PASSWORD_POOL_WORKERS = 0
 
 
 # Configuration dictionary
@@ -5,6 +5,9 @@ from app.models.speaker import Speaker
 from app.models.tag import Tag
 from app.models.session import Session
 from app.models.recording import Recording
+from app.models.cache_version import CacheVersion
+from app.models.recording_archive import RecordingArchive
+from app.models.session_listing import SessionListing
 
 __all__ = [
     'BaseModel',
@@ -13,4 +16,7 @@ __all__ = [
     'Tag',
     'Session',
     'Recording',
+    'CacheVersion',
+    'RecordingArchive',
+    'SessionListing',
 ]
@@ -1,7 +1,8 @@
 """AdminUser model for authentication and authorization."""
-import bcrypt
+from flask import current_app
 from app.extensions import db
 from app.models.base import BaseModel
+from app.utils.passwords import check_password, hash_password, hash_rounds
 
 
 class AdminUser(BaseModel):
@@ -22,18 +23,16 @@ class AdminUser(BaseModel):
     sessions = db.relationship('Session', back_populates='created_by_user', lazy='dynamic')
 
     def set_password(self, password):
-        """Hash and set the password."""
-        self.password_hash = bcrypt.hashpw(
-            password.encode('utf-8'),
-            bcrypt.gensalt()
-        ).decode('utf-8')
+        """Hash and set the password with the configured bcrypt cost."""
+        self.password_hash = hash_password(password, current_app.config['BCRYPT_ROUNDS'])
 
     def check_password(self, password):
         """Check if the provided password matches the hash."""
-        return bcrypt.checkpw(
-            password.encode('utf-8'),
-            self.password_hash.encode('utf-8')
-        )
+        return check_password(password, self.password_hash)
+
+    def needs_rehash(self):
+        """Check if the hash was made with a different bcrypt cost than configured."""
+        return hash_rounds(self.password_hash) != current_app.config['BCRYPT_ROUNDS']
 
     def to_dict(self):
         """Convert model to dictionary."""
@@ -0,0 +1,65 @@
+"""CacheVersion model for cross-process cache invalidation."""
+from datetime import datetime
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
+from app.extensions import db
+
+# INSERT ... ON CONFLICT DO UPDATE constructs per dialect
+_UPSERT = {
+    'sqlite': sqlite.insert,
+    'postgresql': postgresql.insert,
+}
+
+
+class CacheVersion(db.Model):
+    """
+    Monotonic version counter for a named cache.
+
+    Process-local caches remember the version they were built from and compare
+    it against this row to detect writes made by other worker processes.
+    Conditional GETs derive their validators from the rows of the entity types
+    a response is built from (see app.utils.conditional.entity_version).
+    """
+
+    __tablename__ = 'cache_versions'
+
+    name = db.Column(db.String(50), primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, nullable=True)
+
+    @classmethod
+    def current(cls, name):
+        """Return the current version for a cache (0 if never bumped)."""
+        version = db.session.execute(
+            select(cls.version).where(cls.name == name)
+        ).scalar()
+        return version or 0
+
+    @classmethod
+    def bump(cls, *names):
+        """
+        Increment the versions of one or more caches within the current transaction.
+
+        A single upsert creates missing rows, so two transactions bumping a
+        new name at once both succeed instead of colliding on the primary key.
+        The caller is responsible for committing.
+        """
+        names = list(dict.fromkeys(names))
+        if not names:
+            return
+
+        dialect = db.engine.dialect.name
+        if dialect not in _UPSERT:
+            raise RuntimeError(f"Cache versions are not supported on '{dialect}'")
+
+        now = datetime.utcnow()
+        statement = _UPSERT[dialect](cls).values(
+            [{'name': name, 'version': 1, 'updated_at': now} for name in names]
+        )
+        db.session.execute(statement.on_conflict_do_update(
+            index_elements=[cls.name],
+            set_={'version': cls.version + 1, 'updated_at': statement.excluded.updated_at},
+        ))
+
+    def __repr__(self):
+        return f'<CacheVersion {self.name}={self.version}>'
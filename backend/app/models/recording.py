@@ -15,6 +15,12 @@ class Recording(BaseModel):
     recorded_date = db.Column(db.Date, nullable=False)
     views_count = db.Column(db.Integer, nullable=False, default=0)
 
+    # Indexes matching the listing sort orders
+    __table_args__ = (
+        db.Index('ix_recordings_recorded_date', 'recorded_date', 'id'),
+        db.Index('ix_recordings_views_count', 'views_count', 'id'),
+    )
+
     # Relationships
     session = db.relationship('Session', back_populates='recording')
 
@@ -0,0 +1,20 @@
+"""RecordingArchive model: recording counts per month."""
+from app.extensions import db
+
+
+class RecordingArchive(db.Model):
+    """
+    Number of recordings recorded in one month.
+
+    A rollup of ``recordings.recorded_date`` kept up to date by the recording
+    service, so the archive index never has to scan the recordings table.
+    """
+
+    __tablename__ = 'recording_archive'
+
+    year = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    month = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    count = db.Column(db.Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f'<RecordingArchive {self.year}-{self.month:02d}={self.count}>'
@@ -32,6 +32,16 @@ class Session(BaseModel):
     level_tag_id = db.Column(db.String(36), db.ForeignKey('tags.id'), nullable=False)
     created_by = db.Column(db.String(36), db.ForeignKey('admin_users.id'), nullable=False)
 
+    # Indexes matching the listing filters and sort orders
+    __table_args__ = (
+        db.Index('ix_sessions_status_date_time', 'status', 'date', 'time', 'id'),
+        db.Index('ix_sessions_date_time', 'date', 'time', 'id'),
+        db.Index('ix_sessions_organ_tag_date', 'organ_tag_id', 'date'),
+        db.Index('ix_sessions_type_tag_date', 'type_tag_id', 'date'),
+        db.Index('ix_sessions_level_tag_date', 'level_tag_id', 'date'),
+        db.Index('ix_sessions_speaker_id', 'speaker_id'),
+    )
+
     # Relationships
     speaker = db.relationship('Speaker', back_populates='sessions')
     organ_tag = db.relationship('Tag', foreign_keys=[organ_tag_id], back_populates='sessions_as_organ')
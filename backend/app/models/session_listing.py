@@ -0,0 +1,49 @@
+"""SessionListing model: the denormalized read model of the public listings."""
+from app.extensions import db
+
+
+class SessionListing(db.Model):
+    """
+    One row per session with the columns its listings filter and sort on.
+
+    Speaker and tag labels and the session's recording are copied in, so
+    listings filter, sort and count on this table alone. Rows are written by
+    the services in the same transaction as the change they mirror; see
+    ``app.services.session_listings``.
+    """
+
+    __tablename__ = 'session_listings'
+
+    session_id = db.Column(db.String(36), primary_key=True)
+    status = db.Column(db.String(20), nullable=False)
+    date = db.Column(db.Date, nullable=False)
+    time = db.Column(db.Time, nullable=False)
+
+    speaker_id = db.Column(db.String(36), nullable=False)
+    speaker_name = db.Column(db.String(200), nullable=False)
+    speaker_designation = db.Column(db.String(300), nullable=False)
+
+    organ_tag_id = db.Column(db.String(36), nullable=False)
+    organ_tag_label = db.Column(db.String(100), nullable=False)
+    type_tag_id = db.Column(db.String(36), nullable=False)
+    type_tag_label = db.Column(db.String(100), nullable=False)
+    level_tag_id = db.Column(db.String(36), nullable=False)
+    level_tag_label = db.Column(db.String(100), nullable=False)
+
+    # Set only for sessions with a recording
+    recording_id = db.Column(db.String(36), nullable=True, unique=True)
+    recorded_date = db.Column(db.Date, nullable=True)
+    views_count = db.Column(db.Integer, nullable=True)
+
+    # Indexes matching the public listing filters and sort orders
+    __table_args__ = (
+        db.Index('ix_session_listings_status_date_time', 'status', 'date', 'time', 'session_id'),
+        db.Index('ix_session_listings_recorded_date', 'recorded_date', 'recording_id'),
+        db.Index('ix_session_listings_views_count', 'views_count', 'recording_id'),
+        db.Index('ix_session_listings_organ_tag', 'organ_tag_id', 'date'),
+        db.Index('ix_session_listings_type_tag', 'type_tag_id', 'date'),
+        db.Index('ix_session_listings_level_tag', 'level_tag_id', 'date'),
+    )
+
+    def __repr__(self):
+        return f'<SessionListing {self.session_id}>'
@@ -29,6 +29,13 @@ class RecordingUpdateSchema(Schema):
     recorded_date = fields.Date(required=False)
 
 
+class SpeakerNestedSchema(Schema):
+    """Nested schema for speaker in session."""
+    id = fields.Str(required=True)
+    name = fields.Str(required=True)
+    designation = fields.Str(required=True)
+
+
 class SessionNestedSchema(Schema):
     """Nested schema for session in recording response."""
     id = fields.Str(required=True)
@@ -38,14 +45,7 @@ class SessionNestedSchema(Schema):
     time = fields.Time(required=True)
     duration_minutes = fields.Int(required=True)
     status = fields.Str(required=True)
-    speaker = fields.Nested('SpeakerNestedSchema', required=False, allow_none=True)
-
-
-class SpeakerNestedSchema(Schema):
-    """Nested schema for speaker in session."""
-    id = fields.Str(required=True)
-    name = fields.Str(required=True)
-    designation = fields.Str(required=True)
+    speaker = fields.Nested(SpeakerNestedSchema, required=False, allow_none=True)
 
 
 class RecordingResponseSchema(Schema):
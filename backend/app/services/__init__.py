@@ -4,6 +4,7 @@ from app.services.recording_service import RecordingService
 from app.services.calendar_service import CalendarService
 from app.services.speaker_service import SpeakerService
 from app.services.tag_service import TagService
+from app.services.export_service import ExportService
 
 __all__ = [
     'SessionService',
@@ -11,4 +12,5 @@ __all__ = [
     'CalendarService',
     'SpeakerService',
     'TagService',
+    'ExportService',
 ]
@@ -0,0 +1,167 @@
+"""Process-local cache of authenticated admin users.
+
+Access tokens carry the user's role as a claim. Every protected request still
+needs the user behind the token, so each worker keeps immutable snapshots of
+admin users for ``ADMIN_IDENTITY_TTL`` seconds instead of loading the row on
+every call. A burst of parallel dashboard requests therefore costs a single
+lookup. Updates and deletes made through this process drop the snapshot
+immediately; changes made by other processes are picked up when it expires.
+
+Tokens are rejected when their user no longer exists or their role claim no
+longer matches the user's role, so a role change forces a new login.
+"""
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+from flask import jsonify
+from sqlalchemy import event
+from app.extensions import db, jwt
+from app.models import AdminUser
+from app.utils.errors import AuthError
+from app.utils.metrics import record_api_error, record_cache_lookup
+
+CACHE_NAME = 'admins'
+# Expired entries are swept once the cache grows past this size
+SWEEP_THRESHOLD = 1024
+
+
+@dataclass(frozen=True)
+class AdminSnapshot:
+    """Immutable copy of an admin user row, without the password hash."""
+
+    id: str
+    name: str
+    email: str
+    role: str
+    created_at: datetime
+    updated_at: datetime
+
+    @classmethod
+    def from_model(cls, user: AdminUser) -> 'AdminSnapshot':
+        """Create a snapshot from an AdminUser model instance."""
+        return cls(
+            id=user.id,
+            name=user.name,
+            email=user.email,
+            role=user.role,
+            created_at=user.created_at,
+            updated_at=user.updated_at,
+        )
+
+
+class AdminIdentityCache:
+    """TTL cache of admin user snapshots, wired into Flask-JWT-Extended."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # user id -> (expiry on the monotonic clock, snapshot or None if missing)
+        self._entries: Dict[str, Tuple[float, Optional[AdminSnapshot]]] = {}
+        self._ttl = 0
+        self._listening = False
+
+    def init_app(self, app):
+        """
+        Register the JWT claim and user loaders and the invalidation hooks.
+
+        Args:
+            app: Flask application instance
+        """
+        self._ttl = app.config['ADMIN_IDENTITY_TTL']
+        jwt.additional_claims_loader(self._claims)
+        jwt.user_lookup_loader(self._lookup)
+        jwt.user_lookup_error_loader(self._lookup_error)
+
+        if not self._listening:
+            event.listen(AdminUser, 'after_update', self._changed)
+            event.listen(AdminUser, 'after_delete', self._changed)
+            self._listening = True
+
+    def get(self, user_id: str) -> Optional[AdminSnapshot]:
+        """
+        Get an admin user snapshot by ID.
+
+        Args:
+            user_id: ID of the admin user
+
+        Returns:
+            AdminSnapshot, or None if no such user exists
+        """
+        entry = self._entries.get(user_id)
+        if entry is not None and entry[0] > time.monotonic():
+            record_cache_lookup(CACHE_NAME, True)
+            return entry[1]
+
+        with self._lock:
+            # Another thread may have loaded the user while we waited for the lock
+            entry = self._entries.get(user_id)
+            if entry is not None and entry[0] > time.monotonic():
+                record_cache_lookup(CACHE_NAME, True)
+                return entry[1]
+
+            record_cache_lookup(CACHE_NAME, False)
+            user = db.session.get(AdminUser, user_id)
+            return self._store(user_id, AdminSnapshot.from_model(user) if user else None)
+
+    def remember(self, user: AdminUser) -> AdminSnapshot:
+        """
+        Cache a user that has just been loaded, e.g. to check its password.
+
+        Args:
+            user: AdminUser model instance
+
+        Returns:
+            The cached snapshot
+        """
+        with self._lock:
+            return self._store(user.id, AdminSnapshot.from_model(user))
+
+    def invalidate(self, user_id: str = None):
+        """
+        Drop one cached user, or all of them.
+
+        Args:
+            user_id: ID of the admin user (None drops every entry)
+        """
+        with self._lock:
+            if user_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(user_id, None)
+
+    def _store(self, user_id: str, snapshot: Optional[AdminSnapshot]) -> Optional[AdminSnapshot]:
+        """Store a snapshot; the caller holds the lock."""
+        if self._ttl <= 0:
+            return snapshot
+        now = time.monotonic()
+        if len(self._entries) >= SWEEP_THRESHOLD:
+            self._entries = {key: value for key, value in self._entries.items() if value[0] > now}
+        self._entries[user_id] = (now + self._ttl, snapshot)
+        return snapshot
+
+    # SQLAlchemy events
+
+    def _changed(self, mapper, connection, target):
+        self.invalidate(target.id)
+
+    # Flask-JWT-Extended callbacks
+
+    def _claims(self, identity) -> dict:
+        snapshot = self.get(identity)
+        return {'role': snapshot.role} if snapshot else {}
+
+    def _lookup(self, jwt_header, jwt_data) -> Optional[AdminSnapshot]:
+        snapshot = self.get(jwt_data['sub'])
+        if snapshot is None or jwt_data.get('role') != snapshot.role:
+            return None
+        return snapshot
+
+    @staticmethod
+    def _lookup_error(jwt_header, jwt_data):
+        error = AuthError('User no longer exists or its role has changed', 'INVALID_USER')
+        record_api_error(error.code, error.status_code)
+        return jsonify(error.to_dict()), error.status_code
+
+
+admin_identity = AdminIdentityCache()
@@ -1,81 +1,332 @@
-"""Calendar service for generating ICS files."""
-from datetime import datetime, timedelta
-from typing import Optional
-from app.models import Session
+"""Calendar service for generating ICS files.
+
+Single-session ICS files are rendered once per version and kept in a
+per-process LRU (``ics_cache``). The version is the latest ``updated_at`` of
+the session and its speaker plus the tag registry version, so an edit made
+in any worker produces a new key and the old file is never served again.
+``SessionService`` also drops a session's entry when it changes it, which
+frees the memory in the worker that made the write.
+"""
+import threading
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterator, Optional, Tuple
+from flask import current_app
+from sqlalchemy import select
+from app.extensions import db
+from app.models import Session, Speaker
+from app.services.tag_registry import tag_registry
+from app.utils.errors import NotFoundError
+from app.utils.metrics import record_cache_lookup
+
+PRODID = '-//AIIMS Telepathology//Teaching Session//EN'
+UID_DOMAIN = 'aiims-telepathology.edu'
+FEED_NAME = 'AIIMS Telepathology Teaching Sessions'
+# How often subscribed calendar clients should poll the feed
+FEED_REFRESH_INTERVAL = 'PT6H'
+# Sessions fetched per round trip while streaming the feed
+FEED_BATCH_SIZE = 500
+
+# Columns an event is rendered from, fetched in one query joined to the speaker
+EVENT_COLUMNS = (
+    Session.id, Session.title, Session.summary, Session.abstract, Session.objectives,
+    Session.date, Session.time, Session.duration_minutes, Session.platform,
+    Session.meeting_link, Session.meeting_id, Session.meeting_password,
+    Session.organ_tag_id, Session.type_tag_id, Session.level_tag_id,
+    Session.created_at, Session.updated_at,
+    Speaker.name.label('speaker_name'),
+    Speaker.designation.label('speaker_designation'),
+    Speaker.updated_at.label('speaker_updated_at'),
+)
+FEED_FILTERS = ('organ_tag_id', 'type_tag_id', 'level_tag_id')
+
+
+def escape_text(value) -> str:
+    """Escape a TEXT property value (RFC 5545 section 3.3.11)."""
+    return (
+        str(value)
+        .replace('\\', '\\\\')
+        .replace(';', '\\;')
+        .replace(',', '\\,')
+        .replace('\r\n', '\\n')
+        .replace('\n', '\\n')
+    )
+
+
+def fold_line(line: str) -> str:
+    """
+    Fold a content line into chunks of at most 75 octets (RFC 5545 section 3.1).
+
+    Continuation lines start with a space, and multi-byte UTF-8 characters
+    are never split.
+    """
+    if len(line.encode('utf-8')) <= 75:
+        return line
+    parts = []
+    current = ''
+    size = 0
+    for char in line:
+        char_size = len(char.encode('utf-8'))
+        if size + char_size > 75:
+            parts.append(current)
+            # Continuation lines carry a leading space
+            current = ' '
+            size = 1
+        current += char
+        size += char_size
+    parts.append(current)
+    return '\r\n'.join(parts)
+
+
+def format_utc(value: datetime) -> str:
+    """Format a naive UTC datetime as an ICS UTC DATE-TIME."""
+    return value.strftime('%Y%m%dT%H%M%SZ')
+
+
+class IcsCache:
+    """Per-process LRU of rendered ICS files, one entry per session."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # session id -> (version, content), least recently used first
+        self._entries = OrderedDict()
+
+    def get(self, session_id: str, version: str) -> Optional[bytes]:
+        """
+        Get a session's rendered file if it was rendered at this version.
+
+        Args:
+            session_id: ID of the session
+            version: Current version from ``CalendarService.session_version``
+
+        Returns:
+            Encoded ICS content, or None
+        """
+        with self._lock:
+            entry = self._entries.get(session_id)
+            hit = entry is not None and entry[0] == version
+            if hit:
+                self._entries.move_to_end(session_id)
+        record_cache_lookup('ics', hit)
+        return entry[1] if hit else None
+
+    def set(self, session_id: str, version: str, content: bytes):
+        """Store a session's rendered file, replacing any older version."""
+        max_entries = current_app.config['ICS_CACHE_MAX_ENTRIES']
+        with self._lock:
+            self._entries[session_id] = (version, content)
+            self._entries.move_to_end(session_id)
+            while len(self._entries) > max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, session_id: str):
+        """Drop a session's rendered file."""
+        with self._lock:
+            self._entries.pop(session_id, None)
+
+    def clear(self):
+        """Drop every rendered file."""
+        with self._lock:
+            self._entries.clear()
+
+
+ics_cache = IcsCache()
 
 
 class CalendarService:
     """Service class for calendar-related operations."""
 
     @staticmethod
-    def generate_ics(session: Session) -> str:
+    def session_version(session_id: str) -> Tuple[str, datetime]:
         """
-        Generate ICS (iCalendar) file content for a session.
+        Get the version of a published session's ICS file without loading it.
+
+        The file changes when the session, its speaker or a tag label
+        changes, so the version combines the latest ``updated_at`` of the
+        session and its speaker with the tag registry version.
 
         Args:
-            session: Session object
+            session_id: ID of the session
 
         Returns:
-            ICS file content as string
+            Tuple of (version string, last modified datetime)
+
+        Raises:
+            NotFoundError: If the session does not exist or is not published
+        """
+        row = db.session.execute(
+            select(Session.status, Session.updated_at, Speaker.updated_at.label('speaker_updated_at'))
+            .join(Speaker, Session.speaker_id == Speaker.id)
+            .where(Session.id == session_id)
+        ).first()
+        # Only allow access to published sessions
+        if row is None or row.status != 'published':
+            raise NotFoundError('Session not found or not available', 'SESSION_NOT_FOUND')
+        modified = max(row.updated_at, row.speaker_updated_at)
+        return f'{modified.isoformat()}|{tag_registry.fingerprint()[0]}', modified
+
+    @staticmethod
+    def generate_ics(session_id: str) -> bytes:
         """
-        # Combine date and time to create datetime
-        start_datetime = datetime.combine(session.date, session.time)
-        end_datetime = start_datetime + timedelta(minutes=session.duration_minutes)
-
-        # Format datetime for ICS (YYYYMMDDTHHmmss)
-        dtstart = start_datetime.strftime('%Y%m%dT%H%M%S')
-        dtend = end_datetime.strftime('%Y%m%dT%H%M%S')
-        dtstamp = datetime.utcnow().strftime('%Y%m%dT%H%M%SZ')
-
-        # Create description
-        description = f"{session.summary}\\n\\n"
-        description += f"Abstract: {session.abstract}\\n\\n"
-
-        if session.objectives:
-            description += "Objectives:\\n"
-            for obj in session.objectives:
-                description += f"- {obj}\\n"
-            description += "\\n"
-
-        description += f"Speaker: {session.speaker.name}\\n"
-        description += f"Designation: {session.speaker.designation}\\n\\n"
-
-        if session.meeting_link:
-            description += f"Meeting Link: {session.meeting_link}\\n"
-        if session.meeting_id:
-            description += f"Meeting ID: {session.meeting_id}\\n"
-        if session.meeting_password:
-            description += f"Password: {session.meeting_password}\\n"
-
-        # Create location
-        location = session.platform
-        if session.meeting_link:
-            location += f" - {session.meeting_link}"
-
-        # Build ICS content
-        ics_content = [
-            "BEGIN:VCALENDAR",
-            "VERSION:2.0",
-            "PRODID:-//AIIMS Telepathology//Teaching Session//EN",
-            "CALSCALE:GREGORIAN",
-            "METHOD:PUBLISH",
-            "BEGIN:VEVENT",
-            f"UID:{session.id}@aiims-telepathology.edu",
-            f"DTSTAMP:{dtstamp}",
-            f"DTSTART:{dtstart}",
-            f"DTEND:{dtend}",
-            f"SUMMARY:{session.title}",
-            f"DESCRIPTION:{description}",
-            f"LOCATION:{location}",
-            "STATUS:CONFIRMED",
-            "SEQUENCE:0",
-            "BEGIN:VALARM",
-            "TRIGGER:-PT15M",
-            "ACTION:DISPLAY",
-            "DESCRIPTION:Reminder: Session starts in 15 minutes",
-            "END:VALARM",
-            "END:VEVENT",
-            "END:VCALENDAR"
+        Get the ICS (iCalendar) file of a published session.
+
+        Rendered files are kept in ``ics_cache`` per session and version, so
+        repeated downloads cost one primary-key lookup and no rendering.
+
+        Args:
+            session_id: ID of the session
+
+        Returns:
+            Encoded ICS file content
+
+        Raises:
+            NotFoundError: If the session does not exist or is not published
+        """
+        version, _ = CalendarService.session_version(session_id)
+        content = ics_cache.get(session_id, version)
+        if content is not None:
+            return content
+
+        row = db.session.execute(
+            select(*EVENT_COLUMNS)
+            .join(Speaker, Session.speaker_id == Speaker.id)
+            .where(Session.id == session_id)
+        ).one()
+        lines = [
+            'BEGIN:VCALENDAR',
+            'VERSION:2.0',
+            f'PRODID:{PRODID}',
+            'CALSCALE:GREGORIAN',
+            'METHOD:PUBLISH',
         ]
+        content = (
+            ''.join(f'{line}\r\n' for line in lines)
+            + CalendarService._event(row)
+            + 'END:VCALENDAR\r\n'
+        ).encode('utf-8')
+        ics_cache.set(session_id, version, content)
+        return content
+
+    @staticmethod
+    def feed_filters(args) -> Dict[str, str]:
+        """
+        Extract the tag filters of a calendar feed request.
+
+        Args:
+            args: Request query arguments
+
+        Returns:
+            Dictionary of organ_tag_id, type_tag_id and level_tag_id filters
+        """
+        return {name: args[name] for name in FEED_FILTERS if args.get(name)}
+
+    @staticmethod
+    def generate_feed(filters: Optional[Dict] = None) -> Iterator[bytes]:
+        """
+        Stream an ICS feed of all upcoming published sessions.
+
+        Sessions and their speakers are read in one query and rendered as
+        they arrive, so memory stays flat however many sessions there are.
+
+        Each event's LAST-MODIFIED is the later of the session's and the
+        speaker's ``updated_at``, and its SEQUENCE the number of seconds from
+        creation to that time. Both only grow when an event changes.
+        DTSTAMP carries the same time, so the feed is byte-identical until
+        something changes.
 
-        return "\r\n".join(ics_content)
+        Args:
+            filters: Optional organ_tag_id, type_tag_id and level_tag_id filters
+
+        Yields:
+            Encoded chunks of the feed
+        """
+        query = (
+            select(*EVENT_COLUMNS)
+            .join(Speaker, Session.speaker_id == Speaker.id)
+            .where(Session.status == 'published', Session.date >= date.today())
+            .order_by(Session.date, Session.time, Session.id)
+        )
+        for name, value in (filters or {}).items():
+            query = query.where(getattr(Session, name) == value)
+
+        yield CalendarService._feed_header().encode('utf-8')
+        rows = db.session.execute(query.execution_options(yield_per=FEED_BATCH_SIZE))
+        for row in rows:
+            yield CalendarService._event(row).encode('utf-8')
+        yield b'END:VCALENDAR\r\n'
+
+    @staticmethod
+    def _feed_header() -> str:
+        lines = [
+            'BEGIN:VCALENDAR',
+            'VERSION:2.0',
+            f'PRODID:{PRODID}',
+            'CALSCALE:GREGORIAN',
+            'METHOD:PUBLISH',
+            f'X-WR-CALNAME:{escape_text(FEED_NAME)}',
+            f'REFRESH-INTERVAL;VALUE=DURATION:{FEED_REFRESH_INTERVAL}',
+            f'X-PUBLISHED-TTL:{FEED_REFRESH_INTERVAL}',
+        ]
+        return ''.join(f'{line}\r\n' for line in lines)
+
+    @staticmethod
+    def _event(row) -> str:
+        """Render one folded and escaped VEVENT from a row of ``EVENT_COLUMNS``."""
+        start = datetime.combine(row.date, row.time)
+        end = start + timedelta(minutes=row.duration_minutes)
+        modified = max(row.updated_at, row.speaker_updated_at)
+
+        details = [row.summary, '', f'Abstract: {row.abstract}', '']
+        if row.objectives:
+            details.append('Objectives:')
+            details.extend(f'- {objective}' for objective in row.objectives)
+            details.append('')
+        details.append(f'Speaker: {row.speaker_name}')
+        details.append(f'Designation: {row.speaker_designation}')
+        details.append('')
+        if row.meeting_link:
+            details.append(f'Meeting Link: {row.meeting_link}')
+        if row.meeting_id:
+            details.append(f'Meeting ID: {row.meeting_id}')
+        if row.meeting_password:
+            details.append(f'Password: {row.meeting_password}')
+
+        description = '\n'.join(details)
+
+        location = row.platform
+        if row.meeting_link:
+            location += f' - {row.meeting_link}'
+
+        categories = [
+            tag.label for tag in (
+                tag_registry.get(row.organ_tag_id),
+                tag_registry.get(row.type_tag_id),
+                tag_registry.get(row.level_tag_id),
+            ) if tag is not None
+        ]
+
+        lines = [
+            'BEGIN:VEVENT',
+            f'UID:{row.id}@{UID_DOMAIN}',
+            f'DTSTAMP:{format_utc(modified)}',
+            f'CREATED:{format_utc(row.created_at)}',
+            f'LAST-MODIFIED:{format_utc(modified)}',
+            f'SEQUENCE:{int((modified - row.created_at).total_seconds())}',
+            f"DTSTART:{start.strftime('%Y%m%dT%H%M%S')}",
+            f"DTEND:{end.strftime('%Y%m%dT%H%M%S')}",
+            f'SUMMARY:{escape_text(row.title)}',
+            f'DESCRIPTION:{escape_text(description)}',
+            f'LOCATION:{escape_text(location)}',
+        ]
+        if categories:
+            lines.append(f"CATEGORIES:{','.join(escape_text(label) for label in categories)}")
+        lines.extend([
+            'STATUS:CONFIRMED',
+            'BEGIN:VALARM',
+            'TRIGGER:-PT15M',
+            'ACTION:DISPLAY',
+            'DESCRIPTION:Reminder: Session starts in 15 minutes',
+            'END:VALARM',
+            'END:VEVENT',
+        ])
+        return ''.join(f'{fold_line(line)}\r\n' for line in lines)
@@ -0,0 +1,378 @@
+"""In-memory index of the published catalogue for the public listings.
+
+``/public/sessions/upcoming`` and ``/public/recordings`` filter on three tag
+IDs (and the recording year) and sort on a handful of columns. The catalogue
+is small enough that every worker keeps those columns in memory and answers
+the filter, sort and pagination part of a listing without SQL. Only the page
+itself is then loaded, by primary key, with the usual eager-loading options.
+
+Each index holds its rows in ascending sort-key order, and for every tag and
+year a bitmap of the rows carrying it. Bitmaps are Python integers (bit *i*
+is row *i*), so a filter combination is a few big-integer ANDs, the total is
+``int.bit_count()`` and a page is read off the set bits, all running in C:
+
+- sessions: published sessions ordered by (date, time, id); "upcoming" is
+  the rows from today's date on, found by bisection, so the index stays
+  valid across midnight;
+- recordings: ordered by (recorded_date, id); ``newest`` walks the bits
+  from the top and ``oldest`` from the bottom.
+
+Indexes are rebuilt whole and swapped in atomically. Session, recording and
+tag writes call ``invalidate()`` before committing, which bumps the
+``catalog`` row in ``cache_versions`` in the same transaction; other workers
+notice within ``CATALOG_CHECK_INTERVAL`` seconds.
+
+The indexes are built from the ``session_listings`` read model alone, so
+they are an in-memory projection of it: every listing reads that one table,
+either through an index or through its SQL queries. Searches and the
+``most_viewed`` sort (view counts are flushed in batches without a cache
+version bump) return None, and the caller queries the read model instead.
+``flask catalog check`` runs every listing the indexes answer both ways and
+compares the results. Set ``CATALOG_ENABLED=false`` to always use SQL.
+"""
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from datetime import date
+from typing import Dict, List, Optional, Sequence, Tuple
+from flask import current_app
+from sqlalchemy import select
+from app.extensions import db
+from app.models import Session, Recording, SessionListing, CacheVersion
+from app.utils.metrics import record_cache_lookup
+from app.utils.pagination import decode_cursor, encode_cursor, load_by_ids
+
+CACHE_NAME = 'catalog'
+
+# Filters an index can answer; anything else falls back to SQL
+TAG_FILTERS = ('organ_tag_id', 'type_tag_id', 'level_tag_id')
+
+# Listing page: (items, total count or None, next cursor or None)
+Page = Tuple[List, Optional[int], Optional[str]]
+
+
+@dataclass(frozen=True)
+class CatalogIndex:
+    """Immutable column store of one listing, in ascending sort-key order."""
+
+    keys: List[tuple]
+    ids: List[str]
+    # (filter name, value) -> bitmap of rows
+    bitmaps: Dict[tuple, int]
+
+    @classmethod
+    def build(cls, rows: Sequence[tuple], facets: Sequence[str]) -> 'CatalogIndex':
+        """
+        Build an index from rows of (sort key..., facet values...).
+
+        The last sort key must be the row ID.
+
+        Args:
+            rows: Rows ordered by their sort key
+            facets: Names of the trailing facet columns
+        """
+        split = len(rows[0]) - len(facets) if rows else 0
+        keys, bitmaps = [], {}
+        for position, row in enumerate(rows):
+            keys.append(tuple(row[:split]))
+            bit = 1 << position
+            for name, value in zip(facets, row[split:]):
+                bitmaps[name, value] = bitmaps.get((name, value), 0) | bit
+        return cls(keys=keys, ids=[key[-1] for key in keys], bitmaps=bitmaps)
+
+    @property
+    def all(self) -> int:
+        """Bitmap of every row."""
+        return (1 << len(self.keys)) - 1
+
+    def select(self, filters: Dict, start: int = 0) -> int:
+        """
+        Return the bitmap of rows at or after position start matching every filter.
+
+        Args:
+            filters: Filter name -> value
+            start: First eligible row position
+        """
+        bitmap = self.all >> start << start
+        for name, value in filters.items():
+            bitmap &= self.bitmaps.get((name, value), 0)
+            if not bitmap:
+                break
+        return bitmap
+
+    def after(self, key: tuple) -> int:
+        """Return the bitmap of rows sorting strictly after key."""
+        start = bisect_right(self.keys, key)
+        return self.all >> start << start
+
+    def before(self, key: tuple) -> int:
+        """Return the bitmap of rows sorting strictly before key."""
+        return (1 << bisect_left(self.keys, key)) - 1
+
+    def page(self, bitmap: int, offset: int, limit: int, reverse: bool = False) -> List[str]:
+        """
+        Return the IDs of up to limit set rows, skipping the first offset.
+
+        Args:
+            bitmap: Rows to page through
+            offset: Number of set rows to skip
+            limit: Maximum number of IDs to return
+            reverse: Walk from the last row to the first
+        """
+        # bin() lists the highest bit first; reverse it to index by position
+        bits = bin(bitmap)[2:] if reverse else bin(bitmap)[:1:-1]
+        last = len(bits) - 1
+        ids = []
+        index = -1
+        for _ in range(offset + limit):
+            index = bits.find('1', index + 1)
+            if index < 0:
+                break
+            if offset:
+                offset -= 1
+                continue
+            ids.append(self.ids[last - index] if reverse else self.ids[index])
+        return ids
+
+
+class PublishedCatalog:
+    """Lazily built, version-checked in-memory indexes of the public listings."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # (version, sessions index, recordings index)
+        self._state = None
+        self._checked_at = 0.0
+
+    def upcoming_sessions(self, filters: Optional[Dict], pagination: Dict,
+                          load_options: Optional[Sequence] = None) -> Optional[Page]:
+        """
+        Paginate upcoming published sessions, ordered soonest first.
+
+        Args:
+            filters: Optional tag filters and search
+            pagination: Dictionary with page, per_page, cursor and with_total
+            load_options: Loader options of the page query (default: the full listing's)
+
+        Returns:
+            Tuple of (list of sessions, total count or None, next cursor or None),
+            or None if the catalog cannot answer and SQL must be used
+        """
+        from app.services.session_service import (
+            SessionService, SESSION_LOAD_OPTIONS, UPCOMING_SESSION_SORT
+        )
+
+        filters = dict(filters or {})
+        if not self._answerable(filters):
+            return None
+
+        index = self._load()[1]
+        # Rows are sorted by date first, so upcoming rows form a suffix
+        matched = index.select(filters, bisect_left(index.keys, (date.today(),)))
+        remaining = matched
+        if pagination.get('cursor'):
+            values = tuple(decode_cursor(UPCOMING_SESSION_SORT, pagination['cursor']))
+            remaining &= index.after(values)
+
+        return self._page(
+            index, matched, remaining, False, pagination,
+            SessionService.listing_query(load_options or SESSION_LOAD_OPTIONS),
+            Session, UPCOMING_SESSION_SORT
+        )
+
+    def recordings(self, filters: Optional[Dict], sort_by: str, pagination: Dict,
+                   load_options: Optional[Sequence] = None) -> Optional[Page]:
+        """
+        Paginate recordings, newest or oldest first.
+
+        Args:
+            filters: Optional tag and year filters and search
+            sort_by: newest or oldest
+            pagination: Dictionary with page, per_page, cursor and with_total
+            load_options: Loader options of the page query (default: the full listing's)
+
+        Returns:
+            Tuple of (list of recordings, total count or None, next cursor or None),
+            or None if the catalog cannot answer and SQL must be used
+        """
+        from app.services.session_service import (
+            SessionService, RECORDING_LOAD_OPTIONS, RECORDING_SORTS
+        )
+
+        filters = dict(filters or {})
+        if sort_by not in ('newest', 'oldest') or not self._answerable(filters, 'year'):
+            return None
+
+        index = self._load()[2]
+        reverse = sort_by == 'newest'
+        matched = index.select(filters)
+        remaining = matched
+        if pagination.get('cursor'):
+            values = tuple(decode_cursor(RECORDING_SORTS[sort_by], pagination['cursor']))
+            remaining &= index.before(values) if reverse else index.after(values)
+
+        return self._page(
+            index, matched, remaining, reverse, pagination,
+            SessionService.recording_listing_query(load_options or RECORDING_LOAD_OPTIONS),
+            Recording, RECORDING_SORTS[sort_by]
+        )
+
+    def invalidate(self):
+        """
+        Mark the indexes stale in every worker.
+
+        Call before committing the write: the version bump is part of its
+        transaction, so the write and the invalidation commit or fail
+        together.
+        """
+        CacheVersion.bump(CACHE_NAME)
+        with self._lock:
+            self._state = None
+            self._checked_at = 0.0
+
+    def rebuild(self) -> Tuple[int, int]:
+        """
+        Invalidate the indexes everywhere and build them again in this process.
+
+        Returns:
+            Tuple of (indexed sessions, indexed recordings)
+        """
+        self.invalidate()
+        db.session.commit()
+        _, sessions, recordings = self._load()
+        return len(sessions.keys), len(recordings.keys)
+
+    def check(self) -> List[str]:
+        """
+        Compare freshly built indexes with the read model queries they stand in for.
+
+        Every listing the indexes answer is run both ways, unfiltered and
+        filtered on each indexed tag (and year) value, and the complete ID
+        orders are compared.
+
+        Returns:
+            Descriptions of the listings whose results differ
+        """
+        from app.services.session_listings import (
+            session_listings, UPCOMING_LISTING_SORT, RECORDING_LISTING_SORTS
+        )
+
+        def expected(query, sort_keys, column) -> List[str]:
+            query = query.with_entities(column).order_by(*[
+                key.desc() if descending else key.asc() for key, descending in sort_keys
+            ])
+            return [row[0] for row in query]
+
+        def filter_sets(index: CatalogIndex) -> List[Dict]:
+            values = sorted((name, value) for name, value in index.bitmaps if value is not None)
+            return [{}] + [{name: value} for name, value in values]
+
+        sessions, recordings = self._build()
+        mismatches = []
+
+        upcoming_start = bisect_left(sessions.keys, (date.today(),))
+        for filters in filter_sets(sessions):
+            actual = sessions.page(sessions.select(filters, upcoming_start), 0, len(sessions.ids))
+            if actual != expected(session_listings.upcoming_query(filters),
+                                  UPCOMING_LISTING_SORT, SessionListing.session_id):
+                mismatches.append(f'upcoming sessions {filters}')
+
+        for filters in filter_sets(recordings):
+            for sort_by, reverse in (('newest', True), ('oldest', False)):
+                actual = recordings.page(recordings.select(filters), 0, len(recordings.ids), reverse)
+                if actual != expected(session_listings.recordings_query(filters),
+                                      RECORDING_LISTING_SORTS[sort_by], SessionListing.recording_id):
+                    mismatches.append(f'recordings {sort_by} {filters}')
+        return mismatches
+
+    @staticmethod
+    def _answerable(filters: Dict, *extra: str) -> bool:
+        """Return whether an index can apply every filter."""
+        if not current_app.config['CATALOG_ENABLED']:
+            return False
+        if filters.get('search', '').strip():
+            return False
+        filters.pop('search', None)
+        return all(name in TAG_FILTERS or name in extra for name in filters)
+
+    @staticmethod
+    def _page(index: CatalogIndex, matched: int, remaining: int, reverse: bool,
+              pagination: Dict, query, model, sort_keys) -> Page:
+        """
+        Load one page of rows selected from an index, in index order.
+
+        Args:
+            index: Index the bitmaps belong to
+            matched: Rows matching the filters, counted for the total
+            remaining: Matching rows after the cursor, if any
+            reverse: Walk the index from the last row to the first
+            pagination: Dictionary with page, per_page, cursor and with_total
+            query: Listing query with eager-loading options, to load the page with
+            model: Model of the listing
+            sort_keys: Sort keys the cursor is encoded from
+        """
+        per_page = pagination.get('per_page', 20)
+        offset = 0
+        if pagination.get('cursor') is None:
+            offset = (max(pagination.get('page', 1), 1) - 1) * per_page
+
+        # Fetch one extra ID to know whether another page exists
+        ids = index.page(remaining, offset, per_page + 1, reverse)
+        items = load_by_ids(query, model, ids[:per_page])
+
+        total = matched.bit_count() if pagination.get('with_total', True) else None
+        next_cursor = None
+        if len(ids) > per_page and items:
+            next_cursor = encode_cursor(sort_keys, items[-1])
+        return items, total, next_cursor
+
+    def _load(self) -> Tuple[int, CatalogIndex, CatalogIndex]:
+        """Return the current state, rebuilding it if missing or stale."""
+        state = self._state
+        interval = current_app.config['CATALOG_CHECK_INTERVAL']
+        if state is not None and time.monotonic() - self._checked_at < interval:
+            record_cache_lookup(CACHE_NAME, True)
+            return state
+
+        with self._lock:
+            # Another thread may have refreshed while we waited for the lock
+            if self._state is not None and time.monotonic() - self._checked_at < interval:
+                record_cache_lookup(CACHE_NAME, True)
+                return self._state
+
+            version = CacheVersion.current(CACHE_NAME)
+            record_cache_lookup(CACHE_NAME, self._state is not None and self._state[0] == version)
+            if self._state is None or self._state[0] != version:
+                self._state = (version, *self._build())
+            self._checked_at = time.monotonic()
+            return self._state
+
+    @staticmethod
+    def _build() -> Tuple[CatalogIndex, CatalogIndex]:
+        """Read the indexed columns of every published session and every recording."""
+        sessions = db.session.execute(
+            select(
+                SessionListing.date, SessionListing.time, SessionListing.session_id,
+                SessionListing.organ_tag_id, SessionListing.type_tag_id, SessionListing.level_tag_id,
+            )
+            .where(SessionListing.status == 'published')
+            .order_by(SessionListing.date, SessionListing.time, SessionListing.session_id)
+        ).all()
+        recordings = db.session.execute(
+            select(
+                SessionListing.recorded_date, SessionListing.recording_id,
+                SessionListing.organ_tag_id, SessionListing.type_tag_id, SessionListing.level_tag_id,
+            )
+            .where(SessionListing.recording_id.isnot(None))
+            .order_by(SessionListing.recorded_date, SessionListing.recording_id)
+        ).all()
+        return (
+            CatalogIndex.build(sessions, TAG_FILTERS),
+            CatalogIndex.build(
+                [(*row, row[0].year) for row in recordings], TAG_FILTERS + ('year',)
+            ),
+        )
+
+
+catalog = PublishedCatalog()
@@ -0,0 +1,180 @@
+"""Streaming bulk export of sessions, recordings, speakers and tags.
+
+Exports select plain table columns instead of loading model instances, and
+fetch them ``EXPORT_BATCH_SIZE`` rows at a time with ``yield_per`` (a
+server-side cursor on PostgreSQL). Rows are encoded as CSV or NDJSON as they
+arrive, so memory use stays flat however large the table is, and the whole
+archive comes out of one query instead of one count and one page query per
+100 rows.
+"""
+import csv
+import io
+import json
+from datetime import date, datetime, time
+from typing import Dict, Iterator, Optional
+from sqlalchemy import select, true
+from app.extensions import db
+from app.models import Session, Recording, Speaker, Tag
+from app.services.recording_archive import recorded_in_year
+from app.services.search_index import search_index
+from app.utils.errors import NotFoundError, ValidationError
+
+# Rows fetched per round trip and encoded per chunk
+EXPORT_BATCH_SIZE = 1000
+
+# Format -> mimetype
+FORMATS = {
+    'csv': 'text/csv',
+    'ndjson': 'application/x-ndjson',
+}
+
+ENTITIES = {
+    'sessions': Session,
+    'recordings': Recording,
+    'speakers': Speaker,
+    'tags': Tag,
+}
+
+
+def export_value(value):
+    """Convert a column value to a JSON-compatible value."""
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    return value
+
+
+def csv_value(value):
+    """Convert a column value to a CSV cell."""
+    if value is None:
+        return ''
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, ensure_ascii=False)
+    return export_value(value)
+
+
+class ExportService:
+    """Service class for bulk exports."""
+
+    @staticmethod
+    def query(entity: str, filters: Optional[Dict] = None):
+        """
+        Build the export query of an entity.
+
+        Supports the filters of the matching listing endpoint: status,
+        speaker and tag filters for sessions; tag, year and search filters
+        for recordings; category and active_only for tags. Search also
+        applies to sessions.
+
+        Args:
+            entity: sessions, recordings, speakers or tags
+            filters: Dictionary of filter criteria
+
+        Returns:
+            Select over the entity's columns (ID first), ordered by ID
+
+        Raises:
+            NotFoundError: If the entity cannot be exported
+        """
+        model = ENTITIES.get(entity)
+        if model is None:
+            raise NotFoundError(f"Unknown export '{entity}'", 'EXPORT_NOT_FOUND')
+
+        filters = filters or {}
+        columns = [model.id] + [column for column in model.__table__.columns if column.name != 'id']
+        query = select(*columns).order_by(model.id)
+
+        if model is Session or model is Recording:
+            session_id_column = Session.id
+            if model is Recording:
+                query = query.join(Session, Recording.session_id == Session.id)
+                session_id_column = Recording.session_id
+
+            if 'status' in filters and model is Session:
+                query = query.where(Session.status == filters['status'])
+            if 'speaker_id' in filters and model is Session:
+                query = query.where(Session.speaker_id == filters['speaker_id'])
+            if 'organ_tag_id' in filters:
+                query = query.where(Session.organ_tag_id == filters['organ_tag_id'])
+            if 'type_tag_id' in filters:
+                query = query.where(Session.type_tag_id == filters['type_tag_id'])
+            if 'level_tag_id' in filters:
+                query = query.where(Session.level_tag_id == filters['level_tag_id'])
+            if filters.get('year') and model is Recording:
+                query = query.where(recorded_in_year(filters['year']))
+
+            # Apply search filter
+            search = filters.get('search', '').strip()
+            if search:
+                query = search_index.filter(query, search, session_id_column)
+
+        elif model is Tag:
+            if filters.get('category'):
+                query = query.where(Tag.category == filters['category'])
+            if filters.get('active_only'):
+                query = query.where(Tag.is_active == true())
+
+        return query
+
+    @staticmethod
+    def generate(entity: str, fmt: str, filters: Optional[Dict] = None) -> Iterator[bytes]:
+        """
+        Stream an entity's rows as CSV (with a header row) or NDJSON.
+
+        The query is built before the first chunk is produced, so unknown
+        entities and formats fail before the response starts.
+
+        Args:
+            entity: sessions, recordings, speakers or tags
+            fmt: csv or ndjson
+            filters: Dictionary of filter criteria
+
+        Returns:
+            Iterator of encoded chunks
+
+        Raises:
+            NotFoundError: If the entity cannot be exported
+            ValidationError: If the format is not supported
+        """
+        if fmt not in FORMATS:
+            raise ValidationError(
+                f"Unsupported export format '{fmt}' (use {', '.join(FORMATS)})", 'INVALID_FORMAT'
+            )
+        query = ExportService.query(entity, filters)
+        encode = ExportService._csv if fmt == 'csv' else ExportService._ndjson
+        return encode(query)
+
+    @staticmethod
+    def _rows(query):
+        """Execute an export query, yielding rows one batch at a time."""
+        result = db.session.execute(query.execution_options(yield_per=EXPORT_BATCH_SIZE))
+        try:
+            for batch in result.partitions():
+                yield batch
+        finally:
+            result.close()
+
+    @staticmethod
+    def _csv(query) -> Iterator[bytes]:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow([column.name for column in query.selected_columns])
+        for batch in ExportService._rows(query):
+            writer.writerows([csv_value(value) for value in row] for row in batch)
+            yield buffer.getvalue().encode('utf-8')
+            buffer.seek(0)
+            buffer.truncate()
+        # Header only, when nothing matched
+        if buffer.tell():
+            yield buffer.getvalue().encode('utf-8')
+
+    @staticmethod
+    def _ndjson(query) -> Iterator[bytes]:
+        names = [column.name for column in query.selected_columns]
+        for batch in ExportService._rows(query):
+            yield ''.join(
+                json.dumps(
+                    {name: export_value(value) for name, value in zip(names, row)},
+                    ensure_ascii=False
+                ) + '\n'
+                for row in batch
+            ).encode('utf-8')
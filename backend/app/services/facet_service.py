@@ -0,0 +1,117 @@
+"""Facet counts for the public filter panels.
+
+For a scope (upcoming sessions or recordings) and the current filter and
+search state, the panels need to know how many results each organ, type and
+level tag and each year would give. Counts follow the usual faceting rule:
+a facet's counts apply every active filter except the facet's own, so
+picking an organ still shows how many results the other organs have.
+
+All four facets come from one grouped query over the ``session_listings``
+read model. It counts the scope's rows (search applied) per (organ, type,
+level, year) combination, and the per-facet counts are summed from those
+groups in Python. There are far fewer combinations than rows, so this costs
+one aggregate instead of one filtered ``count()`` per tag.
+"""
+from collections import Counter
+from datetime import date
+from typing import Dict, Optional
+from sqlalchemy import and_, extract, func, select
+from app.extensions import db
+from app.models import SessionListing
+from app.services.search_index import search_index
+from app.services.tag_registry import tag_registry, CATEGORIES
+from app.utils.errors import NotFoundError
+
+# Grouping columns, in the order the grouped query returns them
+FACETS = ('organ_tag_id', 'type_tag_id', 'level_tag_id', 'year')
+
+
+class FacetService:
+    """Service class for facet counts."""
+
+    @staticmethod
+    def grouped_query(scope: str, search: str = ''):
+        """
+        Build the grouped count query of a scope.
+
+        Args:
+            scope: sessions (upcoming published sessions) or recordings
+            search: Optional search string
+
+        Returns:
+            Select of (organ_tag_id, type_tag_id, level_tag_id, year, count)
+
+        Raises:
+            NotFoundError: If the scope is unknown
+        """
+        if scope == 'sessions':
+            year = extract('year', SessionListing.date)
+            condition = and_(
+                SessionListing.status == 'published',
+                SessionListing.date >= date.today()
+            )
+        elif scope == 'recordings':
+            year = extract('year', SessionListing.recorded_date)
+            condition = SessionListing.recording_id.isnot(None)
+        else:
+            raise NotFoundError(f"Unknown facet scope '{scope}'", 'FACETS_NOT_FOUND')
+
+        tag_columns = (SessionListing.organ_tag_id, SessionListing.type_tag_id, SessionListing.level_tag_id)
+        query = select(*tag_columns, year, func.count()).where(condition)
+
+        search = search.strip()
+        if search:
+            query = search_index.filter(query, search, SessionListing.session_id)
+
+        return query.group_by(*tag_columns, year)
+
+    @staticmethod
+    def counts(scope: str, filters: Optional[Dict] = None) -> Dict:
+        """
+        Count the results of each tag and year under the current filters.
+
+        Args:
+            scope: sessions (upcoming published sessions) or recordings
+            filters: Optional organ_tag_id, type_tag_id, level_tag_id and year
+                filters, and search
+
+        Returns:
+            Dictionary with the total matching the filters, each category's
+            active tags with their counts, and counts per year (newest first)
+
+        Raises:
+            NotFoundError: If the scope is unknown
+        """
+        filters = filters or {}
+        rows = db.session.execute(
+            FacetService.grouped_query(scope, filters.get('search', ''))
+        ).all()
+
+        total = 0
+        counts = {facet: Counter() for facet in FACETS}
+        for row in rows:
+            values = dict(zip(FACETS, row))
+            matched = {
+                facet: facet not in filters or values[facet] == filters[facet]
+                for facet in FACETS
+            }
+            if all(matched.values()):
+                total += row[-1]
+            for facet in FACETS:
+                # A facet's own filter does not narrow its counts
+                if all(matched[other] for other in FACETS if other != facet):
+                    counts[facet][values[facet]] += row[-1]
+
+        result = {'total': total}
+        for category in CATEGORIES:
+            tag_counts = counts[f'{category}_tag_id']
+            result[category] = [
+                {'id': tag.id, 'label': tag.label, 'count': tag_counts[tag.id]}
+                for tag in tag_registry.list(category=category, active_only=True)
+            ]
+        result['year'] = [
+            {'year': year, 'count': count}
+            for year, count in sorted(counts['year'].items(), reverse=True)
+            if count
+        ]
+        return result
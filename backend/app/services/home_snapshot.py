@@ -0,0 +1,170 @@
+"""Precomputed landing page document for ``/public/home``.
+
+The home payload (next upcoming sessions, latest recordings and totals) is
+rendered to JSON once and served from memory, so the busiest page of the site
+does no database work in the steady state. Each worker keeps its own copy and
+rebuilds it lazily when:
+
+- a session, recording, speaker or tag write that changes the page calls
+  ``invalidate()`` before committing, which bumps the ``home`` row in
+  ``cache_versions`` in the same transaction so other workers notice within
+  ``HOME_SNAPSHOT_CHECK_INTERVAL`` seconds;
+- the date rolls over, since that changes which sessions are upcoming;
+- it is older than ``HOME_SNAPSHOT_MAX_AGE`` seconds, which keeps the view
+  counts of the listed recordings reasonably fresh.
+
+``flask home-snapshot rebuild`` forces a rebuild in every worker.
+"""
+import hashlib
+import threading
+import time
+from datetime import date, datetime
+from typing import Dict, Optional, Tuple
+from flask import current_app
+from sqlalchemy import func, select
+from app.extensions import db
+from app.models import Session, Recording, CacheVersion
+from app.schemas.serializers import serialize_session, serialize_recording_with_session
+from app.utils.metrics import record_cache_lookup
+
+CACHE_NAME = 'home'
+
+# Number of sessions and recordings shown on the landing page
+HOME_ITEMS = 4
+
+
+def build_home_data() -> Dict:
+    """
+    Query and serialize the landing page payload.
+
+    Returns:
+        Dictionary with upcoming sessions, recent recordings and stats
+    """
+    from app.services.session_service import SessionService, UPCOMING_SESSION_SORT
+
+    upcoming_sessions, _, _ = SessionService._paginate(
+        SessionService.upcoming_query(),
+        UPCOMING_SESSION_SORT,
+        {'page': 1, 'per_page': HOME_ITEMS, 'with_total': False}
+    )
+    recent_recordings = SessionService.recording_listing_query().order_by(
+        Recording.recorded_date.desc(), Recording.id.desc()
+    ).limit(HOME_ITEMS).all()
+
+    total_sessions, total_recordings = db.session.execute(select(
+        select(func.count()).select_from(Session).scalar_subquery(),
+        select(func.count()).select_from(Recording).scalar_subquery(),
+    )).one()
+
+    return {
+        'upcoming_sessions': [serialize_session(s) for s in upcoming_sessions],
+        'recent_recordings': [serialize_recording_with_session(r) for r in recent_recordings],
+        'stats': {
+            'total_sessions': total_sessions,
+            'total_recordings': total_recordings
+        }
+    }
+
+
+class HomeSnapshot:
+    """Lazily built, version-checked JSON snapshot of the landing page."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # (version, day, built_at monotonic, built_at datetime, body, digest)
+        self._state = None
+        self._checked_at = 0.0
+
+    def body(self) -> bytes:
+        """
+        Get the rendered landing page document.
+
+        Returns:
+            JSON document as bytes
+        """
+        return self._load()[4]
+
+    def fingerprint(self) -> Tuple[str, Optional[datetime]]:
+        """
+        Get a version string and last modification time for the document.
+
+        Returns:
+            Tuple of (digest of the document, time it was built)
+        """
+        state = self._load()
+        return state[5], state[3]
+
+    def invalidate(self):
+        """
+        Mark the snapshot stale in every worker.
+
+        Call before committing the write: the version bump is part of its
+        transaction, so the write and the invalidation commit or fail
+        together.
+        """
+        CacheVersion.bump(CACHE_NAME)
+        with self._lock:
+            self._state = None
+            self._checked_at = 0.0
+
+    def rebuild(self) -> int:
+        """
+        Invalidate the snapshot everywhere and build it again in this process.
+
+        Returns:
+            Size of the rebuilt document in bytes
+        """
+        self.invalidate()
+        db.session.commit()
+        return len(self.body())
+
+    def _load(self):
+        """Return the current state, rebuilding it if missing or stale."""
+        state = self._state
+        if state is not None and self._fresh(state):
+            record_cache_lookup(CACHE_NAME, True)
+            return state
+
+        with self._lock:
+            # Another thread may have refreshed while we waited for the lock
+            state = self._state
+            if state is not None and self._fresh(state):
+                record_cache_lookup(CACHE_NAME, True)
+                return state
+
+            version = CacheVersion.current(CACHE_NAME)
+            max_age = current_app.config['HOME_SNAPSHOT_MAX_AGE']
+            if (
+                state is None
+                or state[0] != version
+                or state[1] != date.today()
+                or time.monotonic() - state[2] >= max_age
+            ):
+                record_cache_lookup(CACHE_NAME, False)
+                body = current_app.json.dumps(build_home_data()).encode()
+                state = (
+                    version,
+                    date.today(),
+                    time.monotonic(),
+                    datetime.utcnow().replace(microsecond=0),
+                    body,
+                    hashlib.sha1(body).hexdigest(),
+                )
+                self._state = state
+            else:
+                record_cache_lookup(CACHE_NAME, True)
+            self._checked_at = time.monotonic()
+            return state
+
+    def _fresh(self, state) -> bool:
+        """Return whether state can be served without touching the database."""
+        config = current_app.config
+        now = time.monotonic()
+        return (
+            state[1] == date.today()
+            and now - state[2] < config['HOME_SNAPSHOT_MAX_AGE']
+            and now - self._checked_at < config['HOME_SNAPSHOT_CHECK_INTERVAL']
+        )
+
+
+home_snapshot = HomeSnapshot()
@@ -0,0 +1,216 @@
+"""Sliding-window throttling of failed login attempts.
+
+Failed logins are counted per email address and per client IP. Each key has
+one counter per fixed window of ``LOGIN_THROTTLE_WINDOW`` seconds. The
+sliding count weighs the previous window by the share of it still inside
+the sliding window:
+
+    count = current + previous * (1 - elapsed_in_current / window)
+
+which approximates a true sliding log with two integers per key. Once a key
+reaches its limit, further attempts are refused before any password is
+checked, so throttled requests cost no bcrypt time. A successful login
+clears the email's counter.
+
+Two backends are available through ``LOGIN_THROTTLE_BACKEND``:
+
+- ``memory``: per-process counters, so each worker enforces the limits
+  separately.
+- ``sqlite``: counters in a SQLite file at ``LOGIN_THROTTLE_PATH`` shared by
+  every worker on the host.
+"""
+import math
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional, Tuple
+from flask import current_app
+from app.utils.errors import RateLimitError
+
+# (current window count, previous window count)
+Counts = Tuple[int, int]
+
+
+class ThrottleBackend:
+    """Interface of a throttle counter store."""
+
+    name = 'base'
+
+    def __init__(self, window: int):
+        self.window = window
+
+    def counts(self, key: str, bucket: int) -> Counts:
+        """Return the counts of the given window and the one before it."""
+        raise NotImplementedError
+
+    def hit(self, key: str, bucket: int):
+        """Increment the count of key in the given window."""
+        raise NotImplementedError
+
+    def reset(self, key: str):
+        """Forget every count of key."""
+        raise NotImplementedError
+
+
+class MemoryBackend(ThrottleBackend):
+    """Per-process counters."""
+
+    name = 'memory'
+
+    def __init__(self, window: int):
+        super().__init__(window)
+        self._lock = threading.Lock()
+        # key -> {bucket: count}, holding at most the two latest buckets
+        self._counters: Dict[str, Dict[int, int]] = {}
+
+    def counts(self, key, bucket):
+        with self._lock:
+            buckets = self._counters.get(key, {})
+            return buckets.get(bucket, 0), buckets.get(bucket - 1, 0)
+
+    def hit(self, key, bucket):
+        with self._lock:
+            buckets = self._counters.setdefault(key, {})
+            buckets[bucket] = buckets.get(bucket, 0) + 1
+            for old in [old for old in buckets if old < bucket - 1]:
+                del buckets[old]
+            # Forget keys with nothing left in the sliding window
+            if len(self._counters) > 10_000:
+                self._counters = {
+                    name: counts for name, counts in self._counters.items()
+                    if max(counts) >= bucket - 1
+                }
+
+    def reset(self, key):
+        with self._lock:
+            self._counters.pop(key, None)
+
+
+class SQLiteBackend(ThrottleBackend):
+    """Counters stored in a SQLite file shared by all worker processes."""
+
+    name = 'sqlite'
+
+    # Stale windows are pruned on every Nth write
+    PRUNE_EVERY = 100
+
+    def __init__(self, window: int, path: str):
+        super().__init__(window)
+        self.path = path
+        self._local = threading.local()
+        self._writes = 0
+        self._connect().execute(
+            """
+            CREATE TABLE IF NOT EXISTS login_attempts (
+                key TEXT NOT NULL,
+                bucket INTEGER NOT NULL,
+                count INTEGER NOT NULL,
+                PRIMARY KEY (key, bucket)
+            )
+            """
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return this thread's connection, reopening it after a fork."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def counts(self, key, bucket):
+        rows = dict(self._connect().execute(
+            'SELECT bucket, count FROM login_attempts WHERE key = ? AND bucket IN (?, ?)',
+            (key, bucket, bucket - 1)
+        ).fetchall())
+        return rows.get(bucket, 0), rows.get(bucket - 1, 0)
+
+    def hit(self, key, bucket):
+        conn = self._connect()
+        conn.execute(
+            'INSERT INTO login_attempts (key, bucket, count) VALUES (?, ?, 1) '
+            'ON CONFLICT (key, bucket) DO UPDATE SET count = count + 1',
+            (key, bucket)
+        )
+        self._writes += 1
+        if self._writes % self.PRUNE_EVERY == 0:
+            conn.execute('DELETE FROM login_attempts WHERE bucket < ?', (bucket - 1,))
+
+    def reset(self, key):
+        self._connect().execute('DELETE FROM login_attempts WHERE key = ?', (key,))
+
+
+class LoginThrottle:
+    """Front end over the configured backend, bound to the Flask app."""
+
+    def __init__(self):
+        self.backend: Optional[ThrottleBackend] = None
+
+    def init_app(self, app):
+        """
+        Create the backend selected by the application config.
+
+        Args:
+            app: Flask application instance
+        """
+        name = app.config['LOGIN_THROTTLE_BACKEND']
+        window = app.config['LOGIN_THROTTLE_WINDOW']
+
+        if name == 'memory':
+            self.backend = MemoryBackend(window)
+        elif name == 'sqlite':
+            self.backend = SQLiteBackend(window, app.config['LOGIN_THROTTLE_PATH'])
+        elif name == 'none':
+            self.backend = None
+        else:
+            raise ValueError(f'Unknown LOGIN_THROTTLE_BACKEND: {name}')
+
+    def check(self, email: str, ip: str):
+        """
+        Refuse the attempt if its email or IP has too many recent failures.
+
+        Raises:
+            RateLimitError: With Retry-After set to when the oldest window expires
+        """
+        if self.backend is None:
+            return
+        config = current_app.config
+        for key, limit in (
+            (f'email:{email.lower()}', config['LOGIN_MAX_FAILURES_PER_EMAIL']),
+            (f'ip:{ip}', config['LOGIN_MAX_FAILURES_PER_IP']),
+        ):
+            count, retry_after = self._sliding_count(key)
+            if count >= limit:
+                raise RateLimitError(
+                    'Too many failed login attempts, try again later', 'LOGIN_THROTTLED', retry_after
+                )
+
+    def failed(self, email: str, ip: str):
+        """Count a failed attempt against the email and the IP."""
+        if self.backend is None:
+            return
+        bucket = int(time.time() // self.backend.window)
+        self.backend.hit(f'email:{email.lower()}', bucket)
+        self.backend.hit(f'ip:{ip}', bucket)
+
+    def succeeded(self, email: str):
+        """Clear the failures of an email after a successful login."""
+        if self.backend is not None:
+            self.backend.reset(f'email:{email.lower()}')
+
+    def _sliding_count(self, key: str) -> Tuple[float, int]:
+        """Return the sliding-window count of key and seconds until the window moves on."""
+        window = self.backend.window
+        now = time.time()
+        bucket = int(now // window)
+        elapsed = now - bucket * window
+        current, previous = self.backend.counts(key, bucket)
+        count = current + previous * (1 - elapsed / window)
+        return count, max(1, math.ceil(window - elapsed))
+
+
+login_throttle = LoginThrottle()
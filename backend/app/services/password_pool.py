@@ -0,0 +1,110 @@
+"""Bounded process pool for bcrypt work.
+
+Each bcrypt check costs a few hundred milliseconds of CPU. Running it in
+the request thread lets a burst of login attempts occupy every worker's CPU
+and starve the public site. Password checks and hashes therefore run on a
+small per-worker process pool of ``PASSWORD_POOL_WORKERS`` processes. At
+most ``PASSWORD_POOL_QUEUE_LIMIT`` jobs may be pending at once; further
+attempts are rejected immediately with 503 instead of queueing.
+
+A pool size of 0 runs bcrypt inline, which keeps tests and scripts simple.
+"""
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, TimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from app.utils.errors import ServiceUnavailableError
+from app.utils.passwords import check_password, hash_password
+
+# Seconds a request waits for its job before giving up
+RESULT_TIMEOUT = 30
+
+
+class PasswordPool:
+    """Per-process executor for bcrypt checks and hashes with a pending-job limit."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._executor = None
+        self._executor_pid = None
+        self._pending = 0
+        self._workers = 0
+        self._queue_limit = 0
+
+    def init_app(self, app):
+        """
+        Read the pool size and queue limit from the application config.
+
+        The processes themselves are started on first use, in the worker
+        process that needs them.
+
+        Args:
+            app: Flask application instance
+        """
+        self._workers = app.config['PASSWORD_POOL_WORKERS']
+        self._queue_limit = app.config['PASSWORD_POOL_QUEUE_LIMIT']
+
+    def check(self, password: str, password_hash: str) -> bool:
+        """
+        Check a password against a bcrypt hash.
+
+        Raises:
+            ServiceUnavailableError: If too many jobs are pending
+        """
+        return self._run(check_password, password, password_hash)
+
+    def hash(self, password: str, rounds: int) -> str:
+        """
+        Hash a password with the given bcrypt cost.
+
+        Raises:
+            ServiceUnavailableError: If too many jobs are pending
+        """
+        return self._run(hash_password, password, rounds)
+
+    def shutdown(self):
+        """Stop the pool processes of this worker."""
+        with self._lock:
+            if self._executor is not None and self._executor_pid == os.getpid():
+                self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _run(self, fn, *args):
+        if self._workers <= 0:
+            return fn(*args)
+
+        with self._lock:
+            if self._pending >= self._queue_limit:
+                raise ServiceUnavailableError(
+                    'Too many login attempts in progress, try again shortly', 'LOGIN_BUSY', retry_after=1
+                )
+            self._pending += 1
+            executor = self._ensure_executor()
+
+        try:
+            return executor.submit(fn, *args).result(timeout=RESULT_TIMEOUT)
+        except TimeoutError:
+            raise ServiceUnavailableError('Password check timed out', 'LOGIN_BUSY', retry_after=1)
+        except BrokenProcessPool:
+            # A pool process died; start a fresh pool for the next job
+            with self._lock:
+                if self._executor is executor:
+                    self._executor = None
+            raise ServiceUnavailableError('Password check failed, try again', 'LOGIN_BUSY', retry_after=1)
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+    def _ensure_executor(self) -> ProcessPoolExecutor:
+        """Return this process's executor, creating it after startup or a fork."""
+        if self._executor is None or self._executor_pid != os.getpid():
+            # spawn, not fork: the request worker holds threads and database connections
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._workers, mp_context=multiprocessing.get_context('spawn')
+            )
+            self._executor_pid = os.getpid()
+        return self._executor
+
+
+password_pool = PasswordPool()
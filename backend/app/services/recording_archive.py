@@ -0,0 +1,136 @@
+"""Archive index of recordings by year and month.
+
+The ``recording_archive`` table holds the number of recordings per
+(year, month) of ``recorded_date``. The recording service adjusts it in the
+same transaction as each add, date change and delete, so listing the archive
+reads a few dozen rows instead of grouping the recordings table.
+``flask recording-archive rebuild`` recounts it from scratch (e.g. after a
+bulk import).
+
+Year filters use ``recorded_in_year``, a date-range predicate on
+``recorded_date`` that the ``ix_recordings_recorded_date`` index can serve,
+unlike ``extract('year', ...)``.
+"""
+from datetime import date, MAXYEAR, MINYEAR
+from typing import Dict, List, Optional
+from sqlalchemy import and_, delete, false, insert, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from app.extensions import db
+from app.models import Recording, RecordingArchive
+
+# INSERT ... ON CONFLICT DO UPDATE constructs per dialect
+_UPSERT = {
+    'sqlite': sqlite.insert,
+    'postgresql': postgresql.insert,
+}
+
+
+def recorded_in_year(year: int, column=None):
+    """
+    Build the filter matching recordings recorded in a year.
+
+    Args:
+        year: Calendar year
+        column: Recorded date column (default: Recording.recorded_date)
+
+    Returns:
+        Range predicate on the recorded date
+    """
+    if column is None:
+        column = Recording.recorded_date
+    if not MINYEAR <= year < MAXYEAR:
+        return false()
+    return and_(column >= date(year, 1, 1), column < date(year + 1, 1, 1))
+
+
+class RecordingArchiveIndex:
+    """Maintains and reads the per-month recording counts."""
+
+    @staticmethod
+    def record(old: Optional[date], new: Optional[date]):
+        """
+        Move one recording between months within the current transaction.
+
+        The caller is responsible for committing.
+
+        Args:
+            old: Previous recorded date (None for a new recording)
+            new: Current recorded date (None for a deleted recording)
+        """
+        if old and new and (old.year, old.month) == (new.year, new.month):
+            return
+        if old:
+            RecordingArchiveIndex._adjust(old, -1)
+        if new:
+            RecordingArchiveIndex._adjust(new, 1)
+
+    @staticmethod
+    def years() -> List[Dict]:
+        """
+        List the years and months that have recordings, newest first.
+
+        Returns:
+            List of {'year', 'count', 'months': [{'month', 'count'}]}
+        """
+        rows = db.session.execute(
+            select(RecordingArchive.year, RecordingArchive.month, RecordingArchive.count)
+            .where(RecordingArchive.count > 0)
+            .order_by(RecordingArchive.year.desc(), RecordingArchive.month.desc())
+        ).all()
+
+        years = []
+        for year, month, count in rows:
+            if not years or years[-1]['year'] != year:
+                years.append({'year': year, 'count': 0, 'months': []})
+            years[-1]['count'] += count
+            years[-1]['months'].append({'month': month, 'count': count})
+        return years
+
+    @staticmethod
+    def rebuild() -> int:
+        """
+        Recount the archive from the recordings table.
+
+        The caller is responsible for committing.
+
+        Returns:
+            Number of months with recordings
+        """
+        db.session.execute(delete(RecordingArchive))
+        counts = {}
+        for recorded_date, in db.session.execute(select(Recording.recorded_date)):
+            key = (recorded_date.year, recorded_date.month)
+            counts[key] = counts.get(key, 0) + 1
+        if counts:
+            db.session.execute(insert(RecordingArchive), [
+                {'year': year, 'month': month, 'count': count}
+                for (year, month), count in counts.items()
+            ])
+        return len(counts)
+
+    @staticmethod
+    def _adjust(day: date, delta: int):
+        """Add delta to the count of a day's month within the current transaction."""
+        month = and_(RecordingArchive.year == day.year, RecordingArchive.month == day.month)
+        if delta < 0:
+            # A month without a row has nothing to take away from
+            db.session.execute(
+                update(RecordingArchive).where(month).values(count=RecordingArchive.count + delta)
+            )
+            return
+
+        dialect = db.engine.dialect.name
+        if dialect not in _UPSERT:
+            raise RuntimeError(f"The recording archive is not supported on '{dialect}'")
+
+        # One upsert, so two transactions adding a month's first recording at
+        # once both succeed instead of colliding on the primary key
+        statement = _UPSERT[dialect](RecordingArchive).values(
+            year=day.year, month=day.month, count=delta
+        )
+        db.session.execute(statement.on_conflict_do_update(
+            index_elements=[RecordingArchive.year, RecordingArchive.month],
+            set_={'count': RecordingArchive.count + statement.excluded.count},
+        ))
+
+recording_archive = RecordingArchiveIndex()
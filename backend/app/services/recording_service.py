@@ -2,7 +2,12 @@
 import re
 from typing import Dict, Optional
 from app.extensions import db
-from app.models import Recording, Session
+from app.models import Recording, Session, CacheVersion
+from app.services.home_snapshot import home_snapshot
+from app.services.catalog import catalog
+from app.services.recording_archive import recording_archive
+from app.services.session_listings import session_listings
+from app.services.response_cache import response_cache, RECORDINGS, SESSIONS
 from app.utils.errors import ValidationError, NotFoundError
 
 
@@ -49,7 +54,13 @@ class RecordingService:
         )
 
         db.session.add(recording)
+        recording_archive.record(None, recording.recorded_date)
+        session_listings.index_sessions([session_id])
+        CacheVersion.bump(RECORDINGS, SESSIONS)
+        home_snapshot.invalidate()
+        catalog.invalidate()
         db.session.commit()
+        response_cache.purge(RECORDINGS, SESSIONS)
         return recording
 
     @staticmethod
@@ -83,9 +94,15 @@ class RecordingService:
             recording.pdf_url = data['pdf_url']
 
         if 'recorded_date' in data:
+            recording_archive.record(recording.recorded_date, data['recorded_date'])
             recording.recorded_date = data['recorded_date']
 
+        session_listings.index_sessions([recording.session_id])
+        CacheVersion.bump(RECORDINGS, SESSIONS)
+        home_snapshot.invalidate()
+        catalog.invalidate()
         db.session.commit()
+        response_cache.purge(RECORDINGS, SESSIONS)
         return recording
 
     @staticmethod
@@ -112,7 +129,13 @@ class RecordingService:
             session.status = 'published'
 
         db.session.delete(recording)
+        recording_archive.record(recording.recorded_date, None)
+        session_listings.index_sessions([recording.session_id])
+        CacheVersion.bump(RECORDINGS, SESSIONS)
+        home_snapshot.invalidate()
+        catalog.invalidate()
         db.session.commit()
+        response_cache.purge(RECORDINGS, SESSIONS)
         return True
 
     @staticmethod
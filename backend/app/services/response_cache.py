@@ -0,0 +1,384 @@
+"""Server-side cache of anonymous public GET responses.
+
+Responses are keyed on the request path, the sorted query arguments and the
+current date, and tagged with the entity types they were built from
+(``sessions``, ``recordings``, ``tags``, ``speakers``). Service-layer writes
+purge the affected tags after committing. Only responses ordered by view
+count are also tagged ``views``, which every view counter flush purges;
+other payloads showing view counts refresh with the next content write or
+when their TTL runs out.
+
+Two backends are available through ``RESPONSE_CACHE_BACKEND``:
+
+- ``memory``: a per-process LRU. Purges only reach the worker that made the
+  write, so with several workers other processes serve entries until their
+  ``RESPONSE_CACHE_TTL`` runs out.
+- ``sqlite``: a SQLite file at ``RESPONSE_CACHE_PATH`` shared by every worker
+  on the host, so purges take effect everywhere.
+
+``none`` disables caching.
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from datetime import date
+from functools import wraps
+from typing import Callable, Dict, Iterable, Optional, Tuple
+from flask import Response, current_app, request
+from app.utils.metrics import record_cache_lookup
+
+# Entity tags
+SESSIONS = 'sessions'
+RECORDINGS = 'recordings'
+TAGS = 'tags'
+SPEAKERS = 'speakers'
+VIEWS = 'views'
+
+# Response headers worth replaying from the cache
+STORED_HEADERS = ('Content-Type', 'Content-Disposition', 'ETag', 'Last-Modified', 'Cache-Control')
+
+# (status, headers, body)
+Entry = Tuple[int, Dict[str, str], bytes]
+
+
+class CacheBackend:
+    """Interface of a response cache backend, with hit/miss counters."""
+
+    name = 'base'
+
+    def __init__(self, ttl: int, max_entries: int):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[Entry]:
+        """Return a live entry for key, or None."""
+        raise NotImplementedError
+
+    def set(self, key: str, entry: Entry, tags: Iterable[str]):
+        """Store an entry under key, tagged with entity types."""
+        raise NotImplementedError
+
+    def purge(self, tags: Iterable[str]) -> int:
+        """Drop every entry carrying any of the tags; return how many."""
+        raise NotImplementedError
+
+    def clear(self):
+        """Drop every entry."""
+        raise NotImplementedError
+
+    def size(self) -> int:
+        """Return the number of stored entries."""
+        raise NotImplementedError
+
+    def stats(self) -> Dict:
+        """Return hit/miss counters for this process and the entry count."""
+        lookups = self.hits + self.misses
+        return {
+            'backend': self.name,
+            'entries': self.size(),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': round(self.hits / lookups, 4) if lookups else None,
+        }
+
+
+class MemoryBackend(CacheBackend):
+    """Per-process LRU cache."""
+
+    name = 'memory'
+
+    def __init__(self, ttl: int, max_entries: int):
+        super().__init__(ttl, max_entries)
+        self._lock = threading.Lock()
+        # key -> (expires_at, tags, entry), least recently used first
+        self._entries = OrderedDict()
+
+    def get(self, key):
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None or item[0] < time.monotonic():
+                self._entries.pop(key, None)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return item[2]
+
+    def set(self, key, entry, tags):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, frozenset(tags), entry)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def purge(self, tags):
+        tags = set(tags)
+        with self._lock:
+            stale = [key for key, item in self._entries.items() if item[1] & tags]
+            for key in stale:
+                del self._entries[key]
+            return len(stale)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def size(self):
+        return len(self._entries)
+
+
+class SQLiteBackend(CacheBackend):
+    """Cache stored in a SQLite file shared by all worker processes."""
+
+    name = 'sqlite'
+
+    # Expired and excess entries are pruned on every Nth write
+    PRUNE_EVERY = 100
+
+    def __init__(self, ttl: int, max_entries: int, path: str):
+        super().__init__(ttl, max_entries)
+        self.path = path
+        self._local = threading.local()
+        self._writes = 0
+        with self._connect() as conn:
+            conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS entries (
+                    key TEXT PRIMARY KEY,
+                    expires_at REAL NOT NULL,
+                    status INTEGER NOT NULL,
+                    headers TEXT NOT NULL,
+                    body BLOB NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS entry_tags (
+                    tag TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    PRIMARY KEY (tag, key)
+                );
+                CREATE INDEX IF NOT EXISTS ix_entries_expires_at ON entries (expires_at);
+                """
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return this thread's connection, reopening it after a fork."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def get(self, key):
+        row = self._connect().execute(
+            'SELECT status, headers, body FROM entries WHERE key = ? AND expires_at >= ?',
+            (key, time.time())
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return row[0], json.loads(row[1]), row[2]
+
+    def set(self, key, entry, tags):
+        status, headers, body = entry
+        conn = self._connect()
+        with conn:
+            conn.execute('BEGIN IMMEDIATE')
+            conn.execute(
+                'INSERT OR REPLACE INTO entries (key, expires_at, status, headers, body) '
+                'VALUES (?, ?, ?, ?, ?)',
+                (key, time.time() + self.ttl, status, json.dumps(headers), body)
+            )
+            conn.executemany(
+                'INSERT OR IGNORE INTO entry_tags (tag, key) VALUES (?, ?)',
+                [(tag, key) for tag in tags]
+            )
+
+        self._writes += 1
+        if self._writes % self.PRUNE_EVERY == 0:
+            self._prune(conn)
+
+    def _prune(self, conn):
+        """Drop expired entries and the oldest ones beyond max_entries."""
+        with conn:
+            conn.execute('BEGIN IMMEDIATE')
+            conn.execute('DELETE FROM entries WHERE expires_at < ?', (time.time(),))
+            conn.execute(
+                'DELETE FROM entries WHERE key IN ('
+                'SELECT key FROM entries ORDER BY expires_at DESC LIMIT -1 OFFSET ?)',
+                (self.max_entries,)
+            )
+            conn.execute('DELETE FROM entry_tags WHERE key NOT IN (SELECT key FROM entries)')
+
+    def purge(self, tags):
+        tags = list(tags)
+        placeholders = ','.join('?' * len(tags))
+        conn = self._connect()
+        with conn:
+            conn.execute('BEGIN IMMEDIATE')
+            cursor = conn.execute(
+                f'DELETE FROM entries WHERE key IN '
+                f'(SELECT key FROM entry_tags WHERE tag IN ({placeholders}))',
+                tags
+            )
+            conn.execute(f'DELETE FROM entry_tags WHERE tag IN ({placeholders})', tags)
+            conn.execute('DELETE FROM entry_tags WHERE key NOT IN (SELECT key FROM entries)')
+            return cursor.rowcount
+
+    def clear(self):
+        conn = self._connect()
+        with conn:
+            conn.execute('BEGIN IMMEDIATE')
+            conn.execute('DELETE FROM entries')
+            conn.execute('DELETE FROM entry_tags')
+
+    def size(self):
+        return self._connect().execute('SELECT COUNT(*) FROM entries').fetchone()[0]
+
+
+class ResponseCache:
+    """Front end over the configured backend, bound to the Flask app."""
+
+    def __init__(self):
+        self.backend = None
+
+    def init_app(self, app):
+        """
+        Create the backend selected by the application config.
+
+        Args:
+            app: Flask application instance
+        """
+        name = app.config['RESPONSE_CACHE_BACKEND']
+        ttl = app.config['RESPONSE_CACHE_TTL']
+        max_entries = app.config['RESPONSE_CACHE_MAX_ENTRIES']
+
+        if name == 'memory':
+            self.backend = MemoryBackend(ttl, max_entries)
+        elif name == 'sqlite':
+            self.backend = SQLiteBackend(ttl, max_entries, app.config['RESPONSE_CACHE_PATH'])
+        elif name == 'none':
+            self.backend = None
+        else:
+            raise ValueError(f"Unknown RESPONSE_CACHE_BACKEND '{name}'")
+
+    def purge(self, *tags: str) -> int:
+        """
+        Drop cached responses built from any of the given entity types.
+
+        Call after the write has been committed.
+
+        Returns:
+            Number of entries dropped
+        """
+        if self.backend is None:
+            return 0
+        try:
+            return self.backend.purge(tags)
+        except sqlite3.Error:
+            current_app.logger.exception('Failed to purge response cache tags %s', tags)
+            return 0
+
+    def clear(self):
+        """Drop every cached response."""
+        if self.backend is not None:
+            self.backend.clear()
+
+    def stats(self) -> Dict:
+        """Return backend statistics."""
+        if self.backend is None:
+            return {'backend': 'none'}
+        return self.backend.stats()
+
+    @staticmethod
+    def _store(backend, key, entry, tags, logger):
+        try:
+            backend.set(key, entry, tags)
+        except sqlite3.Error:
+            logger.exception('Response cache store failed')
+
+    @classmethod
+    def _tee(cls, chunks, backend, key, headers, tags, logger):
+        """Pass a streamed body through, caching it if the client reads it to the end."""
+        body = []
+        try:
+            for chunk in chunks:
+                if isinstance(chunk, str):
+                    chunk = chunk.encode('utf-8')
+                body.append(chunk)
+                yield chunk
+            cls._store(backend, key, (200, headers, b''.join(body)), tags, logger)
+        finally:
+            if hasattr(chunks, 'close'):
+                chunks.close()
+
+    @staticmethod
+    def key() -> str:
+        """Build the cache key of the current request."""
+        args = '&'.join(f'{name}={value}' for name, value in sorted(request.args.items(multi=True)))
+        # Listings depend on what is "upcoming", which changes at midnight
+        return f'{request.path}?{args}#{date.today().isoformat()}'
+
+    def cached(self, *tags: str, request_tags: Optional[Callable[[], Iterable[str]]] = None):
+        """
+        Decorator caching an anonymous GET endpoint's successful responses.
+
+        Requests carrying credentials bypass the cache. Cached responses are
+        still answered with 304 when If-None-Match matches their ETag.
+
+        Args:
+            *tags: Entity types the response is built from
+            request_tags: Callable returning further entity types that depend
+                on the current request's arguments
+        """
+        def decorator(fn):
+            @wraps(fn)
+            def wrapper(*args, **kwargs):
+                backend = self.backend
+                if backend is None or request.method != 'GET' or 'Authorization' in request.headers:
+                    return fn(*args, **kwargs)
+
+                key = self.key()
+                try:
+                    entry = backend.get(key)
+                except sqlite3.Error:
+                    current_app.logger.exception('Response cache lookup failed')
+                    return fn(*args, **kwargs)
+
+                record_cache_lookup('response', entry is not None)
+                if entry is not None:
+                    status, headers, body = entry
+                    response = Response(body, status=status, headers=headers)
+                    return response.make_conditional(request)
+
+                response = current_app.make_response(fn(*args, **kwargs))
+                if response.status_code == 200:
+                    stored_tags = tags + tuple(request_tags()) if request_tags else tags
+                    headers = {
+                        name: response.headers[name]
+                        for name in STORED_HEADERS if name in response.headers
+                    }
+                    if response.is_streamed:
+                        # Store the body once it has been streamed in full
+                        response.response = self._tee(
+                            response.response, backend, key, headers, stored_tags, current_app.logger
+                        )
+                    else:
+                        self._store(
+                            backend, key, (200, headers, response.get_data()), stored_tags, current_app.logger
+                        )
+                return response
+
+            return wrapper
+
+        return decorator
+
+
+response_cache = ResponseCache()
@@ -0,0 +1,246 @@
+"""Full-text search index for sessions.
+
+Each session has one document in the ``session_search`` table built from its
+title, summary, abstract, speaker name and tag labels. On SQLite the table is
+an FTS5 virtual table; on PostgreSQL it holds a weighted ``tsvector`` with a
+GIN index. Services update documents in the same transaction as the write
+that changed them. The table is created (and backfilled) by a migration, and
+``flask search-index rebuild`` repopulates it from scratch (e.g. after
+seeding or a bulk import).
+
+Matches carry a relevance score (weighted ``bm25()`` on SQLite, ``ts_rank()``
+on PostgreSQL) that listings order by with ``sort_by=relevance``. Recordings
+are searched through their session, so they share the index.
+"""
+import re
+from typing import Iterable, List
+from sqlalchemy import DDL, Float, String, bindparam, event, false, or_, text
+from sqlalchemy.orm import joinedload
+from app.extensions import db
+from app.models import Session
+
+TABLE_NAME = 'session_search'
+REBUILD_BATCH_SIZE = 500
+
+_SQLITE_DDL = (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {TABLE_NAME} USING fts5("
+    "session_id UNINDEXED, title, summary, abstract, speaker, tags, "
+    "tokenize = 'unicode61 remove_diacritics 2')",
+)
+
+_POSTGRES_DDL = (
+    f"CREATE TABLE IF NOT EXISTS {TABLE_NAME} ("
+    "session_id VARCHAR(36) PRIMARY KEY REFERENCES sessions(id) ON DELETE CASCADE, "
+    "document TSVECTOR NOT NULL)",
+    f"CREATE INDEX IF NOT EXISTS ix_{TABLE_NAME}_document ON {TABLE_NAME} USING GIN (document)",
+)
+
+_INSERT = {
+    'sqlite': (
+        f"INSERT INTO {TABLE_NAME} (session_id, title, summary, abstract, speaker, tags) "
+        "VALUES (:session_id, :title, :summary, :abstract, :speaker, :tags)"
+    ),
+    'postgresql': (
+        f"INSERT INTO {TABLE_NAME} (session_id, document) VALUES (:session_id, "
+        "setweight(to_tsvector('simple', :title), 'A') || "
+        "setweight(to_tsvector('simple', :speaker), 'A') || "
+        "setweight(to_tsvector('simple', :tags), 'B') || "
+        "setweight(to_tsvector('simple', :summary), 'B') || "
+        "setweight(to_tsvector('simple', :abstract), 'C'))"
+    ),
+}
+
+# Matching sessions with a relevance score, higher is better. bm25() scores
+# lower-is-better and takes one weight per column (session_id, title, summary,
+# abstract, speaker, tags); the weights follow PostgreSQL's ts_rank defaults
+# for the setweight classes above (A 1.0, B 0.4, C 0.2).
+_MATCH = {
+    'sqlite': (
+        f"SELECT session_id, -bm25({TABLE_NAME}, 0, 1.0, 0.4, 0.2, 1.0, 0.4) AS relevance "
+        f"FROM {TABLE_NAME} WHERE {TABLE_NAME} MATCH :query"
+    ),
+    'postgresql': (
+        f"SELECT session_id, ts_rank(document, to_tsquery('simple', :query)) AS relevance "
+        f"FROM {TABLE_NAME} WHERE document @@ to_tsquery('simple', :query)"
+    ),
+}
+
+for _statement in _SQLITE_DDL:
+    event.listen(db.metadata, 'after_create', DDL(_statement).execute_if(dialect='sqlite'))
+for _statement in _POSTGRES_DDL:
+    event.listen(db.metadata, 'after_create', DDL(_statement).execute_if(dialect='postgresql'))
+event.listen(
+    db.metadata, 'before_drop',
+    DDL(f'DROP TABLE IF EXISTS {TABLE_NAME}').execute_if(dialect=('sqlite', 'postgresql'))
+)
+
+
+class SearchIndex:
+    """Maintains and queries the session full-text index."""
+
+    @staticmethod
+    def _dialect() -> str:
+        """Return the active dialect name, rejecting unsupported databases."""
+        name = db.engine.dialect.name
+        if name not in _INSERT:
+            raise RuntimeError(f"Full-text search is not supported on '{name}'")
+        return name
+
+    @staticmethod
+    def tokenize(term: str) -> List[str]:
+        """
+        Split a search string into lowercase word tokens.
+
+        Args:
+            term: Raw search input
+
+        Returns:
+            List of tokens (punctuation and operators are dropped)
+        """
+        return re.findall(r'\w+', term.lower())
+
+    def build_query(self, term: str) -> str:
+        """
+        Build a prefix-matching full-text query requiring every token.
+
+        Args:
+            term: Raw search input
+
+        Returns:
+            Query string in the active dialect's syntax
+        """
+        tokens = self.tokenize(term)
+        if self._dialect() == 'sqlite':
+            return ' '.join(f'"{token}"*' for token in tokens)
+        return ' & '.join(f'{token}:*' for token in tokens)
+
+    def match(self, term: str):
+        """
+        Build a subquery of sessions matching a search string.
+
+        Args:
+            term: Raw search input
+
+        Returns:
+            Subquery with ``session_id`` and ``relevance`` (higher is better)
+            columns, or None if the input has no searchable words
+        """
+        if not self.tokenize(term):
+            return None
+        return (
+            text(_MATCH[self._dialect()])
+            .bindparams(bindparam('query', self.build_query(term)))
+            .columns(session_id=String, relevance=Float)
+            .subquery('search_match')
+        )
+
+    def filter(self, query, term: str, session_id_column=None, ranked: bool = False):
+        """
+        Restrict a listing query to rows whose session matches a search string.
+
+        Args:
+            query: Query over sessions or over a model joined to sessions
+            term: Raw search input
+            session_id_column: Column holding the session ID (default: Session.id)
+            ranked: Order the rows by relevance, best match first; later
+                order_by() calls only break ties
+
+        Returns:
+            Filtered query (matches nothing if the input has no searchable words)
+        """
+        if session_id_column is None:
+            session_id_column = Session.id
+
+        matches = self.match(term)
+        if matches is None:
+            return query.filter(false())
+        query = query.join(matches, matches.c.session_id == session_id_column)
+        if ranked:
+            query = query.order_by(matches.c.relevance.desc())
+        return query
+
+    def index_sessions(self, session_ids: Iterable[str]):
+        """
+        (Re)build the documents of the given sessions in the current transaction.
+
+        Args:
+            session_ids: IDs of sessions to index; missing sessions are removed
+        """
+        session_ids = [session_id for session_id in set(session_ids) if session_id]
+        if not session_ids:
+            return
+
+        self.remove_sessions(session_ids)
+        sessions = Session.query.options(
+            joinedload(Session.speaker),
+            joinedload(Session.organ_tag),
+            joinedload(Session.type_tag),
+            joinedload(Session.level_tag),
+        ).filter(Session.id.in_(session_ids)).all()
+        if sessions:
+            db.session.execute(
+                text(_INSERT[self._dialect()]),
+                [self._document(session) for session in sessions]
+            )
+
+    def index_speaker(self, speaker_id: str):
+        """Reindex every session presented by a speaker."""
+        self.index_sessions(
+            row.id for row in db.session.query(Session.id).filter(Session.speaker_id == speaker_id)
+        )
+
+    def index_tag(self, tag_id: str):
+        """Reindex every session carrying a tag."""
+        self.index_sessions(
+            row.id for row in db.session.query(Session.id).filter(or_(
+                Session.organ_tag_id == tag_id,
+                Session.type_tag_id == tag_id,
+                Session.level_tag_id == tag_id
+            ))
+        )
+
+    def remove_sessions(self, session_ids: Iterable[str]):
+        """Delete the documents of the given sessions in the current transaction."""
+        session_ids = list(session_ids)
+        if not session_ids:
+            return
+        db.session.execute(
+            text(f'DELETE FROM {TABLE_NAME} WHERE session_id IN :session_ids')
+            .bindparams(bindparam('session_ids', expanding=True)),
+            {'session_ids': session_ids}
+        )
+
+    def rebuild(self) -> int:
+        """
+        Create the index table if needed and reindex every session.
+
+        The caller is responsible for committing.
+
+        Returns:
+            Number of sessions indexed
+        """
+        statements = _SQLITE_DDL if self._dialect() == 'sqlite' else _POSTGRES_DDL
+        for statement in statements:
+            db.session.execute(text(statement))
+        db.session.execute(text(f'DELETE FROM {TABLE_NAME}'))
+
+        session_ids = [row.id for row in db.session.query(Session.id).order_by(Session.id)]
+        for start in range(0, len(session_ids), REBUILD_BATCH_SIZE):
+            self.index_sessions(session_ids[start:start + REBUILD_BATCH_SIZE])
+        return len(session_ids)
+
+    @staticmethod
+    def _document(session: Session) -> dict:
+        """Collect the searchable text of a session."""
+        tags = [session.organ_tag, session.type_tag, session.level_tag]
+        return {
+            'session_id': session.id,
+            'title': session.title or '',
+            'summary': session.summary or '',
+            'abstract': session.abstract or '',
+            'speaker': session.speaker.name if session.speaker else '',
+            'tags': ' '.join(tag.label for tag in tags if tag),
+        }
+
+
+search_index = SearchIndex()
@@ -0,0 +1,330 @@
+"""Denormalized read model behind the public session and recording listings.
+
+The ``session_listings`` table has one row per session holding what the
+public listings filter, sort and count on: status, date and time, the tag
+IDs, the speaker's name and designation, the three tag labels, and the
+session's recording ID, recorded date and view count. Upcoming sessions,
+recordings and their facet counts are selected from this table alone, with
+no joins to speakers, tags or recordings; only the page itself is then
+loaded by primary key with the usual eager-loading options.
+
+Rows are kept current in the same transaction as the write they mirror:
+
+- session and recording writes re-copy the affected sessions' rows;
+- speaker and tag updates rewrite the copied names and labels in place;
+- replacing a tag on delete moves its sessions to the replacement;
+- flushed view counts are added to ``views_count``.
+
+``flask session-listings check`` compares every row against the source
+tables, and ``flask session-listings rebuild`` recreates them (e.g. after a
+bulk import).
+"""
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from sqlalchemy import and_, bindparam, delete, insert, select, update
+from sqlalchemy.orm import aliased
+from app.extensions import db
+from app.models import Session, Speaker, Tag, Recording, SessionListing
+from app.services.recording_archive import recorded_in_year
+from app.services.search_index import search_index
+from app.utils.pagination import paginate, load_by_ids
+
+# Listing page: (items, total count or None, next cursor or None)
+Page = Tuple[List, Optional[int], Optional[str]]
+
+# Sort keys as (column, descending) pairs. Their values match the session and
+# recording sort keys in session_service, so cursors work with either.
+UPCOMING_LISTING_SORT = (
+    (SessionListing.date, False),
+    (SessionListing.time, False),
+    (SessionListing.session_id, False),
+)
+RECORDING_LISTING_SORTS = {
+    'newest': ((SessionListing.recorded_date, True), (SessionListing.recording_id, True)),
+    'oldest': ((SessionListing.recorded_date, False), (SessionListing.recording_id, False)),
+    'most_viewed': ((SessionListing.views_count, True), (SessionListing.recording_id, True)),
+}
+
+# Sort of searched listings, best match first. Scores are not stable cursor
+# keys, so these listings page by number only; ties keep the default order.
+RELEVANCE = 'relevance'
+
+# Read model columns, in the order source_query() selects them
+COLUMNS = (
+    'session_id', 'status', 'date', 'time',
+    'speaker_id', 'speaker_name', 'speaker_designation',
+    'organ_tag_id', 'organ_tag_label',
+    'type_tag_id', 'type_tag_label',
+    'level_tag_id', 'level_tag_label',
+    'recording_id', 'recorded_date', 'views_count',
+)
+
+
+class SessionListings:
+    """Maintains and queries the session listing read model."""
+
+    @staticmethod
+    def source_query(session_ids: Optional[Sequence[str]] = None):
+        """
+        Build the select computing read model rows from the source tables.
+
+        Args:
+            session_ids: Restrict to these sessions (default: every session)
+
+        Returns:
+            Select of COLUMNS, ordered by session ID
+        """
+        organ_tag, type_tag, level_tag = aliased(Tag), aliased(Tag), aliased(Tag)
+        query = (
+            select(
+                Session.id, Session.status, Session.date, Session.time,
+                Session.speaker_id, Speaker.name, Speaker.designation,
+                Session.organ_tag_id, organ_tag.label,
+                Session.type_tag_id, type_tag.label,
+                Session.level_tag_id, level_tag.label,
+                Recording.id, Recording.recorded_date, Recording.views_count,
+            )
+            .join(Speaker, Session.speaker_id == Speaker.id)
+            .join(organ_tag, Session.organ_tag_id == organ_tag.id)
+            .join(type_tag, Session.type_tag_id == type_tag.id)
+            .join(level_tag, Session.level_tag_id == level_tag.id)
+            .outerjoin(Recording, Recording.session_id == Session.id)
+            .order_by(Session.id)
+        )
+        if session_ids is not None:
+            query = query.where(Session.id.in_(session_ids))
+        return query
+
+    def index_sessions(self, session_ids: Iterable[str]):
+        """
+        Re-copy the rows of the given sessions in the current transaction.
+
+        Call after the ORM changes have been made; they are flushed first.
+
+        Args:
+            session_ids: IDs of sessions to copy; missing sessions are removed
+        """
+        session_ids = [session_id for session_id in set(session_ids) if session_id]
+        if not session_ids:
+            return
+
+        db.session.flush()
+        self.remove_sessions(session_ids)
+        db.session.execute(
+            insert(SessionListing).from_select(COLUMNS, self.source_query(session_ids))
+        )
+
+    @staticmethod
+    def remove_sessions(session_ids: Iterable[str]):
+        """Delete the rows of the given sessions in the current transaction."""
+        session_ids = list(session_ids)
+        if not session_ids:
+            return
+        db.session.execute(
+            delete(SessionListing).where(SessionListing.session_id.in_(session_ids))
+        )
+
+    @staticmethod
+    def index_speaker(speaker: Speaker):
+        """Rewrite a speaker's name and designation on their sessions' rows."""
+        db.session.execute(
+            update(SessionListing)
+            .where(SessionListing.speaker_id == speaker.id)
+            .values(speaker_name=speaker.name, speaker_designation=speaker.designation)
+        )
+
+    @staticmethod
+    def index_tag(tag: Tag):
+        """Rewrite a tag's label on the rows of the sessions carrying it."""
+        SessionListings.replace_tag(tag, tag)
+
+    @staticmethod
+    def replace_tag(tag: Tag, replacement: Tag):
+        """
+        Move the rows carrying a tag to another tag of the same category.
+
+        Args:
+            tag: Tag to replace
+            replacement: Tag taking its place (the tag itself to relabel it)
+        """
+        id_column = getattr(SessionListing, f'{tag.category}_tag_id')
+        db.session.execute(
+            update(SessionListing)
+            .where(id_column == tag.id)
+            .values({
+                f'{tag.category}_tag_id': replacement.id,
+                f'{tag.category}_tag_label': replacement.label,
+            })
+        )
+
+    @staticmethod
+    def record_views(params: List[Dict]):
+        """
+        Add flushed view counts in the current transaction.
+
+        Args:
+            params: List of {'recording' (recording ID), 'views'} dictionaries
+        """
+        table = SessionListing.__table__
+        db.session.execute(
+            update(table)
+            .where(table.c.recording_id == bindparam('recording'))
+            .values(views_count=table.c.views_count + bindparam('views')),
+            params
+        )
+
+    def rebuild(self) -> int:
+        """
+        Recreate every row from the source tables.
+
+        The caller is responsible for committing.
+
+        Returns:
+            Number of sessions copied
+        """
+        db.session.execute(delete(SessionListing))
+        db.session.execute(insert(SessionListing).from_select(COLUMNS, self.source_query()))
+        return db.session.query(SessionListing).count()
+
+    def check(self) -> Dict[str, List[str]]:
+        """
+        Compare every row against the source tables.
+
+        Returns:
+            Dictionary of session IDs that are missing from the read model,
+            orphaned (no longer a session) or stale (differing in any column)
+        """
+        expected = {row[0]: tuple(row) for row in db.session.execute(self.source_query())}
+        actual = {
+            row[0]: tuple(row)
+            for row in db.session.execute(
+                select(*[getattr(SessionListing, name) for name in COLUMNS])
+            )
+        }
+        return {
+            'missing': sorted(expected.keys() - actual.keys()),
+            'orphaned': sorted(actual.keys() - expected.keys()),
+            'stale': sorted(
+                session_id for session_id in expected.keys() & actual.keys()
+                if expected[session_id] != actual[session_id]
+            ),
+        }
+
+    @staticmethod
+    def upcoming_query(filters: Optional[Dict] = None, ranked: bool = False):
+        """
+        Build the filtered query of upcoming published sessions.
+
+        Args:
+            filters: Optional tag filters and search
+            ranked: Order searches by relevance
+
+        Returns:
+            SessionListing query, unordered unless ranked
+        """
+        query = SessionListing.query.filter(
+            and_(
+                SessionListing.status == 'published',
+                SessionListing.date >= date.today()
+            )
+        )
+        return SessionListings._filter(query, filters, ranked)
+
+    @staticmethod
+    def recordings_query(filters: Optional[Dict] = None, ranked: bool = False):
+        """
+        Build the filtered query of sessions with a recording.
+
+        Args:
+            filters: Optional tag and year filters and search
+            ranked: Order searches by relevance
+
+        Returns:
+            SessionListing query, unordered unless ranked
+        """
+        query = SessionListing.query.filter(SessionListing.recording_id.isnot(None))
+        if filters and filters.get('year'):
+            query = query.filter(recorded_in_year(filters['year'], SessionListing.recorded_date))
+        return SessionListings._filter(query, filters, ranked)
+
+    def upcoming(self, filters: Optional[Dict], pagination: Dict,
+                 load_options: Optional[Sequence] = None, sort_by: Optional[str] = None) -> Page:
+        """
+        Paginate upcoming published sessions, ordered soonest first.
+
+        Args:
+            filters: Optional tag filters and search
+            pagination: Dictionary with page, per_page, cursor and with_total
+            load_options: Loader options of the page query (default: the full listing's)
+            sort_by: RELEVANCE to order a search by best match first
+
+        Returns:
+            Tuple of (list of sessions, total count or None, next cursor or None)
+        """
+        from app.services.session_service import SessionService, SESSION_LOAD_OPTIONS
+
+        ranked = sort_by == RELEVANCE
+        if ranked:
+            pagination = self._page_numbers(pagination)
+        rows, total, next_cursor = paginate(
+            self.upcoming_query(filters, ranked), UPCOMING_LISTING_SORT, **pagination
+        )
+        if ranked:
+            next_cursor = None
+        items = load_by_ids(
+            SessionService.listing_query(load_options or SESSION_LOAD_OPTIONS),
+            Session, [row.session_id for row in rows]
+        )
+        return items, total, next_cursor
+
+    def recordings(self, filters: Optional[Dict], sort_by: str, pagination: Dict,
+                   load_options: Optional[Sequence] = None) -> Page:
+        """
+        Paginate recordings in one of the RECORDING_LISTING_SORTS orders, or by relevance.
+
+        Args:
+            filters: Optional tag and year filters and search
+            sort_by: newest, oldest, most_viewed or RELEVANCE (searches only)
+            pagination: Dictionary with page, per_page, cursor and with_total
+            load_options: Loader options of the page query (default: the full listing's)
+
+        Returns:
+            Tuple of (list of recordings, total count or None, next cursor or None)
+        """
+        from app.services.session_service import SessionService, RECORDING_LOAD_OPTIONS
+
+        ranked = sort_by == RELEVANCE
+        if ranked:
+            pagination = self._page_numbers(pagination)
+            sort_by = 'newest'
+        rows, total, next_cursor = paginate(
+            self.recordings_query(filters, ranked), RECORDING_LISTING_SORTS[sort_by], **pagination
+        )
+        if ranked:
+            next_cursor = None
+        items = load_by_ids(
+            SessionService.recording_listing_query(load_options or RECORDING_LOAD_OPTIONS),
+            Recording, [row.recording_id for row in rows]
+        )
+        return items, total, next_cursor
+
+    @staticmethod
+    def _page_numbers(pagination: Dict) -> Dict:
+        """Switch pagination to page numbers, for orders that cannot be keyset-paged."""
+        return dict(pagination, cursor=None, with_total=True)
+
+    @staticmethod
+    def _filter(query, filters: Optional[Dict], ranked: bool = False):
+        """Apply the tag filters and search shared by both listings."""
+        filters = filters or {}
+        for name in ('organ_tag_id', 'type_tag_id', 'level_tag_id'):
+            if name in filters:
+                query = query.filter(getattr(SessionListing, name) == filters[name])
+
+        search = filters.get('search', '').strip()
+        if search:
+            query = search_index.filter(query, search, SessionListing.session_id, ranked)
+        return query
+
+
+session_listings = SessionListings()
@@ -1,15 +1,165 @@
 """Session service for business logic."""
 from datetime import datetime, date
-from typing import List, Dict, Optional
-from sqlalchemy import and_, or_, desc
+from typing import List, Dict, Optional, Sequence
+from sqlalchemy import and_
+from sqlalchemy.orm import joinedload, contains_eager
 from app.extensions import db
-from app.models import Session, Speaker, Tag
+from app.models import Session, Speaker, Recording, CacheVersion
+from app.schemas import SessionResponseSchema, RecordingResponseSchema
+from app.schemas.serializers import (
+    serialize_session, serialize_recording_with_session, session_serializer, recording_serializer
+)
+from app.services.search_index import search_index
+from app.services.tag_registry import tag_registry
+from app.services.home_snapshot import home_snapshot
+from app.services.catalog import catalog
+from app.services.recording_archive import recorded_in_year
+from app.services.session_listings import session_listings
+from app.services.calendar_service import ics_cache
+from app.services.response_cache import response_cache, RECORDINGS, SESSIONS
 from app.utils.errors import ValidationError, NotFoundError
+from app.utils.fieldsets import Fieldset, Fieldsets
+from app.utils.pagination import paginate
+
+
+# Eager-loading strategies for every relationship a serialized session touches.
+# All of them are many-to-one (or one-to-one), so joining them in does not
+# multiply rows and LIMIT/OFFSET keep working on the main query.
+SESSION_LOAD_OPTIONS = (
+    joinedload(Session.speaker),
+    joinedload(Session.organ_tag),
+    joinedload(Session.type_tag),
+    joinedload(Session.level_tag),
+    joinedload(Session.recording),
+)
+
+# Recording listings already join sessions for filtering, so reuse that join
+# for the session itself and pull the session's speaker and tags in alongside.
+RECORDING_LOAD_OPTIONS = (
+    contains_eager(Recording.session).options(
+        joinedload(Session.speaker),
+        joinedload(Session.organ_tag),
+        joinedload(Session.type_tag),
+        joinedload(Session.level_tag),
+    ),
+)
+
+# Sort keys as (column, descending) pairs. Each ends with the primary key so
+# the ordering is total, which keyset (cursor) pagination relies on.
+UPCOMING_SESSION_SORT = (
+    (Session.date, False),
+    (Session.time, False),
+    (Session.id, False),
+)
+RECENT_SESSION_SORT = (
+    (Session.date, True),
+    (Session.time, True),
+    (Session.id, True),
+)
+RECORDING_SORTS = {
+    'newest': ((Recording.recorded_date, True), (Recording.id, True)),
+    'oldest': ((Recording.recorded_date, False), (Recording.id, False)),
+    'most_viewed': ((Recording.views_count, True), (Recording.id, True)),
+}
+
+# Sparse fieldsets (``fields=``) of the session and recording listings. The
+# card presets carry what a list card shows; sort key columns are always
+# loaded so cursors can be encoded.
+SESSION_FIELDSETS = Fieldsets(
+    Session,
+    SessionResponseSchema,
+    full=Fieldset(SESSION_LOAD_OPTIONS, serialize_session),
+    serializer=session_serializer,
+    presets={
+        'card': (
+            'id', 'title', 'summary', 'date', 'time', 'duration_minutes', 'status', 'platform',
+            'speaker', 'organ_tag', 'type_tag', 'level_tag', 'has_recording',
+        ),
+    },
+    required=(Session.date, Session.time),
+    depends={'has_recording': 'recording'},
+)
+RECORDING_FIELDSETS = Fieldsets(
+    Recording,
+    RecordingResponseSchema,
+    full=Fieldset(RECORDING_LOAD_OPTIONS, serialize_recording_with_session),
+    serializer=recording_serializer,
+    presets={
+        'card': (
+            'id', 'session_id', 'thumbnail_url', 'recorded_date', 'views_count',
+            'session.id', 'session.title', 'session.date', 'session.duration_minutes', 'session.speaker',
+        ),
+    },
+    strategies={'session': contains_eager},
+    required=(Recording.recorded_date, Recording.views_count),
+)
 
 
 class SessionService:
     """Service class for session-related operations."""
 
+    @staticmethod
+    def listing_query(load_options: Sequence = SESSION_LOAD_OPTIONS):
+        """
+        Build the base query for session listings.
+
+        Relationships needed for serialization are eager loaded, so a page
+        costs a fixed number of queries regardless of its size.
+
+        Args:
+            load_options: Loader options, narrower for sparse fieldsets
+
+        Returns:
+            Session query with eager-loading options applied
+        """
+        return Session.query.options(*load_options)
+
+    @staticmethod
+    def recording_listing_query(load_options: Sequence = RECORDING_LOAD_OPTIONS):
+        """
+        Build the base query for recording listings.
+
+        The query is joined to sessions, so callers can filter and search on
+        session columns directly.
+
+        Args:
+            load_options: Loader options, narrower for sparse fieldsets
+
+        Returns:
+            Recording query with eager-loading options applied
+        """
+        return Recording.query.join(Recording.session).options(*load_options)
+
+    @staticmethod
+    def _paginate(query, sort_keys, pagination: Optional[Dict]):
+        """
+        Order a listing query and apply offset or cursor pagination.
+
+        Args:
+            query: Filtered listing query
+            sort_keys: Sequence of (column, descending) pairs
+            pagination: Dictionary with page, per_page, cursor and with_total,
+                or None to return every row
+
+        Returns:
+            Tuple of (list of items, total count or None, next cursor or None)
+        """
+        if not pagination:
+            items = query.order_by(*[
+                column.desc() if descending else column.asc()
+                for column, descending in sort_keys
+            ]).all()
+            return items, len(items), None
+
+        return paginate(
+            query,
+            sort_keys,
+            page=pagination.get('page', 1),
+            per_page=pagination.get('per_page', 20),
+            cursor=pagination.get('cursor'),
+            with_total=pagination.get('with_total', True)
+        )
+
     @staticmethod
     def create_session(data: Dict, admin_id: str) -> Session:
         """
@@ -32,15 +182,15 @@ class SessionService:
             raise NotFoundError(f"Speaker with id {data.get('speaker_id')} not found")
 
         # Validate tags exist and are active
-        organ_tag = Tag.query.get(data.get('organ_tag_id'))
+        organ_tag = tag_registry.get(data.get('organ_tag_id'))
         if not organ_tag or organ_tag.category != 'organ' or not organ_tag.is_active:
             raise ValidationError("Invalid or inactive organ tag")
 
-        type_tag = Tag.query.get(data.get('type_tag_id'))
+        type_tag = tag_registry.get(data.get('type_tag_id'))
         if not type_tag or type_tag.category != 'type' or not type_tag.is_active:
             raise ValidationError("Invalid or inactive type tag")
 
-        level_tag = Tag.query.get(data.get('level_tag_id'))
+        level_tag = tag_registry.get(data.get('level_tag_id'))
         if not level_tag or level_tag.category != 'level' or not level_tag.is_active:
             raise ValidationError("Invalid or inactive level tag")
 
@@ -66,7 +216,14 @@ class SessionService:
         )
 
         db.session.add(session)
+        db.session.flush()
+        search_index.index_sessions([session.id])
+        session_listings.index_sessions([session.id])
+        CacheVersion.bump(SESSIONS)
+        home_snapshot.invalidate()
+        catalog.invalidate()
         db.session.commit()
+        response_cache.purge(SESSIONS)
         return session
 
     @staticmethod
@@ -126,30 +283,37 @@ class SessionService:
 
         # Validate and update tags
         if 'organ_tag_id' in data:
-            tag = Tag.query.get(data['organ_tag_id'])
+            tag = tag_registry.get(data['organ_tag_id'])
             if not tag or tag.category != 'organ' or not tag.is_active:
                 raise ValidationError("Invalid or inactive organ tag")
             session.organ_tag_id = data['organ_tag_id']
 
         if 'type_tag_id' in data:
-            tag = Tag.query.get(data['type_tag_id'])
+            tag = tag_registry.get(data['type_tag_id'])
             if not tag or tag.category != 'type' or not tag.is_active:
                 raise ValidationError("Invalid or inactive type tag")
             session.type_tag_id = data['type_tag_id']
 
         if 'level_tag_id' in data:
-            tag = Tag.query.get(data['level_tag_id'])
+            tag = tag_registry.get(data['level_tag_id'])
             if not tag or tag.category != 'level' or not tag.is_active:
                 raise ValidationError("Invalid or inactive level tag")
             session.level_tag_id = data['level_tag_id']
 
+        search_index.index_sessions([session.id])
+        session_listings.index_sessions([session.id])
+        CacheVersion.bump(SESSIONS)
+        home_snapshot.invalidate()
+        catalog.invalidate()
         db.session.commit()
+        response_cache.purge(SESSIONS)
+        ics_cache.invalidate(session.id)
         return session
 
     @staticmethod
     def get_session(session_id: str) -> Session:
         """
-        Get a session by ID.
+        Get a session by ID, with the relationships serialization needs.
 
         Args:
             session_id: ID of the session
@@ -160,7 +324,7 @@ class SessionService:
         Raises:
             NotFoundError: If session not found
         """
-        session = Session.query.get(session_id)
+        session = SessionService.listing_query().filter(Session.id == session_id).first()
         if not session:
             raise NotFoundError(f"Session with id {session_id} not found")
         return session
@@ -168,19 +332,21 @@ class SessionService:
     @staticmethod
     def list_sessions(
         filters: Optional[Dict] = None,
-        pagination: Optional[Dict] = None
-    ) -> tuple[List[Session], int]:
+        pagination: Optional[Dict] = None,
+        load_options: Sequence = SESSION_LOAD_OPTIONS
+    ) -> tuple[List[Session], Optional[int], Optional[str]]:
         """
         List sessions with optional filters and pagination.
 
         Args:
             filters: Dictionary of filter criteria (status, speaker_id, tag_id, etc.)
-            pagination: Dictionary with page and per_page
+            pagination: Dictionary with page, per_page and optionally cursor and with_total
+            load_options: Loader options, narrower for sparse fieldsets
 
         Returns:
-            Tuple of (list of sessions, total count)
+            Tuple of (list of sessions, total count or None, next cursor or None)
         """
-        query = Session.query
+        query = SessionService.listing_query(load_options)
 
         # Apply filters
         if filters:
@@ -195,33 +361,22 @@ class SessionService:
             if 'level_tag_id' in filters:
                 query = query.filter(Session.level_tag_id == filters['level_tag_id'])
 
-        # Order by date descending
-        query = query.order_by(desc(Session.date), desc(Session.time))
-
-        # Get total count
-        total = query.count()
-
-        # Apply pagination
-        if pagination:
-            page = pagination.get('page', 1)
-            per_page = pagination.get('per_page', 20)
-            query = query.limit(per_page).offset((page - 1) * per_page)
-
-        sessions = query.all()
-        return sessions, total
+        # Order by date descending (most recent first)
+        return SessionService._paginate(query, RECENT_SESSION_SORT, pagination)
 
     @staticmethod
-    def list_upcoming_sessions(filters: Optional[Dict] = None) -> List[Session]:
+    def upcoming_query(filters: Optional[Dict] = None, load_options: Sequence = SESSION_LOAD_OPTIONS):
         """
-        List upcoming sessions (published, date >= today).
+        Build the filtered query behind upcoming session listings.
 
         Args:
-            filters: Optional additional filters
+            filters: Optional tag filters and search
+            load_options: Loader options, narrower for sparse fieldsets
 
         Returns:
-            List of upcoming sessions
+            Unordered query of published sessions dated today or later
         """
-        query = Session.query.filter(
+        query = SessionService.listing_query(load_options).filter(
             and_(
                 Session.status == 'published',
                 Session.date >= date.today()
@@ -237,26 +392,47 @@ class SessionService:
             if 'level_tag_id' in filters:
                 query = query.filter(Session.level_tag_id == filters['level_tag_id'])
 
-        # Order by date ascending (soonest first)
-        query = query.order_by(Session.date, Session.time)
-        return query.all()
+            # Apply search filter
+            search = filters.get('search', '').strip()
+            if search:
+                query = search_index.filter(query, search)
+
+        return query
 
     @staticmethod
-    def list_past_sessions(
+    def list_upcoming_sessions(
         filters: Optional[Dict] = None,
-        pagination: Optional[Dict] = None
-    ) -> tuple[List[Session], int]:
+        load_options: Sequence = SESSION_LOAD_OPTIONS
+    ) -> List[Session]:
         """
-        List past sessions (date < today) with search and pagination.
+        List upcoming sessions (published, date >= today).
 
         Args:
-            filters: Optional additional filters including search
-            pagination: Dictionary with page and per_page
+            filters: Optional additional filters
+            load_options: Loader options, narrower for sparse fieldsets
+
+        Returns:
+            List of upcoming sessions
+        """
+        query = SessionService.upcoming_query(filters, load_options)
+
+        # Order by date ascending (soonest first)
+        sessions, _, _ = SessionService._paginate(query, UPCOMING_SESSION_SORT, None)
+        return sessions
+
+    @staticmethod
+    def past_query(filters: Optional[Dict] = None, load_options: Sequence = SESSION_LOAD_OPTIONS):
+        """
+        Build the filtered query behind past session listings.
+
+        Args:
+            filters: Optional status and tag filters and search
+            load_options: Loader options, narrower for sparse fieldsets
 
         Returns:
-            Tuple of (list of sessions, total count)
+            Unordered query of sessions dated before today
         """
-        query = Session.query.filter(Session.date < date.today())
+        query = SessionService.listing_query(load_options).filter(Session.date < date.today())
 
         # Apply additional filters
         if filters:
@@ -272,35 +448,65 @@ class SessionService:
             # Apply search filter
             search = filters.get('search', '').strip()
             if search:
-                search_pattern = f'%{search}%'
-                query = query.outerjoin(Speaker, Session.speaker_id == Speaker.id)
-                query = query.outerjoin(Tag, or_(
-                    Session.organ_tag_id == Tag.id,
-                    Session.type_tag_id == Tag.id,
-                    Session.level_tag_id == Tag.id
-                ))
-                query = query.filter(or_(
-                    Session.title.ilike(search_pattern),
-                    Session.summary.ilike(search_pattern),
-                    Session.abstract.ilike(search_pattern),
-                    Speaker.name.ilike(search_pattern),
-                    Tag.label.ilike(search_pattern)
-                )).distinct()
+                query = search_index.filter(query, search)
+
+        return query
+
+    @staticmethod
+    def list_past_sessions(
+        filters: Optional[Dict] = None,
+        pagination: Optional[Dict] = None,
+        load_options: Sequence = SESSION_LOAD_OPTIONS
+    ) -> tuple[List[Session], Optional[int], Optional[str]]:
+        """
+        List past sessions (date < today) with search and pagination.
+
+        Args:
+            filters: Optional additional filters including search
+            pagination: Dictionary with page, per_page and optionally cursor and with_total
+            load_options: Loader options, narrower for sparse fieldsets
+
+        Returns:
+            Tuple of (list of sessions, total count or None, next cursor or None)
+        """
+        query = SessionService.past_query(filters, load_options)
 
         # Order by date descending (most recent first)
-        query = query.order_by(desc(Session.date), desc(Session.time))
+        return SessionService._paginate(query, RECENT_SESSION_SORT, pagination)
+
+    @staticmethod
+    def recordings_query(filters: Optional[Dict] = None, load_options: Sequence = RECORDING_LOAD_OPTIONS):
+        """
+        Build the filtered query behind recording listings.
+
+        Args:
+            filters: Optional tag and year filters and search
+            load_options: Loader options, narrower for sparse fieldsets
+
+        Returns:
+            Unordered recording query joined to sessions
+        """
+        query = SessionService.recording_listing_query(load_options)
 
-        # Get total count before pagination
-        total = query.count()
+        if filters:
+            # Apply tag filters
+            if 'organ_tag_id' in filters:
+                query = query.filter(Session.organ_tag_id == filters['organ_tag_id'])
+            if 'type_tag_id' in filters:
+                query = query.filter(Session.type_tag_id == filters['type_tag_id'])
+            if 'level_tag_id' in filters:
+                query = query.filter(Session.level_tag_id == filters['level_tag_id'])
+
+            # Apply year filter
+            if filters.get('year'):
+                query = query.filter(recorded_in_year(filters['year']))
 
-        # Apply pagination
-        if pagination:
-            page = pagination.get('page', 1)
-            per_page = pagination.get('per_page', 20)
-            query = query.limit(per_page).offset((page - 1) * per_page)
+            # Apply search filter
+            search = filters.get('search', '').strip()
+            if search:
+                query = search_index.filter(query, search, Recording.session_id)
 
-        sessions = query.all()
-        return sessions, total
+        return query
 
     @staticmethod
     def publish_session(session_id: str) -> Session:
@@ -330,7 +536,12 @@ class SessionService:
             raise ValidationError("Cannot publish session with past date")
 
         session.status = 'published'
+        session_listings.index_sessions([session.id])
+        CacheVersion.bump(SESSIONS)
+        home_snapshot.invalidate()
+        catalog.invalidate()
         db.session.commit()
+        response_cache.purge(SESSIONS)
         return session
 
     @staticmethod
@@ -356,7 +567,12 @@ class SessionService:
             raise ValidationError("Cannot unpublish completed sessions")
 
         session.status = 'draft'
+        session_listings.index_sessions([session.id])
+        CacheVersion.bump(SESSIONS)
+        home_snapshot.invalidate()
+        catalog.invalidate()
         db.session.commit()
+        response_cache.purge(SESSIONS)
         return session
 
     @staticmethod
@@ -397,7 +613,12 @@ class SessionService:
 
         # Update session status
         session.status = 'completed'
+        session_listings.index_sessions([session.id])
+        CacheVersion.bump(SESSIONS, RECORDINGS)
+        home_snapshot.invalidate()
+        catalog.invalidate()
         db.session.commit()
+        response_cache.purge(SESSIONS, RECORDINGS)
         return session
 
     @staticmethod
@@ -423,5 +644,12 @@ class SessionService:
             raise ValidationError("Can only delete draft sessions")
 
         db.session.delete(session)
+        search_index.remove_sessions([session_id])
+        session_listings.remove_sessions([session_id])
+        CacheVersion.bump(SESSIONS)
+        home_snapshot.invalidate()
+        catalog.invalidate()
         db.session.commit()
+        response_cache.purge(SESSIONS)
+        ics_cache.invalidate(session_id)
         return True
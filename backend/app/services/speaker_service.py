@@ -1,8 +1,24 @@
 """Speaker service for business logic."""
-from typing import List, Dict
+from typing import List, Dict, Sequence
 from app.extensions import db
-from app.models import Speaker, Session
+from app.models import Speaker, Session, CacheVersion
+from app.schemas import SpeakerResponseSchema
+from app.schemas.serializers import dump_speaker
+from app.services.search_index import search_index
+from app.services.session_listings import session_listings
+from app.services.home_snapshot import home_snapshot
+from app.services.response_cache import response_cache, SPEAKERS
 from app.utils.errors import ValidationError, NotFoundError
+from app.utils.fieldsets import Fieldset, Fieldsets
+
+# Sparse fieldsets (``fields=``) of the speaker listing
+SPEAKER_FIELDSETS = Fieldsets(
+    Speaker,
+    SpeakerResponseSchema,
+    full=Fieldset((), dump_speaker),
+    presets={'card': ('id', 'name', 'designation')},
+    required=(Speaker.name,),
+)
 
 
 class SpeakerService:
@@ -26,7 +42,9 @@ class SpeakerService:
         )
 
         db.session.add(speaker)
+        CacheVersion.bump(SPEAKERS)
         db.session.commit()
+        response_cache.purge(SPEAKERS)
         return speaker
 
     @staticmethod
@@ -56,7 +74,16 @@ class SpeakerService:
         if 'is_aiims' in data:
             speaker.is_aiims = data['is_aiims']
 
+        # Speaker names are part of their sessions' search documents
+        if 'name' in data:
+            search_index.index_speaker(speaker.id)
+        # Listings carry a copy of the name and designation
+        session_listings.index_speaker(speaker)
+
+        CacheVersion.bump(SPEAKERS)
+        home_snapshot.invalidate()
         db.session.commit()
+        response_cache.purge(SPEAKERS)
         return speaker
 
     @staticmethod
@@ -79,14 +106,17 @@ class SpeakerService:
         return speaker
 
     @staticmethod
-    def list_speakers() -> List[Speaker]:
+    def list_speakers(load_options: Sequence = ()) -> List[Speaker]:
         """
         List all speakers.
 
+        Args:
+            load_options: Loader options, narrower for sparse fieldsets
+
         Returns:
             List of all speakers
         """
-        return Speaker.query.order_by(Speaker.name).all()
+        return Speaker.query.options(*load_options).order_by(Speaker.name).all()
 
     @staticmethod
     def delete_speaker(speaker_id: str) -> bool:
@@ -115,5 +145,7 @@ class SpeakerService:
             )
 
         db.session.delete(speaker)
+        CacheVersion.bump(SPEAKERS)
         db.session.commit()
+        response_cache.purge(SPEAKERS)
         return True
@@ -0,0 +1,154 @@
+"""Process-local registry of tags.
+
+Tags are few and rarely change, so each worker keeps an in-memory snapshot of
+the whole table instead of querying it on every request. The snapshot is
+rebuilt lazily: local writes invalidate it directly, and writes made by other
+worker processes are detected through the ``tags`` row in ``cache_versions``,
+which is checked at most once every ``TAG_REGISTRY_CHECK_INTERVAL`` seconds.
+"""
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from flask import current_app
+from app.models import Tag, CacheVersion
+from app.utils.metrics import record_cache_lookup
+
+CACHE_NAME = 'tags'
+CATEGORIES = ('organ', 'type', 'level')
+
+
+@dataclass(frozen=True)
+class TagSnapshot:
+    """Immutable copy of a tag row, safe to share between requests."""
+
+    id: str
+    category: str
+    label: str
+    is_active: bool
+    created_at: datetime
+    updated_at: datetime
+
+    @classmethod
+    def from_model(cls, tag: Tag) -> 'TagSnapshot':
+        """Create a snapshot from a Tag model instance."""
+        return cls(
+            id=tag.id,
+            category=tag.category,
+            label=tag.label,
+            is_active=tag.is_active,
+            created_at=tag.created_at,
+            updated_at=tag.updated_at,
+        )
+
+    def to_dict(self):
+        """Convert snapshot to dictionary (same shape as Tag.to_dict)."""
+        return {
+            'id': self.id,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
+            'category': self.category,
+            'label': self.label,
+            'name': self.label,  # Alias for frontend compatibility
+            'is_active': self.is_active,
+        }
+
+
+class TagRegistry:
+    """Lazily built, version-checked in-memory tag registry."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # (version, tags ordered by category and label, id -> snapshot)
+        self._state = None
+        self._checked_at = 0.0
+
+    def get(self, tag_id: Optional[str]) -> Optional[TagSnapshot]:
+        """
+        Get a tag snapshot by ID.
+
+        Args:
+            tag_id: ID of the tag
+
+        Returns:
+            TagSnapshot, or None if no such tag exists
+        """
+        if not tag_id:
+            return None
+        return self._load()[2].get(tag_id)
+
+    def list(self, category: str = None, active_only: bool = False) -> List[TagSnapshot]:
+        """
+        List tags ordered by category and label.
+
+        Args:
+            category: Filter by category (organ, type, level)
+            active_only: Only return active tags
+
+        Returns:
+            List of tag snapshots
+        """
+        return [
+            tag for tag in self._load()[1]
+            if (not category or tag.category == category)
+            and (not active_only or tag.is_active)
+        ]
+
+    def grouped(self) -> Dict[str, List[TagSnapshot]]:
+        """
+        Get active tags grouped by category.
+
+        Returns:
+            Dictionary with categories as keys and lists of tags as values
+        """
+        grouped = {category: [] for category in CATEGORIES}
+        for tag in self.list(active_only=True):
+            grouped[tag.category].append(tag)
+        return grouped
+
+    def fingerprint(self) -> Tuple[str, Optional[datetime]]:
+        """
+        Get a version string and last modification time for the tag set.
+
+        Returns:
+            Tuple of (version string, latest updated_at or None)
+        """
+        version, tags, _ = self._load()
+        last_modified = max((tag.updated_at for tag in tags if tag.updated_at), default=None)
+        stamp = last_modified.isoformat() if last_modified else ''
+        return f'{version}:{len(tags)}:{stamp}', last_modified
+
+    def invalidate(self):
+        """Drop the snapshot so the next lookup rebuilds it."""
+        with self._lock:
+            self._state = None
+            self._checked_at = 0.0
+
+    def _load(self):
+        """Return the current state, rebuilding it if missing or stale."""
+        state = self._state
+        interval = current_app.config['TAG_REGISTRY_CHECK_INTERVAL']
+        if state is not None and time.monotonic() - self._checked_at < interval:
+            record_cache_lookup(CACHE_NAME, True)
+            return state
+
+        with self._lock:
+            # Another thread may have refreshed while we waited for the lock
+            if self._state is not None and time.monotonic() - self._checked_at < interval:
+                record_cache_lookup(CACHE_NAME, True)
+                return self._state
+
+            version = CacheVersion.current(CACHE_NAME)
+            record_cache_lookup(CACHE_NAME, self._state is not None and self._state[0] == version)
+            if self._state is None or self._state[0] != version:
+                tags = [
+                    TagSnapshot.from_model(tag)
+                    for tag in Tag.query.order_by(Tag.category, Tag.label).all()
+                ]
+                self._state = (version, tags, {tag.id: tag for tag in tags})
+            self._checked_at = time.monotonic()
+            return self._state
+
+
+tag_registry = TagRegistry()
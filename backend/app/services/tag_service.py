@@ -2,8 +2,26 @@
 from typing import List, Dict
 from sqlalchemy import or_
 from app.extensions import db
-from app.models import Tag, Session
+from app.models import Tag, Session, CacheVersion
+from app.schemas import TagResponseSchema
+from app.schemas.serializers import dump_tag
+from app.services.search_index import search_index
+from app.services.session_listings import session_listings
+from app.services.tag_registry import tag_registry, TagSnapshot, CACHE_NAME
+from app.services.home_snapshot import home_snapshot
+from app.services.catalog import catalog
+from app.services.response_cache import response_cache, TAGS
 from app.utils.errors import ValidationError, NotFoundError
+from app.utils.fieldsets import Fieldset, Fieldsets
+
+# Sparse fieldsets (``fields=``) of the tag listings. Tags are listed from the
+# registry's snapshots, so only the serializer is narrowed.
+TAG_FIELDSETS = Fieldsets(
+    Tag,
+    TagResponseSchema,
+    full=Fieldset((), dump_tag),
+    presets={'card': ('id', 'category', 'label')},
+)
 
 
 class TagService:
@@ -41,7 +59,10 @@ class TagService:
         )
 
         db.session.add(tag)
+        CacheVersion.bump(CACHE_NAME)
         db.session.commit()
+        tag_registry.invalidate()
+        response_cache.purge(TAGS)
         return tag
 
     @staticmethod
@@ -82,7 +103,16 @@ class TagService:
         if 'is_active' in data:
             tag.is_active = data['is_active']
 
+        # Tag labels are part of their sessions' search documents
+        if 'label' in data:
+            search_index.index_tag(tag.id)
+            session_listings.index_tag(tag)
+
+        CacheVersion.bump(CACHE_NAME)
+        home_snapshot.invalidate()
         db.session.commit()
+        tag_registry.invalidate()
+        response_cache.purge(TAGS)
         return tag
 
     @staticmethod
@@ -105,47 +135,28 @@ class TagService:
         return tag
 
     @staticmethod
-    def list_tags(category: str = None, active_only: bool = False) -> List[Tag]:
+    def list_tags(category: str = None, active_only: bool = False) -> List[TagSnapshot]:
         """
-        List tags with optional filtering.
+        List tags with optional filtering (served from the tag registry).
 
         Args:
             category: Filter by category (organ, type, level)
             active_only: Only return active tags
 
         Returns:
-            List of tags
+            List of tag snapshots
         """
-        query = Tag.query
-
-        if category:
-            query = query.filter_by(category=category)
-
-        if active_only:
-            query = query.filter_by(is_active=True)
-
-        return query.order_by(Tag.category, Tag.label).all()
+        return tag_registry.list(category=category, active_only=active_only)
 
     @staticmethod
     def get_tags_grouped() -> Dict:
         """
-        Get all active tags grouped by category.
+        Get all active tags grouped by category (served from the tag registry).
 
         Returns:
-            Dictionary with categories as keys and lists of tags as values
+            Dictionary with categories as keys and lists of tag snapshots as values
         """
-        tags = Tag.query.filter_by(is_active=True).order_by(Tag.category, Tag.label).all()
-
-        grouped = {
-            'organ': [],
-            'type': [],
-            'level': []
-        }
-
-        for tag in tags:
-            grouped[tag.category].append(tag)
-
-        return grouped
+        return tag_registry.grouped()
 
     @staticmethod
     def get_tag_usage(tag_id: str) -> Dict:
@@ -225,6 +236,15 @@ class TagService:
             if not replacement_tag.is_active:
                 raise ValidationError("Replacement tag must be active")
 
+            # Their search documents carry the deleted tag's label
+            session_ids = [
+                row.id for row in db.session.query(Session.id).filter(or_(
+                    Session.organ_tag_id == tag_id,
+                    Session.type_tag_id == tag_id,
+                    Session.level_tag_id == tag_id
+                ))
+            ]
+
             # Replace tag in all sessions
             if tag.category == 'organ':
                 Session.query.filter(Session.organ_tag_id == tag_id).update(
@@ -238,7 +258,14 @@ class TagService:
                 Session.query.filter(Session.level_tag_id == tag_id).update(
                     {Session.level_tag_id: replace_with_tag_id}
                 )
+            session_listings.replace_tag(tag, replacement_tag)
+            search_index.index_sessions(session_ids)
 
         db.session.delete(tag)
+        CacheVersion.bump(CACHE_NAME)
+        home_snapshot.invalidate()
+        catalog.invalidate()
         db.session.commit()
+        tag_registry.invalidate()
+        response_cache.purge(TAGS)
         return True
@@ -0,0 +1,149 @@
+"""Write-behind view counter for recordings.
+
+Recording detail hits are buffered in memory per worker and written in
+batches with atomic ``views_count = views_count + n`` updates, so serving a
+recording never writes to the database on the request path. Buffered counts
+are flushed every ``VIEW_COUNTER_FLUSH_INTERVAL`` seconds by a background
+thread, and once more when the process exits. An interval of 0 writes every
+view through immediately, which keeps tests and scripts deterministic.
+
+Each flush bumps the ``views`` row in ``cache_versions`` and purges the
+``views`` response cache tag. Only listings ordered by view count depend on
+them; other payloads showing a view count pick it up with the next content
+write or response cache expiry, so views do not churn their caches.
+"""
+import atexit
+import os
+import threading
+from collections import Counter
+from sqlalchemy import bindparam, update
+from app.extensions import db
+from app.models import Recording, CacheVersion
+from app.services.response_cache import response_cache, VIEWS
+from app.services.session_listings import session_listings
+
+
+class ViewCounter:
+    """Per-process buffer of pending recording view increments."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending = Counter()
+        self._app = None
+        self._interval = 0
+        self._flusher = None
+        self._flusher_pid = None
+        self._stop = threading.Event()
+
+    def init_app(self, app):
+        """
+        Bind the counter to an application and register the shutdown flush.
+
+        Args:
+            app: Flask application instance
+        """
+        if self._app is None:
+            atexit.register(self.shutdown)
+        self._app = app
+        self._interval = app.config['VIEW_COUNTER_FLUSH_INTERVAL']
+
+    def record(self, recording_id: str):
+        """
+        Count one view of a recording.
+
+        Args:
+            recording_id: ID of the viewed recording
+        """
+        with self._lock:
+            self._pending[recording_id] += 1
+
+        if self._interval <= 0:
+            self.flush()
+        else:
+            self._ensure_flusher()
+
+    def pending(self, recording_id: str) -> int:
+        """
+        Get the number of buffered, not yet flushed views of a recording.
+
+        Args:
+            recording_id: ID of the recording
+
+        Returns:
+            Number of pending views
+        """
+        with self._lock:
+            return self._pending.get(recording_id, 0)
+
+    def flush(self) -> int:
+        """
+        Write all buffered views to the database in one transaction.
+
+        On failure the counts are put back into the buffer for the next flush.
+
+        Returns:
+            Number of views written
+        """
+        with self._lock:
+            batch, self._pending = self._pending, Counter()
+        if not batch:
+            return 0
+
+        table = Recording.__table__
+        statement = (
+            update(table)
+            .where(table.c.id == bindparam('recording'))
+            # Keep updated_at untouched: a view is not a content change
+            .values(views_count=table.c.views_count + bindparam('views'), updated_at=table.c.updated_at)
+        )
+        params = [{'recording': rid, 'views': views} for rid, views in batch.items()]
+
+        try:
+            with self._app.app_context():
+                try:
+                    db.session.execute(statement, params)
+                    session_listings.record_views(params)
+                    CacheVersion.bump(VIEWS)
+                    db.session.commit()
+                except Exception:
+                    db.session.rollback()
+                    raise
+                # Cached most_viewed listings are ordered by view count
+                response_cache.purge(VIEWS)
+        except Exception:
+            with self._lock:
+                self._pending.update(batch)
+            if self._app is not None:
+                self._app.logger.exception('Failed to flush %d recording views', sum(batch.values()))
+            return 0
+
+        return sum(batch.values())
+
+    def shutdown(self):
+        """Stop the background flusher and write any remaining views."""
+        self._stop.set()
+        if self._app is not None:
+            self.flush()
+
+    def _ensure_flusher(self):
+        """Start the background flush thread in this process if needed."""
+        # Worker processes forked from a preloaded app do not inherit threads
+        if self._flusher_pid == os.getpid() and self._flusher.is_alive():
+            return
+        with self._lock:
+            if self._flusher_pid == os.getpid() and self._flusher.is_alive():
+                return
+            self._stop.clear()
+            self._flusher = threading.Thread(
+                target=self._run, name='view-counter-flush', daemon=True
+            )
+            self._flusher_pid = os.getpid()
+            self._flusher.start()
+
+    def _run(self):
+        """Flush buffered views every interval until stopped."""
+        while not self._stop.wait(self._interval):
+            self.flush()
+
+
+view_counter = ViewCounter()
@@ -0,0 +1,78 @@
+"""Conditional GET support (ETag / Last-Modified / 304) for read endpoints."""
+import hashlib
+from datetime import date, datetime
+from functools import wraps
+from typing import Callable, Optional, Tuple
+from flask import request, make_response
+from sqlalchemy import select
+from app.extensions import db
+from app.models import CacheVersion
+
+
+def entity_version(*names: str) -> Tuple[str, Optional[datetime]]:
+    """
+    Fingerprint the entity types a response is built from.
+
+    Service-layer writes bump the ``cache_versions`` row of every entity type
+    they change in the same transaction, so the fingerprint is a primary key
+    lookup of those rows instead of an aggregate over the tables.
+
+    Args:
+        *names: cache_versions names (the response cache entity tags, and
+            ``views`` for flushed view counts)
+
+    Returns:
+        Tuple of (version string, latest bump time or None)
+    """
+    rows = {
+        name: (version, updated_at)
+        for name, version, updated_at in db.session.execute(
+            select(CacheVersion.name, CacheVersion.version, CacheVersion.updated_at)
+            .where(CacheVersion.name.in_(names))
+        )
+    }
+    versions = [rows.get(name, (0, None)) for name in names]
+    timestamps = [updated_at for _, updated_at in versions if updated_at is not None]
+    return '|'.join(str(version) for version, _ in versions), max(timestamps, default=None)
+
+
+def conditional(version: Callable[[], Tuple[str, Optional[datetime]]]):
+    """
+    Decorator adding weak ETag / Last-Modified validators to a GET endpoint.
+
+    The ETag is derived from ``version()``, the request path, the query
+    arguments and the current date (listings depend on what is "upcoming").
+    A matching If-None-Match is answered with 304 before the view runs, so
+    nothing is queried or serialized beyond the version check.
+
+    Args:
+        version: Callable returning (version string, last modified datetime)
+    """
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            fingerprint, last_modified = version()
+            key = '\n'.join([
+                request.path,
+                '&'.join(f'{name}={value}' for name, value in sorted(request.args.items(multi=True))),
+                date.today().isoformat(),
+                fingerprint,
+            ])
+            etag = hashlib.sha1(key.encode()).hexdigest()
+
+            if request.if_none_match.contains_weak(etag):
+                response = make_response('', 304)
+            else:
+                response = make_response(fn(*args, **kwargs))
+
+            response.set_etag(etag, weak=True)
+            if last_modified:
+                response.last_modified = last_modified
+            # Let browsers and the CDN store the response but always revalidate
+            response.cache_control.public = True
+            response.cache_control.no_cache = True
+            return response
+
+        return wrapper
+
+    return decorator
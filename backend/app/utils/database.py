@@ -0,0 +1,138 @@
+"""Config-driven SQLAlchemy engine tuning.
+
+SQLite connections get their pragmas from a ``connect`` listener:
+``journal_mode`` (WAL, so readers are not blocked by a writer),
+``synchronous``, ``busy_timeout``, ``mmap_size`` and ``cache_size``.
+
+Other databases get pool sizing, overflow, recycling and pre-ping, and on
+PostgreSQL a server-side ``statement_timeout`` passed at connect time.
+
+The effective settings are read back from the database and logged once
+at startup.
+"""
+import json
+import logging
+from typing import Dict
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.pool import QueuePool
+
+SQLITE_PRAGMAS = ('journal_mode', 'synchronous', 'busy_timeout', 'mmap_size', 'cache_size')
+
+
+def engine_options(config) -> Dict:
+    """
+    Build ``SQLALCHEMY_ENGINE_OPTIONS`` for the configured database.
+
+    Options already present in the config take precedence.
+
+    Args:
+        config: Flask config mapping
+
+    Returns:
+        Engine keyword arguments
+    """
+    url = make_url(config['SQLALCHEMY_DATABASE_URI'])
+    options = {}
+    if url.get_backend_name() != 'sqlite':
+        options.update(
+            pool_size=config['DB_POOL_SIZE'],
+            max_overflow=config['DB_MAX_OVERFLOW'],
+            pool_timeout=config['DB_POOL_TIMEOUT'],
+            pool_recycle=config['DB_POOL_RECYCLE'],
+            pool_pre_ping=config['DB_POOL_PRE_PING'],
+        )
+        if url.get_backend_name() == 'postgresql' and config['DB_STATEMENT_TIMEOUT_MS'] > 0:
+            options['connect_args'] = {
+                'options': f"-c statement_timeout={config['DB_STATEMENT_TIMEOUT_MS']}"
+            }
+    if config['METRICS_ENABLED'] and uses_queue_pool(url):
+        from app.utils.metrics import TimedQueuePool
+        options['poolclass'] = TimedQueuePool
+    options.update(config.get('SQLALCHEMY_ENGINE_OPTIONS') or {})
+    return options
+
+
+def uses_queue_pool(url) -> bool:
+    """Return whether SQLAlchemy pools connections to a URL with a QueuePool."""
+    # In-memory SQLite databases live in a single connection (StaticPool)
+    return url.get_backend_name() != 'sqlite' or url.database not in (None, '', ':memory:')
+
+
+def sqlite_pragmas(config) -> Dict[str, object]:
+    """Return the pragmas applied to every SQLite connection, in order."""
+    return {
+        'journal_mode': config['SQLITE_JOURNAL_MODE'],
+        'synchronous': config['SQLITE_SYNCHRONOUS'],
+        'busy_timeout': config['SQLITE_BUSY_TIMEOUT_MS'],
+        'mmap_size': config['SQLITE_MMAP_SIZE'],
+        'cache_size': config['SQLITE_CACHE_SIZE'],
+    }
+
+
+def install_sqlite_pragmas(engine: Engine, pragmas: Dict[str, object]):
+    """
+    Apply pragmas to each new connection of a SQLite engine.
+
+    Args:
+        engine: SQLAlchemy engine
+        pragmas: Pragma name -> value
+    """
+    if engine.dialect.name != 'sqlite':
+        return
+
+    @event.listens_for(engine, 'connect')
+    def set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f'PRAGMA {name}={value}')
+        finally:
+            cursor.close()
+
+
+def effective_settings(engine: Engine) -> Dict[str, object]:
+    """
+    Read the settings a live connection actually runs with.
+
+    Args:
+        engine: SQLAlchemy engine
+
+    Returns:
+        Setting name -> value, including the pool configuration
+    """
+    pool = engine.pool
+    settings = {'dialect': engine.dialect.name, 'pool': type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        settings.update(
+            pool_size=pool.size(),
+            max_overflow=pool._max_overflow,
+            pool_timeout=pool.timeout(),
+            pool_recycle=pool._recycle,
+            pool_pre_ping=pool._pre_ping,
+        )
+    with engine.connect() as conn:
+        if engine.dialect.name == 'sqlite':
+            for name in SQLITE_PRAGMAS:
+                settings[name] = conn.execute(text(f'PRAGMA {name}')).scalar()
+        elif engine.dialect.name == 'postgresql':
+            settings['statement_timeout'] = conn.execute(text('SHOW statement_timeout')).scalar()
+    return settings
+
+
+def log_effective_settings(app, engine: Engine):
+    """
+    Log the effective engine settings at startup.
+
+    Args:
+        app: Flask application instance
+        engine: SQLAlchemy engine
+    """
+    logger = app.logger.getChild('db')
+    logger.setLevel(logging.INFO)
+    try:
+        settings = effective_settings(engine)
+    except Exception:
+        logger.warning('Could not read database settings', exc_info=True)
+        return
+    logger.info(json.dumps({'event': 'database_settings', **settings}, default=str))
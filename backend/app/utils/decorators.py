@@ -1,35 +1,27 @@
 """Authentication and authorization decorators."""
 from functools import wraps
-from flask import jsonify
-from flask_jwt_extended import get_jwt_identity, verify_jwt_in_request
-from app.models.admin_user import AdminUser
+from flask_jwt_extended import current_user, verify_jwt_in_request
+from app.utils.errors import ForbiddenError
+
+ADMIN_ROLES = ('admin', 'super_admin')
 
 
 def admin_required(fn):
     """
     Decorator to require admin authentication.
 
-    Verifies JWT token and checks that the user exists and is an admin.
+    Verifies the JWT token; the user behind it is resolved from the admin
+    identity cache and available as ``flask_jwt_extended.current_user``.
     """
     @wraps(fn)
     def wrapper(*args, **kwargs):
-        # Verify JWT is present and valid
+        # Verify JWT is present and valid, and that its user still exists
         verify_jwt_in_request()
 
-        # Get the identity from the JWT
-        current_user_id = get_jwt_identity()
-
-        # Load the user from the database
-        user = AdminUser.query.get(current_user_id)
-
-        if not user:
-            return jsonify({'error': 'User not found'}), 404
-
-        if user.role not in ['admin', 'super_admin']:
-            return jsonify({'error': 'Admin access required'}), 403
+        if current_user.role not in ADMIN_ROLES:
+            raise ForbiddenError('Admin access required', 'ADMIN_REQUIRED')
 
-        # Pass the user to the route handler
-        return fn(current_user=user, *args, **kwargs)
+        return fn(*args, **kwargs)
 
     return wrapper
 
@@ -38,26 +30,16 @@ def super_admin_required(fn):
     """
     Decorator to require super admin authentication.
 
-    Verifies JWT token and checks that the user exists and is a super admin.
+    Verifies the JWT token and checks that its user is a super admin.
     """
     @wraps(fn)
     def wrapper(*args, **kwargs):
-        # Verify JWT is present and valid
+        # Verify JWT is present and valid, and that its user still exists
         verify_jwt_in_request()
 
-        # Get the identity from the JWT
-        current_user_id = get_jwt_identity()
-
-        # Load the user from the database
-        user = AdminUser.query.get(current_user_id)
-
-        if not user:
-            return jsonify({'error': 'User not found'}), 404
-
-        if user.role != 'super_admin':
-            return jsonify({'error': 'Super admin access required'}), 403
+        if current_user.role != 'super_admin':
+            raise ForbiddenError('Super admin access required', 'SUPER_ADMIN_REQUIRED')
 
-        # Pass the user to the route handler
-        return fn(current_user=user, *args, **kwargs)
+        return fn(*args, **kwargs)
 
     return wrapper
@@ -68,6 +68,24 @@ class ConflictError(APIError):
         super().__init__(message, code, 409)
 
 
+class RateLimitError(APIError):
+    """Raised when a client exceeds a request limit."""
+
+    def __init__(self, message: str, code: str = 'RATE_LIMITED', retry_after: int = None):
+        """Initialize rate limit error, optionally with a Retry-After in seconds."""
+        super().__init__(message, code, 429)
+        self.retry_after = retry_after
+
+
+class ServiceUnavailableError(APIError):
+    """Raised when the server is temporarily unable to handle the request."""
+
+    def __init__(self, message: str, code: str = 'SERVICE_UNAVAILABLE', retry_after: int = None):
+        """Initialize service unavailable error, optionally with a Retry-After in seconds."""
+        super().__init__(message, code, 503)
+        self.retry_after = retry_after
+
+
 def register_error_handlers(app):
     """
     Register error handlers for the Flask application.
@@ -78,17 +96,22 @@ def register_error_handlers(app):
     from flask import jsonify
     from marshmallow import ValidationError as MarshmallowValidationError
     from werkzeug.exceptions import HTTPException
+    from app.utils.metrics import record_api_error
 
     @app.errorhandler(APIError)
     def handle_api_error(error):
         """Handle custom API errors."""
+        record_api_error(error.code, error.status_code)
         response = jsonify(error.to_dict())
         response.status_code = error.status_code
+        if getattr(error, 'retry_after', None):
+            response.headers['Retry-After'] = str(error.retry_after)
         return response
 
     @app.errorhandler(MarshmallowValidationError)
     def handle_marshmallow_error(error):
         """Handle Marshmallow validation errors."""
+        record_api_error('VALIDATION_ERROR', 400)
         return jsonify({
             'error': {
                 'code': 'VALIDATION_ERROR',
@@ -100,9 +123,11 @@ def register_error_handlers(app):
     @app.errorhandler(HTTPException)
     def handle_http_exception(error):
         """Handle Werkzeug HTTP exceptions."""
+        code = error.name.upper().replace(' ', '_')
+        record_api_error(code, error.code)
         return jsonify({
             'error': {
-                'code': error.name.upper().replace(' ', '_'),
+                'code': code,
                 'message': error.description
             }
         }), error.code
@@ -119,6 +144,7 @@ def register_error_handlers(app):
         else:
             message = 'An unexpected error occurred'
 
+        record_api_error('INTERNAL_ERROR', 500)
         return jsonify({
             'error': {
                 'code': 'INTERNAL_ERROR',
@@ -0,0 +1,137 @@
+"""Sparse fieldsets (``fields=``) for listing endpoints.
+
+A listing's ``fields`` query parameter is either a named preset (``full``,
+the default, or e.g. ``card``) or a comma-separated list of response fields.
+Nested fields can be narrowed with a dotted path such as ``speaker.name``.
+
+The selection restricts both ends of the listing:
+
+- the response schema is compiled with marshmallow's ``only``, so the JSON
+  carries just the selected keys;
+- the query gets matching loader options: ``load_only`` on each entity's
+  selected columns, and eager loads only for the selected relationships,
+  so unselected text columns are never read from the database.
+
+Columns the listing itself needs, such as the sort keys that cursors are
+encoded from, are always loaded.
+"""
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Dict, Optional, Sequence, Tuple
+from marshmallow import Schema, fields
+from sqlalchemy import inspect
+from sqlalchemy.orm import joinedload, load_only
+from app.schemas.serializers import compile_schema
+from app.utils.errors import ValidationError
+
+FULL = 'full'
+
+
+@dataclass(frozen=True)
+class Fieldset:
+    """Resolved selection: loader options and the serializer to use with them."""
+
+    load_options: Tuple
+    serialize: Callable
+
+
+def _loader_options(model, schema: Schema, strategies: Dict, required: Sequence = ()) -> list:
+    """
+    Build ``load_only`` and eager-loading options covering what a schema dumps.
+
+    Args:
+        model: Mapped class the schema dumps
+        schema: Schema instance, with ``only`` already applied
+        strategies: Relationship name -> loader function (default joinedload)
+        required: Extra column attributes to always load
+    """
+    mapper = inspect(model)
+    columns = {column.key: column for column in required}
+    options = []
+    for name, field in schema.dump_fields.items():
+        attribute = field.attribute or name
+        if attribute in mapper.column_attrs:
+            columns[attribute] = getattr(model, attribute)
+        elif isinstance(field, fields.Nested) and attribute in mapper.relationships:
+            related = mapper.relationships[attribute].mapper.class_
+            loader = strategies.get(attribute, joinedload)
+            options.append(loader(getattr(model, attribute)).options(
+                *_loader_options(related, field.schema, {})
+            ))
+    for key in mapper.primary_key:
+        columns.setdefault(key.key, getattr(model, key.key))
+    return [load_only(*columns.values())] + options
+
+
+class Fieldsets:
+    """Resolves ``fields`` values for one listing."""
+
+    def __init__(
+        self,
+        model,
+        schema: type,
+        full: Fieldset,
+        serializer: Optional[Callable[[Tuple[str, ...]], Callable]] = None,
+        presets: Optional[Dict[str, Tuple[str, ...]]] = None,
+        strategies: Optional[Dict] = None,
+        required: Sequence = (),
+        depends: Optional[Dict[str, str]] = None,
+    ):
+        """
+        Args:
+            model: Mapped class of the listing
+            schema: Response schema class
+            full: Fieldset of the full response (the existing options and serializer)
+            serializer: Builds a serializer from a tuple of field names
+                (default: the schema compiled with ``only``)
+            presets: Preset name -> field names
+            strategies: Relationship name -> loader function (default joinedload)
+            required: Column attributes the listing always needs loaded
+            depends: Field name -> relationship its serializer reads
+        """
+        self.model = model
+        self.schema = schema
+        self.full = full
+        self.serializer = serializer or (lambda only: compile_schema(schema(only=only)))
+        self.presets = presets or {}
+        self.strategies = strategies or {}
+        self.required = tuple(required)
+        self.depends = depends or {}
+        self.resolve = lru_cache(maxsize=64)(self._resolve)
+
+    def from_request(self, args) -> Fieldset:
+        """
+        Resolve the ``fields`` query parameter.
+
+        Raises:
+            ValidationError: If a field or preset is unknown
+        """
+        return self.resolve(args.get('fields') or FULL)
+
+    def _resolve(self, value: str) -> Fieldset:
+        if value == FULL:
+            return self.full
+        if value in self.presets:
+            only = self.presets[value]
+        else:
+            only = tuple(sorted({name.strip() for name in value.split(',') if name.strip()}))
+        try:
+            schema = self.schema(only=only)
+        except (ValueError, KeyError):
+            # ValueError for unknown fields, KeyError for unknown nested roots
+            raise ValidationError(
+                f"Invalid fields '{value}' (use {', '.join([FULL, *self.presets])} "
+                'or a comma-separated list of response fields)',
+                'INVALID_FIELDS'
+            )
+
+        options = _loader_options(self.model, schema, self.strategies, self.required)
+        mapper = inspect(self.model)
+        for name, relationship in self.depends.items():
+            if name in schema.dump_fields and relationship not in schema.dump_fields:
+                # Loaded for the serializer only, so just its key
+                related = mapper.relationships[relationship].mapper.class_
+                options.append(joinedload(getattr(self.model, relationship)).options(
+                    load_only(*[getattr(related, key.key) for key in inspect(related).primary_key])
+                ))
+        return Fieldset(load_options=tuple(options), serialize=self.serializer(only))
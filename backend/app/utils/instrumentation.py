@@ -0,0 +1,228 @@
+"""Per-request SQL instrumentation and slow-query log.
+
+Every SQL statement issued while handling a request is timed through the
+SQLAlchemy ``before_cursor_execute`` / ``after_cursor_execute`` events. When
+the request finishes, its query count, total database time and slowest
+statement are:
+
+- added to the response as a ``Server-Timing`` header, which browser dev
+  tools display next to the request;
+- logged as one JSON line on the ``app.sql`` logger at INFO level, shown
+  when ``SQL_LOG_LEVEL`` is INFO.
+
+Statements slower than ``SQL_SLOW_QUERY_MS`` are logged at WARNING together
+with their query plan. Slow statements are handed to a background thread,
+which fetches the plan on a separate connection and writes the log line, so
+explaining a statement never delays the response. The queue is bounded;
+statements arriving while it is full are logged without a plan.
+
+Bound parameter values can hold emails, login lookups and search terms, so
+slow-query lines only record their types unless ``SQL_LOG_PARAMETERS`` is
+enabled.
+
+The per-statement overhead is two clock reads and a few attribute updates,
+so the instrumentation is meant to stay enabled in production.
+"""
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+from flask import g, has_request_context, request, request_finished, request_started
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Statements whose plan can be shown without side effects
+EXPLAINABLE = ('select', 'with')
+
+# Slow statements waiting to be explained and logged, per process
+SLOW_QUERY_QUEUE_SIZE = 100
+
+
+def parameter_types(parameters):
+    """Describe bound parameters by their types only, hiding their values."""
+    if parameters is None:
+        return None
+    if isinstance(parameters, dict):
+        return {name: type(value).__name__ for name, value in parameters.items()}
+    return [type(value).__name__ for value in parameters]
+
+
+@dataclass
+class RequestSQLStats:
+    """SQL statistics of the request being handled."""
+
+    started_at: float
+    queries: int = 0
+    db_time: float = 0.0
+    slowest_time: float = 0.0
+    slowest_statement: Optional[str] = None
+    # (seconds, statement, parameters, engine) of statements over the threshold
+    slow: List[Tuple[float, str, object, Engine]] = field(default_factory=list)
+    closed: bool = False
+
+
+class SQLInstrumentation:
+    """Flask extension timing the SQL statements of each request."""
+
+    def __init__(self):
+        self._listening = False
+        self.logger = logging.getLogger('app.sql')
+        self._lock = threading.Lock()
+        self._queue = None
+        self._worker = None
+        self._worker_pid = None
+
+    def init_app(self, app):
+        """
+        Hook SQLAlchemy and Flask request signals if enabled in the config.
+
+        Args:
+            app: Flask application instance
+        """
+        if not app.config['SQL_INSTRUMENTATION']:
+            return
+        # A child of app.logger, so records reach Flask's default handler
+        self.logger = app.logger.getChild('sql')
+        self.logger.setLevel(app.config['SQL_LOG_LEVEL'])
+
+        # Engine-class listeners also cover engines created after this call
+        if not self._listening:
+            event.listen(Engine, 'before_cursor_execute', self._before_cursor_execute)
+            event.listen(Engine, 'after_cursor_execute', self._after_cursor_execute)
+            self._listening = True
+
+        request_started.connect(self._request_started, app)
+        request_finished.connect(self._request_finished, app)
+
+    @staticmethod
+    def stats() -> Optional[RequestSQLStats]:
+        """Return the statistics of the current request, if it is instrumented."""
+        if not has_request_context():
+            return None
+        return g.get('sql_stats')
+
+    # SQLAlchemy events
+
+    @staticmethod
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault('query_start_time', []).append(time.perf_counter())
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        started = conn.info['query_start_time'].pop()
+        stats = self.stats()
+        if stats is None or stats.closed:
+            return
+
+        elapsed = time.perf_counter() - started
+        stats.queries += 1
+        stats.db_time += elapsed
+        if elapsed > stats.slowest_time:
+            stats.slowest_time = elapsed
+            stats.slowest_statement = statement
+        if elapsed * 1000 >= g.sql_slow_threshold_ms > 0:
+            stats.slow.append((elapsed, statement, None if executemany else parameters, conn.engine))
+
+    # Flask signals
+
+    @staticmethod
+    def _request_started(app, **extra):
+        g.sql_stats = RequestSQLStats(started_at=time.perf_counter())
+        g.sql_slow_threshold_ms = app.config['SQL_SLOW_QUERY_MS']
+
+    def _request_finished(self, app, response, **extra):
+        stats = self.stats()
+        if stats is None:
+            return
+        stats.closed = True
+        request_ms = (time.perf_counter() - stats.started_at) * 1000
+        db_ms = stats.db_time * 1000
+
+        response.headers.add(
+            'Server-Timing',
+            f'db;desc="{stats.queries} queries";dur={db_ms:.2f}, '
+            f'db-slowest;dur={stats.slowest_time * 1000:.2f}, '
+            f'app;dur={request_ms:.2f}'
+        )
+
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(json.dumps({
+                'event': 'request_sql',
+                'method': request.method,
+                'path': request.path,
+                'status': response.status_code,
+                'queries': stats.queries,
+                'db_ms': round(db_ms, 2),
+                'slowest_ms': round(stats.slowest_time * 1000, 2),
+                'slowest_statement': stats.slowest_statement,
+                'request_ms': round(request_ms, 2),
+            }))
+
+        for elapsed, statement, parameters, engine in stats.slow:
+            record = {
+                'event': 'slow_query',
+                'method': request.method,
+                'path': request.path,
+                'duration_ms': round(elapsed * 1000, 2),
+                'statement': statement,
+                'parameter_types': parameter_types(parameters),
+            }
+            if app.config['SQL_LOG_PARAMETERS']:
+                record['parameters'] = repr(parameters)
+            explain = app.config['SQL_EXPLAIN_SLOW_QUERIES'] and parameters is not None
+            self._submit(record, engine if explain else None, statement, parameters)
+
+    def _submit(self, record: Dict, engine: Optional[Engine], statement: str, parameters):
+        """Queue a slow statement for the background logger, or log it now if the queue is full."""
+        self._ensure_worker()
+        try:
+            self._queue.put_nowait((record, engine, statement, parameters))
+        except queue.Full:
+            record['plan'] = None
+            self.logger.warning(json.dumps(record))
+
+    def _ensure_worker(self):
+        """Start the slow-query logging thread in this process if needed."""
+        # Worker processes forked from a preloaded app do not inherit threads
+        if self._worker_pid == os.getpid() and self._worker.is_alive():
+            return
+        with self._lock:
+            if self._worker_pid == os.getpid() and self._worker.is_alive():
+                return
+            self._queue = queue.Queue(maxsize=SLOW_QUERY_QUEUE_SIZE)
+            self._worker = threading.Thread(
+                target=self._run, args=(self._queue,), name='slow-query-log', daemon=True
+            )
+            self._worker_pid = os.getpid()
+            self._worker.start()
+
+    def _run(self, pending: queue.Queue):
+        """Explain and log queued slow statements."""
+        while True:
+            record, engine, statement, parameters = pending.get()
+            try:
+                record['plan'] = self._explain(engine, statement, parameters) if engine else None
+                self.logger.warning(json.dumps(record))
+            except Exception:
+                self.logger.exception('Could not log slow statement')
+
+    def _explain(self, engine: Engine, statement: str, parameters) -> Optional[List[str]]:
+        """Return the query plan of a statement, or None if it cannot be shown."""
+        if not statement.lstrip().lower().startswith(EXPLAINABLE):
+            return None
+
+        prefix = 'EXPLAIN QUERY PLAN ' if engine.dialect.name == 'sqlite' else 'EXPLAIN '
+        try:
+            with engine.connect() as conn:
+                rows = conn.exec_driver_sql(prefix + statement, parameters).all()
+        except Exception:
+            self.logger.debug('Could not explain slow statement', exc_info=True)
+            return None
+        # SQLite returns (id, parent, notused, detail); other databases one text column
+        return [str(row[-1]) for row in rows]
+
+
+sql_instrumentation = SQLInstrumentation()
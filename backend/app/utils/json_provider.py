@@ -0,0 +1,41 @@
+"""Optional orjson-backed JSON provider (``JSON_ENCODER=orjson``)."""
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    JSON provider encoding responses with orjson.
+
+    Keys are sorted like the default provider's, and dates still go through
+    Flask's ``default`` so they keep its format. Output differs only in
+    whitespace and in non-ASCII characters being emitted as UTF-8 instead of
+    ``\\u`` escapes.
+    """
+
+    def __init__(self, app):
+        if orjson is None:
+            raise RuntimeError('JSON_ENCODER=orjson requires the orjson package')
+        super().__init__(app)
+        self.option = (
+            orjson.OPT_SORT_KEYS
+            | orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+        )
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=self.option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(
+            obj, default=self.default, option=self.option | orjson.OPT_APPEND_NEWLINE
+        )
+        return self._app.response_class(body, mimetype=self.mimetype)
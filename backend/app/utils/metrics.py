@@ -0,0 +1,159 @@
+"""Prometheus metrics and the ``/metrics`` endpoint.
+
+Collected metrics:
+
+- ``http_request_duration_seconds``: latency histogram per blueprint, endpoint
+  and method
+- ``http_requests_total``: request counter, additionally by status code
+- ``http_requests_in_flight``: requests being handled right now
+- ``http_response_size_bytes``: response body size histogram
+- ``db_pool_checkout_wait_seconds``: time spent waiting for a pooled connection
+- ``cache_lookups_total``: lookups per cache and result (``hit``/``miss``), for
+  hit ratios of the response cache, home snapshot and tag registry
+- ``api_errors_total``: error responses by ``APIError.code``
+
+Under gunicorn, set ``PROMETHEUS_MULTIPROC_DIR`` (``gunicorn.conf.py`` does
+this) so every worker writes its samples to a shared directory and a scrape
+of any worker reports the whole server.
+
+Pool checkouts are timed by ``TimedQueuePool``, which
+``app.utils.database.engine_options`` passes as the engine's ``poolclass``
+wherever SQLAlchemy would use a plain ``QueuePool``.
+
+``/metrics`` exposes route names, error counts and pool statistics, so it is
+only mounted when ``METRICS_TOKEN`` is set, and scrapers must send it as
+``Authorization: Bearer <token>``.
+"""
+import hmac
+import os
+import time
+from flask import (
+    Response, current_app, g, request, request_finished, request_started, request_tearing_down
+)
+from prometheus_client import (
+    CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Gauge, Histogram,
+    generate_latest, multiprocess,
+)
+from sqlalchemy.pool import QueuePool
+from app.utils.errors import AuthError
+
+REQUEST_LABELS = ('blueprint', 'endpoint', 'method')
+
+REQUEST_DURATION = Histogram(
+    'http_request_duration_seconds', 'Request latency', REQUEST_LABELS,
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+REQUESTS = Counter(
+    'http_requests_total', 'Requests handled', REQUEST_LABELS + ('status',),
+)
+REQUESTS_IN_FLIGHT = Gauge(
+    'http_requests_in_flight', 'Requests being handled', multiprocess_mode='livesum',
+)
+RESPONSE_SIZE = Histogram(
+    'http_response_size_bytes', 'Response body size', REQUEST_LABELS,
+    buckets=(256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304),
+)
+DB_POOL_CHECKOUT_WAIT = Histogram(
+    'db_pool_checkout_wait_seconds', 'Time to get a connection from the pool',
+    buckets=(0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 30),
+)
+CACHE_LOOKUPS = Counter(
+    'cache_lookups_total', 'Cache lookups', ('cache', 'result'),
+)
+API_ERRORS = Counter(
+    'api_errors_total', 'Error responses by error code', ('code', 'status'),
+)
+
+
+def record_cache_lookup(cache: str, hit: bool):
+    """
+    Count a lookup in one of the application caches.
+
+    Args:
+        cache: Cache name (response, home, tags)
+        hit: Whether the lookup was served from the cache
+    """
+    CACHE_LOOKUPS.labels(cache, 'hit' if hit else 'miss').inc()
+
+
+def record_api_error(code: str, status: int):
+    """
+    Count an error response.
+
+    Args:
+        code: Error code of the response body
+        status: HTTP status code
+    """
+    API_ERRORS.labels(code, str(status)).inc()
+
+
+class TimedQueuePool(QueuePool):
+    """QueuePool recording how long each checkout waits for a connection."""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_CHECKOUT_WAIT.observe(time.perf_counter() - started)
+
+
+class Metrics:
+    """Flask extension collecting request metrics and serving ``/metrics``."""
+
+    def init_app(self, app):
+        """
+        Register the request signal handlers and the ``/metrics`` route.
+
+        Args:
+            app: Flask application instance
+        """
+        if not app.config['METRICS_ENABLED']:
+            return
+
+        request_started.connect(self._request_started, app)
+        request_finished.connect(self._request_finished, app)
+        request_tearing_down.connect(self._request_tearing_down, app)
+        if app.config['METRICS_TOKEN']:
+            app.add_url_rule('/metrics', 'metrics', self.expose)
+
+    @staticmethod
+    def expose():
+        """Render every metric in the Prometheus text format."""
+        token = current_app.config['METRICS_TOKEN']
+        supplied = request.headers.get('Authorization', '').removeprefix('Bearer ')
+        if not hmac.compare_digest(supplied.encode(), token.encode()):
+            raise AuthError('Invalid metrics token', 'INVALID_METRICS_TOKEN')
+
+        if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+            registry = CollectorRegistry()
+            multiprocess.MultiProcessCollector(registry)
+        else:
+            registry = REGISTRY
+        return Response(generate_latest(registry), mimetype=CONTENT_TYPE_LATEST)
+
+    @staticmethod
+    def _request_started(app, **extra):
+        if request.endpoint == 'metrics':
+            return
+        g.metrics_started_at = time.perf_counter()
+        REQUESTS_IN_FLIGHT.inc()
+
+    @staticmethod
+    def _request_finished(app, response, **extra):
+        started = g.get('metrics_started_at')
+        if started is None:
+            return
+        labels = (request.blueprint or '', request.endpoint or 'unmatched', request.method)
+        REQUEST_DURATION.labels(*labels).observe(time.perf_counter() - started)
+        REQUESTS.labels(*labels, str(response.status_code)).inc()
+        if response.content_length is not None:
+            RESPONSE_SIZE.labels(*labels).observe(response.content_length)
+
+    @staticmethod
+    def _request_tearing_down(app, **extra):
+        if g.pop('metrics_started_at', None) is not None:
+            REQUESTS_IN_FLIGHT.dec()
+
+
+metrics = Metrics()
@@ -0,0 +1,184 @@
+"""Offset and keyset (cursor) pagination helpers for listing queries."""
+import base64
+import json
+from datetime import date, time
+from typing import List, Optional, Sequence, Tuple
+from flask import current_app, request
+from sqlalchemy import and_, or_
+from app.utils.errors import ValidationError
+
+
+def encode_cursor(sort_keys: Sequence[Tuple], item) -> str:
+    """
+    Encode an item's sort key as an opaque cursor token.
+
+    Args:
+        sort_keys: Sequence of (column, descending) pairs
+        item: Last item of the current page
+
+    Returns:
+        URL-safe cursor string
+    """
+    values = []
+    for column, _ in sort_keys:
+        value = getattr(item, column.key)
+        if isinstance(value, (date, time)):
+            value = value.isoformat()
+        values.append(value)
+
+    payload = json.dumps(values, separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip('=')
+
+
+def decode_cursor(sort_keys: Sequence[Tuple], cursor: str) -> List:
+    """
+    Decode a cursor token back into sort key values.
+
+    Args:
+        sort_keys: Sequence of (column, descending) pairs the cursor was built from
+        cursor: Cursor string returned by encode_cursor
+
+    Returns:
+        List of values, one per sort key
+
+    Raises:
+        ValidationError: If the cursor is malformed or does not match the sort keys
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != len(sort_keys):
+            raise ValueError('cursor length mismatch')
+
+        decoded = []
+        for (column, _), value in zip(sort_keys, values):
+            python_type = column.type.python_type
+            if python_type in (date, time):
+                value = python_type.fromisoformat(value)
+            elif not isinstance(value, python_type):
+                raise ValueError(f'unexpected value for {column.key}')
+            decoded.append(value)
+        return decoded
+    except (ValueError, TypeError):
+        raise ValidationError('Invalid pagination cursor', 'INVALID_CURSOR')
+
+
+def keyset_condition(sort_keys: Sequence[Tuple], values: Sequence):
+    """
+    Build a filter selecting rows that sort strictly after the given values.
+
+    Args:
+        sort_keys: Sequence of (column, descending) pairs
+        values: Sort key values of the last row already returned
+
+    Returns:
+        SQLAlchemy boolean expression
+    """
+    clauses = []
+    for index, (column, descending) in enumerate(sort_keys):
+        equal_prefix = [sort_keys[i][0] == values[i] for i in range(index)]
+        after = column < values[index] if descending else column > values[index]
+        clauses.append(and_(*equal_prefix, after))
+    return or_(*clauses)
+
+
+def paginate(
+    query,
+    sort_keys: Sequence[Tuple],
+    page: int = 1,
+    per_page: int = 20,
+    cursor: Optional[str] = None,
+    with_total: bool = True
+) -> Tuple[List, Optional[int], Optional[str]]:
+    """
+    Order and paginate a query by offset or by cursor.
+
+    The last sort key must be unique (normally the primary key) so that the
+    ordering is total and cursors never skip or repeat rows. When ``cursor``
+    is given (an empty string means the first page), rows are selected with a
+    keyset condition instead of an OFFSET, so every page costs the same.
+
+    Args:
+        query: Filtered query to paginate
+        sort_keys: Sequence of (column, descending) pairs
+        page: Page number for offset pagination
+        per_page: Items per page
+        cursor: Cursor from a previous page, enables keyset pagination
+        with_total: Whether to run a COUNT query for the total
+
+    Returns:
+        Tuple of (items, total count or None, next cursor or None)
+    """
+    query = query.order_by(*[
+        column.desc() if descending else column.asc()
+        for column, descending in sort_keys
+    ])
+
+    total = query.order_by(None).count() if with_total else None
+
+    if cursor is not None:
+        if cursor:
+            query = query.filter(keyset_condition(sort_keys, decode_cursor(sort_keys, cursor)))
+    else:
+        query = query.offset((max(page, 1) - 1) * per_page)
+
+    # Fetch one extra row to know whether another page exists
+    items = query.limit(per_page + 1).all()
+    next_cursor = None
+    if len(items) > per_page:
+        items = items[:per_page]
+        if items:
+            next_cursor = encode_cursor(sort_keys, items[-1])
+
+    return items, total, next_cursor
+
+
+def load_by_ids(query, model, ids: Sequence[str]) -> List:
+    """
+    Load the rows of a page selected elsewhere, in the order of their IDs.
+
+    Args:
+        query: Listing query with its loader options
+        model: Model of the listing
+        ids: Primary keys of the page, in page order
+
+    Returns:
+        Items in ID order (IDs deleted meanwhile are skipped)
+    """
+    if not ids:
+        return []
+    loaded = {item.id: item for item in query.filter(model.id.in_(ids)).all()}
+    return [loaded[item_id] for item_id in ids if item_id in loaded]
+
+
+def get_pagination_params() -> dict:
+    """
+    Read pagination parameters from the current request.
+
+    Query Parameters:
+        page: Page number (default: 1)
+        per_page: Items per page (default: 20, clamped to 1..MAX_PAGE_SIZE)
+        cursor: Opaque cursor from ``next_cursor``; an empty value starts
+            cursor pagination at the first page
+        include_total: Also count matching rows in cursor mode (true/false)
+
+    Returns:
+        Dictionary with page, per_page, cursor and with_total
+    """
+    config = current_app.config
+    per_page = request.args.get('per_page', config['DEFAULT_PAGE_SIZE'], type=int)
+    cursor = request.args.get('cursor')
+    with_total = cursor is None or request.args.get('include_total', '').lower() == 'true'
+    return {
+        'page': request.args.get('page', 1, type=int),
+        'per_page': min(max(per_page, 1), config['MAX_PAGE_SIZE']),
+        'cursor': cursor,
+        'with_total': with_total,
+    }
+
+
+def total_pages(total: Optional[int], per_page: int) -> Optional[int]:
+    """Return the page count for a total, or None when the total was skipped."""
+    if total is None:
+        return None
+    return (total + per_page - 1) // per_page if per_page > 0 else 0
@@ -0,0 +1,30 @@
+"""bcrypt helpers.
+
+Kept free of Flask and database imports so they can run in the password
+worker processes started by ``app.services.password_pool``.
+"""
+import bcrypt
+
+
+def hash_password(password: str, rounds: int) -> str:
+    """
+    Hash a password with bcrypt.
+
+    Args:
+        password: Plain-text password
+        rounds: bcrypt cost factor (log2 of the iteration count)
+
+    Returns:
+        Encoded bcrypt hash
+    """
+    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds)).decode('utf-8')
+
+
+def check_password(password: str, password_hash: str) -> bool:
+    """Check a plain-text password against a bcrypt hash."""
+    return bcrypt.checkpw(password.encode('utf-8'), password_hash.encode('utf-8'))
+
+
+def hash_rounds(password_hash: str) -> int:
+    """Return the cost factor a bcrypt hash was created with ($2b$<rounds>$...)."""
+    return int(password_hash.split('$')[2])
@@ -0,0 +1,248 @@
+"""Read-replica routing for public GET traffic.
+
+Replicas are configured as ``SQLALCHEMY_BINDS`` named ``replica_0``,
+``replica_1``, ... (built from ``REPLICA_DATABASE_URLS``). ``RoutingSession``
+sends a statement to a replica only when all of these hold:
+
+- the statement is a SELECT;
+- the request is a GET or HEAD on one of ``REPLICA_BLUEPRINTS``;
+- the session has not written anything in this request;
+- no write request committed on this host in the last
+  ``REPLICA_STICKY_SECONDS`` (read-your-writes: admin writes touch a marker
+  file whose mtime every worker checks);
+- a healthy replica is available.
+
+Everything else, including all admin traffic, uses the primary. Each request
+reads from one replica, chosen round-robin.
+
+Replica health is checked lazily, at most once every
+``REPLICA_CHECK_INTERVAL`` seconds per worker. A replica counts as healthy
+when it is reachable and every ``cache_versions`` row is at least as new as
+on the primary. Every admin write bumps one of those rows, so a replica that
+has not replayed the latest write falls back to the primary. Cache rebuilds
+that read from a replica also read their version from it, so a rebuilt cache
+is never older than the version it records.
+"""
+import itertools
+import logging
+import os
+import threading
+import time
+from typing import Dict, List, Optional
+from flask import g, has_request_context, request
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import ORMExecuteState
+from sqlalchemy.sql import Select, TextClause
+
+READ_METHODS = ('GET', 'HEAD')
+
+
+def replica_binds(urls: str) -> Dict[str, str]:
+    """
+    Build ``SQLALCHEMY_BINDS`` entries from a comma-separated list of URLs.
+
+    Args:
+        urls: Replica database URLs, comma-separated
+
+    Returns:
+        Bind name -> URL
+    """
+    urls = [url.strip() for url in (urls or '').split(',') if url.strip()]
+    return {f'replica_{i}': url for i, url in enumerate(urls)}
+
+
+def is_read(clause) -> bool:
+    """Return whether a statement only reads."""
+    if isinstance(clause, Select):
+        return True
+    if isinstance(clause, TextClause):
+        return clause.text.lstrip().lower().startswith('select')
+    return False
+
+
+class RoutingSession(Session):
+    """Flask-SQLAlchemy session sending eligible reads to a read replica."""
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and is_read(clause) and not self.info.get('wrote'):
+            engine = replica_router.read_engine(self)
+            if engine is not None:
+                return engine
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+class ReplicaRouter:
+    """Tracks replica health and write stickiness for ``RoutingSession``."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._engines: Dict[str, Engine] = {}
+        self._healthy: List[str] = []
+        self._checked_at = 0.0
+        self._cycle = itertools.cycle(())
+        self._listening = False
+        self.logger = logging.getLogger('app.replicas')
+        self.db = None
+        self.blueprints = ()
+        self.sticky_seconds = 0
+        self.check_interval = 0
+        self.marker_path = None
+
+    def init_app(self, app, db):
+        """
+        Pick up the replica engines and register the write hooks.
+
+        Args:
+            app: Flask application instance
+            db: Flask-SQLAlchemy extension using ``RoutingSession``
+        """
+        self.db = db
+        self.logger = app.logger.getChild('replicas')
+        self.blueprints = tuple(app.config['REPLICA_BLUEPRINTS'])
+        self.sticky_seconds = app.config['REPLICA_STICKY_SECONDS']
+        self.check_interval = app.config['REPLICA_CHECK_INTERVAL']
+        self.marker_path = app.config['REPLICA_WRITE_MARKER']
+        with app.app_context():
+            self._engines = {
+                key: engine for key, engine in db.engines.items()
+                if key and key.startswith('replica_')
+            }
+        self._healthy = []
+        self._checked_at = 0.0
+
+        if not self._listening:
+            event.listen(RoutingSession, 'after_flush', self._after_flush)
+            event.listen(RoutingSession, 'do_orm_execute', self._do_orm_execute)
+            event.listen(RoutingSession, 'after_commit', self._after_commit)
+            event.listen(RoutingSession, 'after_rollback', self._after_rollback)
+            self._listening = True
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any replica is configured."""
+        return bool(self._engines)
+
+    def read_engine(self, session: RoutingSession) -> Optional[Engine]:
+        """
+        Return the replica engine for a read in the current request, if any.
+
+        Args:
+            session: Session issuing the read
+
+        Returns:
+            Replica engine, or None to read from the primary
+        """
+        if not self._engines or not has_request_context():
+            return None
+        if 'read_replica' not in g:
+            g.read_replica = self._choose(session)
+        return g.read_replica
+
+    def status(self) -> Dict[str, Dict]:
+        """
+        Check every replica now.
+
+        Returns:
+            Bind name -> {'healthy': bool, 'lagging': [cache names behind the primary]}
+        """
+        primary = self._versions(self.db.engines[None])
+        return {key: self._check(engine, primary) for key, engine in self._engines.items()}
+
+    def _choose(self, session: RoutingSession) -> Optional[Engine]:
+        """Pick the replica for this request, or None for the primary."""
+        if request.method not in READ_METHODS or request.blueprint not in self.blueprints:
+            return None
+        if session.new or session.dirty or session.deleted or self._sticky():
+            return None
+        healthy = self._healthy_replicas()
+        if not healthy:
+            return None
+        with self._lock:
+            return self._engines[next(self._cycle)]
+
+    def _sticky(self) -> bool:
+        """Return whether a write request committed within the sticky window."""
+        try:
+            return time.time() - os.stat(self.marker_path).st_mtime < self.sticky_seconds
+        except FileNotFoundError:
+            return False
+
+    def _healthy_replicas(self) -> List[str]:
+        """Return the healthy replica names, re-checking them when due."""
+        if time.monotonic() - self._checked_at < self.check_interval:
+            return self._healthy
+        if not self._lock.acquire(blocking=False):
+            # Another thread is checking; use the previous result meanwhile
+            return self._healthy
+        try:
+            try:
+                primary = self._versions(self.db.engines[None])
+            except Exception:
+                self.logger.warning('Could not read cache versions from the primary', exc_info=True)
+                healthy = []
+            else:
+                healthy = [
+                    key for key, engine in self._engines.items()
+                    if self._check(engine, primary)['healthy']
+                ]
+            if healthy != self._healthy:
+                dropped = set(self._healthy) - set(healthy)
+                self.logger.log(
+                    logging.WARNING if dropped else logging.INFO,
+                    'Healthy read replicas: %s (of %s)', healthy or 'none', sorted(self._engines)
+                )
+                self._cycle = itertools.cycle(healthy)
+            self._healthy = healthy
+            self._checked_at = time.monotonic()
+            return healthy
+        finally:
+            self._lock.release()
+
+    def _check(self, engine: Engine, primary: Dict[str, int]) -> Dict:
+        """Compare a replica's cache versions with the primary's."""
+        try:
+            versions = self._versions(engine)
+        except Exception:
+            self.logger.debug('Read replica %s is unreachable', engine.url, exc_info=True)
+            return {'healthy': False, 'lagging': None}
+        lagging = sorted(name for name, version in primary.items() if versions.get(name, 0) < version)
+        return {'healthy': not lagging, 'lagging': lagging}
+
+    @staticmethod
+    def _versions(engine: Engine) -> Dict[str, int]:
+        """Read every cache version directly from an engine."""
+        from app.models import CacheVersion
+
+        with engine.connect() as conn:
+            return dict(conn.execute(select(CacheVersion.name, CacheVersion.version)).all())
+
+    # Session events
+
+    @staticmethod
+    def _after_flush(session, flush_context):
+        session.info['wrote'] = True
+
+    @staticmethod
+    def _do_orm_execute(orm_execute_state: ORMExecuteState):
+        if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+            orm_execute_state.session.info['wrote'] = True
+
+    def _after_commit(self, session):
+        wrote = session.info.pop('wrote', False)
+        if not wrote or not self._engines or not has_request_context():
+            return
+        # The rest of this request reads its own writes from the primary
+        g.read_replica = None
+        if request.method not in READ_METHODS:
+            # Touch the marker so every worker reads from the primary for a while
+            with open(self.marker_path, 'a'):
+                os.utime(self.marker_path)
+
+    @staticmethod
+    def _after_rollback(session):
+        session.info.pop('wrote', None)
+
+
+replica_router = ReplicaRouter()
@@ -0,0 +1,62 @@
+"""Compare two endpoint benchmark result files.
+
+Usage (from the backend directory)::
+
+    python -m benchmarks.compare baseline.json candidate.json [--threshold 10] [--fail-on-regression]
+
+An endpoint regresses when its p95 latency grows by more than the threshold
+percentage, or when it issues more queries per request than before.
+"""
+import argparse
+import json
+import sys
+
+
+def load(path):
+    with open(path) as handle:
+        return json.load(handle)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare two endpoint benchmark results.')
+    parser.add_argument('baseline')
+    parser.add_argument('candidate')
+    parser.add_argument('--threshold', type=float, default=10.0,
+                        help='allowed p95 latency growth in percent (default: 10)')
+    parser.add_argument('--fail-on-regression', action='store_true',
+                        help='exit with status 1 if any endpoint regressed')
+    args = parser.parse_args()
+
+    baseline, candidate = load(args.baseline), load(args.candidate)
+    for name, result in (('baseline', baseline), ('candidate', candidate)):
+        meta = result['meta']
+        print(f"{name:<10} {(meta['commit'] or '?')[:10]}{'+' if meta['dirty'] else ''} "
+              f"{meta['scale']} {meta['timestamp']}")
+
+    regressions = []
+    for mode, current in candidate['modes'].items():
+        previous = baseline['modes'].get(mode)
+        if previous is None:
+            continue
+        print(f'== {mode}')
+        for key, new in current['endpoints'].items():
+            old = previous['endpoints'].get(key)
+            if old is None or 'skipped' in old or 'skipped' in new:
+                continue
+            change = (new['p95_ms'] - old['p95_ms']) / old['p95_ms'] * 100 if old['p95_ms'] else 0.0
+            more_queries = new['queries_per_request'] > old['queries_per_request']
+            flag = ''
+            if change > args.threshold or more_queries:
+                flag = '  REGRESSION'
+                regressions.append(f'{mode} {key}')
+            print(f"  {key:<55} p95 {old['p95_ms']:>8.2f} -> {new['p95_ms']:>8.2f} ms ({change:+6.1f}%)  "
+                  f"q {old['queries_per_request']:>6.2f} -> {new['queries_per_request']:>6.2f}{flag}")
+
+    if regressions:
+        print(f'{len(regressions)} regression(s)')
+        if args.fail_on_regression:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
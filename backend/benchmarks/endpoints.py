@@ -0,0 +1,321 @@
+"""Request-level benchmark of every v1 endpoint.
+
+Seeds (or reuses) a synthetic catalogue, then drives each route registered by
+``app.api.v1.register_blueprints`` through the Flask test client and through
+a real gunicorn worker. For every endpoint it reports p50/p95/p99 latency,
+SQL queries per request and peak RSS, and writes the results as JSON so runs
+can be compared between commits with ``python -m benchmarks.compare``.
+
+Usage (from the backend directory)::
+
+    python -m benchmarks.endpoints --scale 10k
+    python -m benchmarks.endpoints --scale 100k --modes gunicorn --requests 100
+"""
+import argparse
+import http.client
+import json
+import os
+import platform
+import resource
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_OUTPUT = os.path.join(BACKEND_DIR, 'benchmarks', 'results')
+
+# Catalogue presets: name -> (sessions, speakers, tags per category)
+SCALES = {
+    '1k': (1_000, 50, 15),
+    '10k': (10_000, 200, 30),
+    '100k': (100_000, 2_000, 60),
+    '1M': (1_000_000, 20_000, 100),
+}
+
+
+class ClientDriver:
+    """Issue requests in-process through the Flask test client."""
+
+    name = 'client'
+
+    def __init__(self, app):
+        self.client = app.test_client()
+
+    def _send(self, call, tokens):
+        headers = {'Authorization': f'Bearer {tokens[call.auth]}'} if call.auth else {}
+        started = time.perf_counter()
+        response = self.client.open(call.path, method=call.method, json=call.json, headers=headers)
+        elapsed = time.perf_counter() - started
+        return response.status_code, elapsed, response.headers, response.get_data()
+
+    def fetch(self, call, tokens) -> Tuple[int, Optional[dict]]:
+        status, _, _, body = self._send(call, tokens)
+        return status, json.loads(body) if body else None
+
+    def timed(self, call, tokens) -> Tuple[int, float, Optional[int]]:
+        from benchmarks.instrument import QUERY_COUNT_HEADER
+
+        status, elapsed, headers, _ = self._send(call, tokens)
+        return status, elapsed, int(headers[QUERY_COUNT_HEADER])
+
+    def peak_rss_kb(self) -> int:
+        # ru_maxrss is in KiB on Linux
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    def close(self):
+        pass
+
+
+class GunicornDriver:
+    """Issue requests over HTTP to a single gunicorn worker."""
+
+    name = 'gunicorn'
+
+    def __init__(self, env: Dict[str, str]):
+        with socket.socket() as sock:
+            sock.bind(('127.0.0.1', 0))
+            self.port = sock.getsockname()[1]
+        self.workers = set()
+        self.process = subprocess.Popen(
+            [sys.executable, '-m', 'gunicorn', '--workers', '1', '--bind', f'127.0.0.1:{self.port}',
+             '--log-level', 'warning', 'benchmarks.wsgi:app'],
+            cwd=BACKEND_DIR, env=env
+        )
+        deadline = time.monotonic() + 60
+        while True:
+            try:
+                connection = http.client.HTTPConnection('127.0.0.1', self.port, timeout=5)
+                connection.request('GET', '/health')
+                connection.getresponse().read()
+                break
+            except OSError:
+                if self.process.poll() is not None or time.monotonic() > deadline:
+                    raise RuntimeError('gunicorn did not start')
+                time.sleep(0.2)
+
+    def _send(self, call, tokens):
+        headers = {'Content-Type': 'application/json'}
+        if call.auth:
+            headers['Authorization'] = f'Bearer {tokens[call.auth]}'
+        body = json.dumps(call.json) if call.json is not None else None
+        connection = http.client.HTTPConnection('127.0.0.1', self.port, timeout=60)
+        started = time.perf_counter()
+        connection.request(call.method, call.path, body=body, headers=headers)
+        response = connection.getresponse()
+        data = response.read()
+        elapsed = time.perf_counter() - started
+        connection.close()
+        return response.status, elapsed, response.headers, data
+
+    def fetch(self, call, tokens):
+        status, _, _, body = self._send(call, tokens)
+        return status, json.loads(body) if body else None
+
+    def timed(self, call, tokens):
+        from benchmarks.instrument import QUERY_COUNT_HEADER, WORKER_PID_HEADER
+
+        status, elapsed, headers, _ = self._send(call, tokens)
+        self.workers.add(int(headers[WORKER_PID_HEADER]))
+        return status, elapsed, int(headers[QUERY_COUNT_HEADER])
+
+    def peak_rss_kb(self) -> Optional[int]:
+        from benchmarks.instrument import peak_rss_kb
+
+        peaks = [peak_rss_kb(pid) for pid in self.workers]
+        peaks = [peak for peak in peaks if peak is not None]
+        return max(peaks, default=None)
+
+    def close(self):
+        self.process.terminate()
+        self.process.wait(timeout=30)
+
+
+def summarize(latencies: List[float], statuses: Counter, queries: List[int], rss: Optional[int]) -> Dict:
+    """Reduce the samples of one endpoint to the reported figures."""
+    millis = sorted(value * 1000 for value in latencies)
+    if len(millis) > 1:
+        cuts = statistics.quantiles(millis, n=100, method='inclusive')
+        p50, p95, p99 = cuts[49], cuts[94], cuts[98]
+    else:
+        p50 = p95 = p99 = millis[0]
+    return {
+        'requests': len(millis),
+        'status_codes': {str(code): count for code, count in sorted(statuses.items())},
+        'p50_ms': round(p50, 3),
+        'p95_ms': round(p95, 3),
+        'p99_ms': round(p99, 3),
+        'mean_ms': round(statistics.fmean(millis), 3),
+        'max_ms': round(millis[-1], 3),
+        'queries_per_request': round(statistics.fmean(queries), 2),
+        'peak_rss_kb': rss,
+    }
+
+
+def routes(app):
+    """List (endpoint, method, rule) for every route under the v1 blueprint."""
+    found = []
+    for rule in app.url_map.iter_rules():
+        if not rule.endpoint.startswith('api_v1.'):
+            continue
+        for method in sorted(rule.methods - {'HEAD', 'OPTIONS'}):
+            found.append((rule.endpoint, method, rule.rule))
+    return sorted(found, key=lambda route: (route[2], route[1]))
+
+
+def sample_context(driver):
+    """Build a scenario context with sample IDs from the seeded catalogue."""
+    from datetime import date
+    from app.models import Session, Recording, Speaker, Tag
+    from benchmarks.scenarios import Context
+
+    def ids(query):
+        return [row[0] for row in query.limit(1000).all()]
+
+    today = date.today()
+    session_id = Session.query.with_entities(Session.id)
+    return Context(
+        driver=driver,
+        upcoming_ids=ids(session_id.filter(Session.status == 'published', Session.date >= today)),
+        past_ids=ids(session_id.filter(Session.status.in_(('published', 'completed')), Session.date < today)),
+        recording_ids=ids(Recording.query.with_entities(Recording.id)),
+        speaker_ids=ids(Speaker.query.with_entities(Speaker.id)),
+        tag_ids={
+            category: ids(Tag.query.with_entities(Tag.id).filter_by(category=category, is_active=True))
+            for category in ('organ', 'type', 'level')
+        },
+    )
+
+
+def run_mode(app, driver, requests: int, warmup: int, only: Optional[str]) -> Dict:
+    """Benchmark every route with one driver."""
+    from benchmarks.scenarios import SCENARIOS
+
+    with app.app_context():
+        ctx = sample_context(driver)
+
+    endpoints = {}
+    for endpoint, method, rule in routes(app):
+        key = f'{method} {rule}'
+        if only and only not in key:
+            continue
+        build = SCENARIOS.get((endpoint, method))
+        if build is None:
+            endpoints[key] = {'skipped': 'no scenario'}
+            print(f'  {key:<55} skipped (no scenario)')
+            continue
+
+        # Tokens are short-lived under the testing config
+        ctx.login()
+        latencies, queries, statuses = [], [], Counter()
+        for i in range(warmup + requests):
+            status, elapsed, count = driver.timed(build(ctx, i), ctx.tokens)
+            if i < warmup:
+                continue
+            latencies.append(elapsed)
+            queries.append(count)
+            statuses[status] += 1
+
+        endpoints[key] = summarize(latencies, statuses, queries, driver.peak_rss_kb())
+        result = endpoints[key]
+        print(f"  {key:<55} p50 {result['p50_ms']:>8.2f} ms  p95 {result['p95_ms']:>8.2f} ms  "
+              f"p99 {result['p99_ms']:>8.2f} ms  q {result['queries_per_request']:>6.2f}  "
+              f"{','.join(result['status_codes'])}")
+
+    return {'peak_rss_kb': driver.peak_rss_kb(), 'endpoints': endpoints}
+
+
+def git_revision() -> Dict:
+    """Return the current commit and whether the tree has local changes."""
+    def git(*args):
+        return subprocess.run(
+            ['git', *args], cwd=BACKEND_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+
+    try:
+        return {'commit': git('rev-parse', 'HEAD'), 'dirty': bool(git('status', '--porcelain'))}
+    except (OSError, subprocess.CalledProcessError):
+        return {'commit': None, 'dirty': None}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark every v1 endpoint.')
+    parser.add_argument('--scale', choices=list(SCALES), default='1k',
+                        help='size of the synthetic catalogue (default: 1k)')
+    parser.add_argument('--database', help='SQLAlchemy URL of the benchmark database; seeded when '
+                        'empty (default: a SQLite file per scale in the temp directory)')
+    parser.add_argument('--modes', nargs='+', choices=('client', 'gunicorn'), default=['client', 'gunicorn'])
+    parser.add_argument('--requests', type=int, default=30, help='timed requests per endpoint')
+    parser.add_argument('--warmup', type=int, default=3, help='untimed requests per endpoint')
+    parser.add_argument('--endpoint', help='only run routes whose "METHOD /path" contains this')
+    parser.add_argument('--no-response-cache', action='store_true', help='disable the public response cache')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help='directory for the JSON results')
+    args = parser.parse_args()
+
+    database = args.database or 'sqlite:///' + os.path.join(
+        tempfile.gettempdir(), f'digipath-bench-{args.scale}.db'
+    )
+    # Configure before the app (and its config module) is imported
+    os.environ['TEST_DATABASE_URL'] = database
+    if args.no_response_cache:
+        os.environ['RESPONSE_CACHE_BACKEND'] = 'none'
+
+    from app import create_app
+    from app.extensions import db
+    from app.models import Session
+    from benchmarks import instrument
+    from benchmarks.fixtures import seed_catalogue, catalogue_counts
+
+    app = create_app('testing')
+    instrument.install(app)
+    with app.app_context():
+        db.create_all()
+        if Session.query.first() is None:
+            sessions, speakers, tags = SCALES[args.scale]
+            print(f'Seeding {args.scale} catalogue into {database} ...')
+            started = time.perf_counter()
+            seed_catalogue(sessions, speakers, tags)
+            print(f'Seeded in {time.perf_counter() - started:.1f} s')
+        counts = catalogue_counts()
+        dialect = db.engine.dialect.name
+
+    results = {
+        'meta': {
+            **git_revision(),
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'scale': args.scale,
+            'counts': counts,
+            'dialect': dialect,
+            'requests': args.requests,
+            'warmup': args.warmup,
+            'response_cache': not args.no_response_cache,
+            'python': platform.python_version(),
+        },
+        'modes': {},
+    }
+
+    for mode in args.modes:
+        print(f'== {mode}')
+        driver = ClientDriver(app) if mode == 'client' else GunicornDriver(dict(os.environ))
+        try:
+            results['modes'][mode] = run_mode(app, driver, args.requests, args.warmup, args.endpoint)
+        finally:
+            driver.close()
+
+    os.makedirs(args.output, exist_ok=True)
+    commit = (results['meta']['commit'] or 'nogit')[:10]
+    path = os.path.join(
+        args.output, f"{datetime.now():%Y%m%d-%H%M%S}-{commit}-{args.scale}.json"
+    )
+    with open(path, 'w') as handle:
+        json.dump(results, handle, indent=2, sort_keys=True)
+    print(f'Results written to {path}')
+
+
+if __name__ == '__main__':
+    main()
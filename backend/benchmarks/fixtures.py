@@ -0,0 +1,177 @@
+"""Synthetic catalogue used by the benchmarks.
+
+``seed_catalogue`` scales the shape of ``seed.py`` up to any number of
+speakers, tags, sessions and recordings. Rows are written with bulk Core
+inserts in batches, so even a million sessions seed in minutes.
+"""
+import random
+import uuid
+from datetime import date, datetime, time, timedelta
+from typing import Dict, Optional
+from app.extensions import db
+from app.models import AdminUser, Speaker, Tag, Session, Recording
+
+BENCH_ADMIN_EMAIL = 'bench@example.com'
+BENCH_ADMIN_PASSWORD = 'bench-password'
+
+BATCH_SIZE = 5_000
+
+# Vocabulary for titles and abstracts, so search has something to match
+WORDS = (
+    'carcinoma', 'lymphoma', 'sarcoma', 'adenoma', 'biopsy', 'cytology', 'frozen',
+    'section', 'immunohistochemistry', 'morphology', 'grading', 'staging', 'margin',
+    'metastatic', 'benign', 'malignant', 'differential', 'diagnosis', 'pitfalls',
+    'molecular', 'marker', 'review', 'update', 'cases', 'approach', 'pattern',
+)
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return ' '.join(rng.choice(WORDS) for _ in range(words)).capitalize()
+
+
+def _insert(model, rows):
+    """Insert rows into a model's table in batches."""
+    for start in range(0, len(rows), BATCH_SIZE):
+        db.session.execute(model.__table__.insert(), rows[start:start + BATCH_SIZE])
+
+
+def seed_catalogue(
+    sessions: int = 100,
+    speakers: Optional[int] = None,
+    tags_per_category: Optional[int] = None,
+    seed: int = 42,
+) -> Dict[str, int]:
+    """
+    Fill an empty database with a synthetic catalogue.
+
+    Roughly a fifth of the sessions are upcoming (mostly published, some
+    drafts); the rest are past, and most of those are completed with a
+    recording.
+
+    Args:
+        sessions: Number of sessions to create
+        speakers: Number of speakers (default: sessions / 50, at least 10)
+        tags_per_category: Number of organ, type and level tags each (default 5)
+        seed: Random seed, so repeated runs generate the same data
+
+    Returns:
+        Dictionary of row counts per table
+    """
+    rng = random.Random(seed)
+    speakers = speakers or max(10, sessions // 50)
+    tags_per_category = tags_per_category or 5
+    now = datetime.utcnow()
+    today = date.today()
+
+    admin = AdminUser(name='Bench Admin', email=BENCH_ADMIN_EMAIL, role='super_admin')
+    admin.set_password(BENCH_ADMIN_PASSWORD)
+    db.session.add(admin)
+    db.session.flush()
+
+    speaker_rows = [{
+        'id': str(uuid.uuid4()),
+        'name': f'Dr. Speaker {i}',
+        'designation': 'Professor, Department of Pathology',
+        'is_aiims': i % 3 != 0,
+        'created_at': now,
+        'updated_at': now,
+    } for i in range(speakers)]
+    _insert(Speaker, speaker_rows)
+
+    tag_ids = {}
+    tag_rows = []
+    for category in ('organ', 'type', 'level'):
+        tag_ids[category] = []
+        for i in range(tags_per_category):
+            tag_id = str(uuid.uuid4())
+            tag_ids[category].append(tag_id)
+            tag_rows.append({
+                'id': tag_id,
+                'category': category,
+                'label': f'{category.title()} {i}',
+                'is_active': True,
+                'created_at': now,
+                'updated_at': now,
+            })
+    _insert(Tag, tag_rows)
+
+    # Spread sessions over ten years of history and one year ahead
+    past_days = 3650
+    future_days = 365
+    session_rows = []
+    recording_rows = []
+    for i in range(sessions):
+        upcoming = rng.random() < 0.2
+        if upcoming:
+            day = today + timedelta(days=rng.randint(0, future_days))
+            status = 'draft' if rng.random() < 0.2 else 'published'
+        else:
+            day = today - timedelta(days=rng.randint(1, past_days))
+            status = 'completed' if rng.random() < 0.85 else 'published'
+
+        session_id = str(uuid.uuid4())
+        created = now - timedelta(seconds=sessions - i)
+        session_rows.append({
+            'id': session_id,
+            'title': f'{_sentence(rng, 5)} {i}',
+            'summary': _sentence(rng, 20),
+            'abstract': _sentence(rng, 120),
+            'objectives': [_sentence(rng, 6) for _ in range(3)],
+            'date': day,
+            'time': time(rng.choice((10, 14, 16)), rng.choice((0, 30))),
+            'duration_minutes': rng.choice((45, 60, 90)),
+            'status': status,
+            'platform': 'Zoom',
+            'meeting_link': f'https://zoom.us/j/{rng.randint(10**9, 10**10 - 1)}',
+            'meeting_id': None,
+            'meeting_password': None,
+            'speaker_id': rng.choice(speaker_rows)['id'],
+            'organ_tag_id': rng.choice(tag_ids['organ']),
+            'type_tag_id': rng.choice(tag_ids['type']),
+            'level_tag_id': rng.choice(tag_ids['level']),
+            'created_by': admin.id,
+            'created_at': created,
+            'updated_at': created,
+        })
+        if status == 'completed':
+            video_id = f'bench{i:07d}'
+            recording_rows.append({
+                'id': str(uuid.uuid4()),
+                'session_id': session_id,
+                'youtube_url': f'https://www.youtube.com/watch?v={video_id}',
+                'thumbnail_url': f'https://img.youtube.com/vi/{video_id}/maxresdefault.jpg',
+                'pdf_url': None,
+                'recorded_date': day,
+                'views_count': int(rng.paretovariate(1.2) * 10),
+                'created_at': created,
+                'updated_at': created,
+            })
+
+        if len(session_rows) >= BATCH_SIZE:
+            _insert(Session, session_rows)
+            _insert(Recording, recording_rows)
+            session_rows, recording_rows = [], []
+
+    _insert(Session, session_rows)
+    _insert(Recording, recording_rows)
+    db.session.commit()
+
+    from app.services.search_index import search_index
+    from app.services.recording_archive import recording_archive
+    from app.services.session_listings import session_listings
+    search_index.rebuild()
+    recording_archive.rebuild()
+    session_listings.rebuild()
+    db.session.commit()
+
+    return catalogue_counts()
+
+
+def catalogue_counts() -> Dict[str, int]:
+    """Return the number of rows in each catalogue table."""
+    return {
+        'speakers': Speaker.query.count(),
+        'tags': Tag.query.count(),
+        'sessions': Session.query.count(),
+        'recordings': Recording.query.count(),
+    }
@@ -0,0 +1,50 @@
+"""Per-request measurements exposed to the benchmark drivers as headers."""
+import os
+from flask import g, has_request_context
+from sqlalchemy import event
+from app.extensions import db
+
+QUERY_COUNT_HEADER = 'X-Bench-Queries'
+WORKER_PID_HEADER = 'X-Bench-Worker'
+
+
+def install(app):
+    """
+    Count SQL statements per request and report them in a response header.
+
+    Args:
+        app: Flask application instance
+    """
+    with app.app_context():
+        engine = db.engine
+
+    @event.listens_for(engine, 'before_cursor_execute')
+    def count_query(conn, cursor, statement, parameters, context, executemany):
+        if has_request_context():
+            g.bench_queries = g.get('bench_queries', 0) + 1
+
+    @app.after_request
+    def add_headers(response):
+        response.headers[QUERY_COUNT_HEADER] = str(g.get('bench_queries', 0))
+        response.headers[WORKER_PID_HEADER] = str(os.getpid())
+        return response
+
+
+def peak_rss_kb(pid: int):
+    """
+    Return the peak resident set size of a process in KiB (Linux only).
+
+    Args:
+        pid: Process ID
+
+    Returns:
+        Peak RSS, or None when /proc is unavailable
+    """
+    try:
+        with open(f'/proc/{pid}/status') as status:
+            for line in status:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
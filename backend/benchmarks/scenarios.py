@@ -0,0 +1,385 @@
+"""One request recipe per v1 endpoint.
+
+A scenario maps an iteration number to the request to time. Anything the
+request needs beforehand - a draft session to delete, a recording to update -
+is created inside the scenario through the API, and that setup is not timed.
+Endpoints registered without a scenario are reported as skipped, so new
+routes show up in the results as missing coverage.
+"""
+import uuid
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+from benchmarks.fixtures import BENCH_ADMIN_EMAIL, BENCH_ADMIN_PASSWORD, WORDS
+
+
+@dataclass
+class Call:
+    """A request to time."""
+
+    method: str
+    path: str
+    json: Optional[dict] = None
+    # None, 'access' or 'refresh'
+    auth: Optional[str] = None
+
+
+@dataclass
+class Context:
+    """Shared state: the driver, tokens and sample IDs from the catalogue."""
+
+    driver: object
+    upcoming_ids: List[str]
+    past_ids: List[str]
+    recording_ids: List[str]
+    speaker_ids: List[str]
+    tag_ids: Dict[str, List[str]]
+    tokens: Dict[str, str] = field(default_factory=dict)
+    scratch: Dict[str, str] = field(default_factory=dict)
+
+    def login(self):
+        """Fetch fresh access and refresh tokens."""
+        body = self.setup(Call('POST', '/api/v1/auth/login', {
+            'email': BENCH_ADMIN_EMAIL, 'password': BENCH_ADMIN_PASSWORD
+        }))
+        self.tokens = {'access': body['access_token'], 'refresh': body['refresh_token']}
+
+    def setup(self, call: Call) -> dict:
+        """Issue an untimed request and return its JSON body."""
+        status, body = self.driver.fetch(call, self.tokens)
+        if status >= 400:
+            raise RuntimeError(f'Setup request {call.method} {call.path} failed: {status} {body}')
+        return body
+
+    def create_session(self, publish: bool = False) -> str:
+        """Create a future draft session through the API and return its ID."""
+        body = self.setup(Call('POST', '/api/v1/admin/sessions', session_payload(self), 'access'))
+        if publish:
+            self.setup(Call('POST', f"/api/v1/admin/sessions/{body['id']}/publish", None, 'access'))
+        return body['id']
+
+    def create_recording(self) -> str:
+        """Create a session with a recording and return the recording ID."""
+        session_id = self.create_session()
+        body = self.setup(Call('POST', '/api/v1/admin/recordings', recording_payload(session_id), 'access'))
+        return body['id']
+
+    def scratch_id(self, kind: str, create: Callable[[], str]) -> str:
+        """Return a long-lived object of a kind, creating it on first use."""
+        if kind not in self.scratch:
+            self.scratch[kind] = create()
+        return self.scratch[kind]
+
+
+def pick(ids: List[str], i: int) -> str:
+    """Spread iterations over a list of IDs."""
+    return ids[(i * 7919) % len(ids)]
+
+
+def session_payload(ctx: Context) -> dict:
+    return {
+        'title': f'Benchmark session {uuid.uuid4().hex[:8]}',
+        'summary': 'Created by the benchmark suite',
+        'abstract': 'Created by the benchmark suite',
+        'objectives': ['Measure'],
+        'date': (date.today() + timedelta(days=30)).isoformat(),
+        'time': '14:00:00',
+        'duration_minutes': 60,
+        'platform': 'Zoom',
+        'meeting_link': 'https://zoom.us/j/123456789',
+        'speaker_id': ctx.speaker_ids[0],
+        'organ_tag_id': ctx.tag_ids['organ'][0],
+        'type_tag_id': ctx.tag_ids['type'][0],
+        'level_tag_id': ctx.tag_ids['level'][0],
+    }
+
+
+def recording_payload(session_id: str) -> dict:
+    return {
+        'session_id': session_id,
+        'youtube_url': f'https://www.youtube.com/watch?v={uuid.uuid4().hex[:11]}',
+        'recorded_date': date.today().isoformat(),
+    }
+
+
+SCENARIOS: Dict[Tuple[str, str], Callable[[Context, int], Call]] = {}
+
+
+def scenario(endpoint: str, method: str = 'GET'):
+    """Register the request recipe for an endpoint and method."""
+    def register(fn):
+        SCENARIOS[(f'api_v1.{endpoint}', method)] = fn
+        return fn
+    return register
+
+
+# Public
+
+@scenario('public.get_home_data')
+def home(ctx, i):
+    return Call('GET', '/api/v1/public/home')
+
+
+@scenario('public.list_upcoming_sessions')
+def public_upcoming(ctx, i):
+    variants = [
+        '?page=1',
+        f'?page={i % 5 + 1}',
+        f"?organ_tag_id={pick(ctx.tag_ids['organ'], i)}",
+        f'?search={WORDS[i % len(WORDS)]}',
+    ]
+    return Call('GET', '/api/v1/public/sessions/upcoming' + variants[i % len(variants)])
+
+
+@scenario('public.get_session_detail')
+def public_session(ctx, i):
+    return Call('GET', f'/api/v1/public/sessions/{pick(ctx.upcoming_ids + ctx.past_ids, i)}')
+
+
+@scenario('public.download_calendar')
+def public_calendar(ctx, i):
+    return Call('GET', f'/api/v1/public/sessions/{pick(ctx.upcoming_ids, i)}/calendar')
+
+
+@scenario('public.get_upcoming_session_facets')
+def public_upcoming_facets(ctx, i):
+    variants = ['', f"?level_tag_id={pick(ctx.tag_ids['level'], i)}", f'?search={WORDS[i % len(WORDS)]}']
+    return Call('GET', f'/api/v1/public/sessions/upcoming/facets{variants[i % len(variants)]}')
+
+
+@scenario('public.calendar_feed')
+def public_calendar_feed(ctx, i):
+    variants = ['', f"?organ_tag_id={pick(ctx.tag_ids['organ'], i)}"]
+    return Call('GET', f'/api/v1/public/calendar.ics{variants[i % len(variants)]}')
+
+
+@scenario('public.list_recordings')
+def public_recordings(ctx, i):
+    variants = [
+        '?page=1',
+        f'?page={i % 20 + 1}',
+        '?sort_by=most_viewed',
+        f"?type_tag_id={pick(ctx.tag_ids['type'], i)}",
+        f'?year={date.today().year - i % 5}',
+        f'?search={WORDS[i % len(WORDS)]}',
+    ]
+    return Call('GET', '/api/v1/public/recordings' + variants[i % len(variants)])
+
+
+@scenario('public.get_recording_facets')
+def public_recording_facets(ctx, i):
+    variants = [
+        '',
+        f"?organ_tag_id={pick(ctx.tag_ids['organ'], i)}",
+        f"?type_tag_id={pick(ctx.tag_ids['type'], i)}&year={date.today().year - i % 5}",
+        f'?search={WORDS[i % len(WORDS)]}',
+    ]
+    return Call('GET', '/api/v1/public/recordings/facets' + variants[i % len(variants)])
+
+
+@scenario('public.get_recording_years')
+def public_recording_years(ctx, i):
+    return Call('GET', '/api/v1/public/recordings/years')
+
+
+@scenario('public.get_recording_detail')
+def public_recording(ctx, i):
+    return Call('GET', f'/api/v1/public/recordings/{pick(ctx.recording_ids, i)}')
+
+
+@scenario('public.get_tags')
+def public_tags(ctx, i):
+    return Call('GET', '/api/v1/public/tags' + ('?category=organ' if i % 2 else ''))
+
+
+# Auth
+
+@scenario('auth.login', 'POST')
+def login(ctx, i):
+    return Call('POST', '/api/v1/auth/login', {'email': BENCH_ADMIN_EMAIL, 'password': BENCH_ADMIN_PASSWORD})
+
+
+@scenario('auth.refresh', 'POST')
+def refresh(ctx, i):
+    return Call('POST', '/api/v1/auth/refresh', None, 'refresh')
+
+
+@scenario('auth.logout', 'POST')
+def logout(ctx, i):
+    return Call('POST', '/api/v1/auth/logout', None, 'access')
+
+
+@scenario('auth.get_current_user')
+def me(ctx, i):
+    return Call('GET', '/api/v1/auth/me', None, 'access')
+
+
+# Admin sessions
+
+@scenario('admin_sessions.list_sessions')
+def admin_sessions(ctx, i):
+    variants = ['?page=1', f'?page={i % 20 + 1}', '?status=draft']
+    return Call('GET', '/api/v1/admin/sessions' + variants[i % len(variants)], None, 'access')
+
+
+@scenario('admin_sessions.list_upcoming_sessions')
+def admin_upcoming(ctx, i):
+    return Call('GET', '/api/v1/admin/sessions/upcoming', None, 'access')
+
+
+@scenario('admin_sessions.list_past_sessions')
+def admin_past(ctx, i):
+    variants = ['?page=1', f'?page={i % 20 + 1}', f'?search={WORDS[i % len(WORDS)]}']
+    return Call('GET', '/api/v1/admin/sessions/past' + variants[i % len(variants)], None, 'access')
+
+
+@scenario('admin_sessions.get_session')
+def admin_session(ctx, i):
+    return Call('GET', f'/api/v1/admin/sessions/{pick(ctx.past_ids, i)}', None, 'access')
+
+
+@scenario('admin_sessions.create_session', 'POST')
+def create_session(ctx, i):
+    return Call('POST', '/api/v1/admin/sessions', session_payload(ctx), 'access')
+
+
+@scenario('admin_sessions.update_session', 'PUT')
+def update_session(ctx, i):
+    session_id = ctx.scratch_id('session', ctx.create_session)
+    return Call('PUT', f'/api/v1/admin/sessions/{session_id}', {'title': f'Benchmark update {i}'}, 'access')
+
+
+@scenario('admin_sessions.delete_session', 'DELETE')
+def delete_session(ctx, i):
+    return Call('DELETE', f'/api/v1/admin/sessions/{ctx.create_session()}', None, 'access')
+
+
+@scenario('admin_sessions.publish_session', 'POST')
+def publish_session(ctx, i):
+    return Call('POST', f'/api/v1/admin/sessions/{ctx.create_session()}/publish', None, 'access')
+
+
+@scenario('admin_sessions.unpublish_session', 'POST')
+def unpublish_session(ctx, i):
+    session_id = ctx.create_session(publish=True)
+    return Call('POST', f'/api/v1/admin/sessions/{session_id}/unpublish', None, 'access')
+
+
+@scenario('admin_sessions.complete_session', 'POST')
+def complete_session(ctx, i):
+    session_id = ctx.create_session(publish=True)
+    return Call('POST', f'/api/v1/admin/sessions/{session_id}/complete', {
+        'youtube_url': f'https://www.youtube.com/watch?v={uuid.uuid4().hex[:11]}'
+    }, 'access')
+
+
+# Admin recordings
+
+@scenario('admin_recordings.create_recording', 'POST')
+def create_recording(ctx, i):
+    return Call('POST', '/api/v1/admin/recordings', recording_payload(ctx.create_session()), 'access')
+
+
+@scenario('admin_recordings.update_recording', 'PUT')
+def update_recording(ctx, i):
+    recording_id = ctx.scratch_id('recording', ctx.create_recording)
+    return Call('PUT', f'/api/v1/admin/recordings/{recording_id}', {
+        'pdf_url': f'https://example.com/slides-{i}.pdf'
+    }, 'access')
+
+
+@scenario('admin_recordings.delete_recording', 'DELETE')
+def delete_recording(ctx, i):
+    return Call('DELETE', f'/api/v1/admin/recordings/{ctx.create_recording()}', None, 'access')
+
+
+# Admin speakers
+
+def _create_speaker(ctx):
+    return ctx.setup(Call('POST', '/api/v1/admin/speakers', {
+        'name': f'Dr. Bench {uuid.uuid4().hex[:8]}', 'designation': 'Benchmark'
+    }, 'access'))['id']
+
+
+@scenario('admin_speakers.list_speakers')
+def list_speakers(ctx, i):
+    return Call('GET', '/api/v1/admin/speakers', None, 'access')
+
+
+@scenario('admin_speakers.create_speaker', 'POST')
+def create_speaker(ctx, i):
+    return Call('POST', '/api/v1/admin/speakers', {
+        'name': f'Dr. Bench {uuid.uuid4().hex[:8]}', 'designation': 'Benchmark'
+    }, 'access')
+
+
+@scenario('admin_speakers.update_speaker', 'PUT')
+def update_speaker(ctx, i):
+    speaker_id = ctx.scratch_id('speaker', lambda: _create_speaker(ctx))
+    return Call('PUT', f'/api/v1/admin/speakers/{speaker_id}', {'designation': f'Benchmark {i}'}, 'access')
+
+
+@scenario('admin_speakers.delete_speaker', 'DELETE')
+def delete_speaker(ctx, i):
+    return Call('DELETE', f'/api/v1/admin/speakers/{_create_speaker(ctx)}', None, 'access')
+
+
+# Admin tags
+
+def _create_tag(ctx):
+    return ctx.setup(Call('POST', '/api/v1/admin/tags', {
+        'category': 'level', 'label': f'Bench {uuid.uuid4().hex[:8]}'
+    }, 'access'))['id']
+
+
+@scenario('admin_tags.list_tags')
+def list_tags(ctx, i):
+    return Call('GET', '/api/v1/admin/tags' + ('?category=organ' if i % 2 else ''), None, 'access')
+
+
+@scenario('admin_tags.create_tag', 'POST')
+def create_tag(ctx, i):
+    return Call('POST', '/api/v1/admin/tags', {
+        'category': 'level', 'label': f'Bench {uuid.uuid4().hex[:8]}'
+    }, 'access')
+
+
+@scenario('admin_tags.update_tag', 'PUT')
+def update_tag(ctx, i):
+    tag_id = ctx.scratch_id('tag', lambda: _create_tag(ctx))
+    return Call('PUT', f'/api/v1/admin/tags/{tag_id}', {'label': f'Bench {uuid.uuid4().hex[:8]}'}, 'access')
+
+
+@scenario('admin_tags.delete_tag', 'DELETE')
+def delete_tag(ctx, i):
+    return Call('DELETE', f'/api/v1/admin/tags/{_create_tag(ctx)}', None, 'access')
+
+
+@scenario('admin_tags.get_tag_usage')
+def tag_usage(ctx, i):
+    return Call('GET', f"/api/v1/admin/tags/{pick(ctx.tag_ids['organ'], i)}/usage", None, 'access')
+
+
+# Admin cache
+
+@scenario('admin_cache.get_cache_stats')
+def cache_stats(ctx, i):
+    return Call('GET', '/api/v1/admin/cache', None, 'access')
+
+
+@scenario('admin_cache.clear_cache', 'DELETE')
+def clear_cache(ctx, i):
+    return Call('DELETE', '/api/v1/admin/cache', None, 'access')
+
+
+@scenario('admin_export.export')
+def export(ctx, i):
+    variants = [
+        'sessions',
+        'sessions?format=ndjson&status=published',
+        'recordings',
+        f"recordings?format=ndjson&organ_tag_id={pick(ctx.tag_ids['organ'], i)}",
+        'speakers',
+        'tags?format=ndjson',
+    ]
+    return Call('GET', '/api/v1/admin/export/' + variants[i % len(variants)], None, 'access')
@@ -0,0 +1,69 @@
+"""Compare marshmallow dumps with the compiled serializers on 100-row pages.
+
+Usage (from the backend directory)::
+
+    python -m benchmarks.serializers [--rows 100] [--repeat 20]
+"""
+import argparse
+import json
+import os
+import timeit
+
+# Run against a throwaway in-memory database
+os.environ['DATABASE_URL'] = 'sqlite://'
+
+from app import create_app  # noqa: E402
+from app.extensions import db  # noqa: E402
+from app.schemas import SessionResponseSchema, RecordingResponseSchema  # noqa: E402
+from app.schemas.serializers import serialize_session, serialize_recording_with_session  # noqa: E402
+from app.services import SessionService  # noqa: E402
+from benchmarks.fixtures import seed_catalogue  # noqa: E402
+
+
+def marshmallow_session(session, schema=SessionResponseSchema()):
+    """Serialize a session the way the endpoints did before compilation."""
+    data = schema.dump(session)
+    if session.recording is None:
+        data.pop('recording', None)
+    data['has_recording'] = session.recording is not None
+    return data
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=100, help='rows per page')
+    parser.add_argument('--repeat', type=int, default=20, help='timed passes per serializer')
+    args = parser.parse_args()
+
+    app = create_app('development')
+    with app.app_context():
+        db.create_all()
+        seed_catalogue(args.rows * 2)
+
+        sessions = SessionService.listing_query().limit(args.rows).all()
+        recordings = SessionService.recording_listing_query().limit(args.rows).all()
+        recording_schema = RecordingResponseSchema()
+
+        cases = [
+            ('session', sessions, marshmallow_session, serialize_session),
+            ('recording', recordings, recording_schema.dump, serialize_recording_with_session),
+        ]
+        print(f'{"payload":<10} {"rows":>5} {"marshmallow":>14} {"compiled":>14} {"speedup":>8}')
+        for name, rows, slow, fast in cases:
+            expected = json.dumps([slow(row) for row in rows], sort_keys=True)
+            actual = json.dumps([fast(row) for row in rows], sort_keys=True)
+            if expected != actual:
+                raise SystemExit(f'{name}: compiled output differs from marshmallow')
+
+            timings = []
+            for serialize in (slow, fast):
+                best = min(timeit.repeat(
+                    lambda: [serialize(row) for row in rows], number=1, repeat=args.repeat
+                ))
+                timings.append(best / len(rows) * 1e6)
+            print(f'{name:<10} {len(rows):>5} {timings[0]:>11.1f} us {timings[1]:>11.1f} us '
+                  f'{timings[0] / timings[1]:>7.1f}x')
+
+
+if __name__ == '__main__':
+    main()
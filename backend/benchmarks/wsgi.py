@@ -0,0 +1,9 @@
+"""WSGI entry point for benchmarking under gunicorn.
+
+    gunicorn benchmarks.wsgi:app
+"""
+from app import create_app
+from benchmarks import instrument
+
+app = create_app('testing')
+instrument.install(app)
@@ -0,0 +1,45 @@
+"""Gunicorn settings (``gunicorn -c gunicorn.conf.py run:app``).
+
+Workers write Prometheus samples to ``PROMETHEUS_MULTIPROC_DIR`` so that
+``/metrics`` on any worker reports the whole server. The directory is set here,
+before the application is imported, and emptied when the server starts.
+
+Defaults for the multi-worker deployment behind nginx are set the same way
+(environment variables still win):
+
+- ``TRUSTED_PROXY_HOPS=1``: client addresses come from nginx's
+  ``X-Forwarded-For``, so the per-IP login throttle sees clients rather than
+  the proxy. Only expose the port to the proxy when this is set;
+- ``LOGIN_THROTTLE_BACKEND=sqlite``: failed logins are counted in one file
+  shared by every worker instead of once per worker;
+- ``RESPONSE_CACHE_BACKEND=sqlite``: public responses are cached in one file
+  shared by every worker, so an admin write purges them everywhere. With the
+  per-worker ``memory`` backend, other workers keep serving the old response
+  for up to ``RESPONSE_CACHE_TTL`` seconds.
+"""
+import os
+import shutil
+import tempfile
+
+os.environ.setdefault(
+    'PROMETHEUS_MULTIPROC_DIR', os.path.join(tempfile.gettempdir(), 'digipath-metrics')
+)
+os.environ.setdefault('TRUSTED_PROXY_HOPS', '1')
+os.environ.setdefault('LOGIN_THROTTLE_BACKEND', 'sqlite')
+os.environ.setdefault('RESPONSE_CACHE_BACKEND', 'sqlite')
+
+bind = os.getenv('GUNICORN_BIND', '0.0.0.0:5000')
+workers = int(os.getenv('GUNICORN_WORKERS', 4))
+
+
+def on_starting(server):
+    """Drop samples left over from a previous run."""
+    directory = os.environ['PROMETHEUS_MULTIPROC_DIR']
+    shutil.rmtree(directory, ignore_errors=True)
+    os.makedirs(directory)
+
+
+def child_exit(server, worker):
+    """Remove the live gauges of a worker that exited."""
+    from prometheus_client import multiprocess
+    multiprocess.mark_process_dead(worker.pid)
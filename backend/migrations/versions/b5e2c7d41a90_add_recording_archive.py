@@ -0,0 +1,38 @@
+"""Add recording archive
+
+Revision ID: b5e2c7d41a90
+Revises: 6db81438618b
+Create Date: 2026-10-17 18:40:12.503118
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b5e2c7d41a90'
+down_revision = '6db81438618b'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    archive = op.create_table('recording_archive',
+    sa.Column('year', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('month', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('year', 'month')
+    )
+
+    # Count the existing recordings
+    recordings = sa.table('recordings', sa.column('recorded_date', sa.Date()))
+    year = sa.cast(sa.extract('year', recordings.c.recorded_date), sa.Integer())
+    month = sa.cast(sa.extract('month', recordings.c.recorded_date), sa.Integer())
+    op.execute(archive.insert().from_select(
+        ['year', 'month', 'count'],
+        sa.select(year, month, sa.func.count()).group_by(year, month)
+    ))
+
+
+def downgrade():
+    op.drop_table('recording_archive')
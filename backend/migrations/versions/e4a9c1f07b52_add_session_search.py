@@ -0,0 +1,79 @@
+"""Add session full-text search table
+
+Revision ID: e4a9c1f07b52
+Revises: d81f3a6c02e7
+Create Date: 2026-10-17 20:12:31.604117
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e4a9c1f07b52'
+down_revision = 'd81f3a6c02e7'
+branch_labels = None
+depends_on = None
+
+# Mirrors the DDL and documents of app.services.search_index, which keeps the
+# table out of autogenerate (see include_object in env.py)
+SQLITE_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS session_search USING fts5("
+    "session_id UNINDEXED, title, summary, abstract, speaker, tags, "
+    "tokenize = 'unicode61 remove_diacritics 2')",
+)
+
+POSTGRES_DDL = (
+    "CREATE TABLE IF NOT EXISTS session_search ("
+    "session_id VARCHAR(36) PRIMARY KEY REFERENCES sessions(id) ON DELETE CASCADE, "
+    "document TSVECTOR NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS ix_session_search_document ON session_search USING GIN (document)",
+)
+
+SOURCE = (
+    "FROM sessions "
+    "JOIN speakers ON speakers.id = sessions.speaker_id "
+    "JOIN tags AS organ_tag ON organ_tag.id = sessions.organ_tag_id "
+    "JOIN tags AS type_tag ON type_tag.id = sessions.type_tag_id "
+    "JOIN tags AS level_tag ON level_tag.id = sessions.level_tag_id"
+)
+TAGS = "organ_tag.label || ' ' || type_tag.label || ' ' || level_tag.label"
+
+SQLITE_BACKFILL = (
+    "INSERT INTO session_search (session_id, title, summary, abstract, speaker, tags) "
+    "SELECT sessions.id, sessions.title, sessions.summary, sessions.abstract, "
+    f"speakers.name, {TAGS} {SOURCE}"
+)
+
+POSTGRES_BACKFILL = (
+    "INSERT INTO session_search (session_id, document) "
+    "SELECT sessions.id, "
+    "setweight(to_tsvector('simple', sessions.title), 'A') || "
+    "setweight(to_tsvector('simple', speakers.name), 'A') || "
+    f"setweight(to_tsvector('simple', {TAGS}), 'B') || "
+    "setweight(to_tsvector('simple', sessions.summary), 'B') || "
+    f"setweight(to_tsvector('simple', sessions.abstract), 'C') {SOURCE}"
+)
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == 'sqlite':
+        statements, backfill = SQLITE_DDL, SQLITE_BACKFILL
+    elif dialect == 'postgresql':
+        statements, backfill = POSTGRES_DDL, POSTGRES_BACKFILL
+    else:
+        return
+
+    for statement in statements:
+        op.execute(statement)
+
+    # Index the existing sessions (replacing any documents from an earlier
+    # `flask search-index rebuild`)
+    op.execute("DELETE FROM session_search")
+    op.execute(backfill)
+
+
+def downgrade():
+    if op.get_bind().dialect.name in ('sqlite', 'postgresql'):
+        op.execute("DROP TABLE IF EXISTS session_search")
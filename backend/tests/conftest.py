@@ -0,0 +1,72 @@
+"""Shared fixtures: an application on a throwaway SQLite database."""
+import pytest
+from sqlalchemy import event
+from app import create_app
+from app.config import TestingConfig
+from app.extensions import db
+from app.models import Recording, Session
+from benchmarks.fixtures import seed_catalogue
+
+# Size of the synthetic catalogue shared by the endpoint tests
+SESSIONS = 200
+
+
+@pytest.fixture(scope='session')
+def app(tmp_path_factory):
+    """Application using TestingConfig on a fresh database file."""
+    path = tmp_path_factory.mktemp('db') / 'digipath_test.db'
+    TestingConfig.SQLALCHEMY_DATABASE_URI = f'sqlite:///{path}'
+
+    app = create_app('testing')
+    with app.app_context():
+        db.create_all()
+    yield app
+    with app.app_context():
+        db.session.remove()
+        db.engine.dispose()
+
+
+@pytest.fixture(scope='session')
+def catalogue(app):
+    """Seed the catalogue and return the IDs the detail endpoints need."""
+    with app.app_context():
+        seed_catalogue(sessions=SESSIONS)
+        recording = Recording.query.order_by(Recording.id).first()
+        session = Session.query.filter(Session.status == 'published').order_by(Session.id).first()
+        return {
+            'session_id': session.id,
+            'recording_id': recording.id,
+            'session_id_with_recording': recording.session_id,
+        }
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+class QueryCounter:
+    """Counts the statements sent to the database while active."""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.count = 0
+
+    def _count(self, *args, **kwargs):
+        self.count += 1
+
+    def __enter__(self):
+        self.count = 0
+        event.listen(self.engine, 'before_cursor_execute', self._count)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(self.engine, 'before_cursor_execute', self._count)
+
+
+@pytest.fixture
+def count_queries(app):
+    """Return a context manager counting the queries run inside it."""
+    with app.app_context():
+        engine = db.engine
+    return lambda: QueryCounter(engine)
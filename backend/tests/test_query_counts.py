@@ -0,0 +1,54 @@
+"""Query budgets of the public endpoints.
+
+Each endpoint must answer in a fixed number of SQL statements whatever the
+page size, so a relationship that is lazy-loaded per row (an N+1 query)
+fails here. In-process indexes (catalog, tag registry, home snapshot) are
+warmed first so the counts are those of a steady-state request; the
+response cache is cleared before every request.
+"""
+import pytest
+from app.services.response_cache import response_cache
+
+
+@pytest.fixture(scope='module')
+def warm_catalogue(app, catalogue):
+    """Warm the in-process indexes and return the catalogue IDs."""
+    client = app.test_client()
+    for url in ('/api/v1/public/home', '/api/v1/public/tags',
+                '/api/v1/public/sessions/upcoming', '/api/v1/public/recordings'):
+        client.get(url)
+    return catalogue
+
+
+# (URL, maximum number of queries). Budgets allow one statement on top of the
+# current count for the periodic staleness checks of the in-process indexes.
+BUDGETS = [
+    ('/api/v1/public/home', 4),
+    ('/api/v1/public/tags', 2),
+    ('/api/v1/public/sessions/upcoming?per_page=100', 3),
+    ('/api/v1/public/sessions/upcoming?per_page=100&fields=card', 3),
+    ('/api/v1/public/sessions/upcoming?per_page=100&search=biopsy', 5),
+    ('/api/v1/public/sessions/upcoming?per_page=100&cursor=', 3),
+    ('/api/v1/public/sessions/upcoming/facets', 3),
+    ('/api/v1/public/sessions/{session_id}', 3),
+    ('/api/v1/public/sessions/{session_id}/calendar', 4),
+    ('/api/v1/public/calendar.ics', 2),
+    ('/api/v1/public/recordings?per_page=100', 3),
+    ('/api/v1/public/recordings?per_page=100&sort_by=most_viewed', 5),
+    ('/api/v1/public/recordings?per_page=100&search=biopsy', 5),
+    ('/api/v1/public/recordings?per_page=100&year=2024', 3),
+    ('/api/v1/public/recordings/facets', 3),
+    ('/api/v1/public/recordings/years', 3),
+    ('/api/v1/public/recordings/{recording_id}', 6),
+    ('/api/v1/public/recordings/{session_id_with_recording}', 6),
+]
+
+
+@pytest.mark.parametrize('url, budget', BUDGETS)
+def test_public_endpoint_query_budget(app, client, warm_catalogue, count_queries, url, budget):
+    response_cache.clear()
+    with count_queries() as queries:
+        response = client.get(url.format(**warm_catalogue))
+
+    assert response.status_code == 200
+    assert queries.count <= budget, f'{url} ran {queries.count} queries (budget {budget})'
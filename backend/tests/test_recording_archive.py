@@ -0,0 +1,37 @@
+"""Per-month recording counts kept by the recording archive index."""
+from datetime import date
+from app.extensions import db
+from app.services.recording_archive import recording_archive
+
+FIRST = date(2090, 1, 15)
+SECOND = date(2090, 2, 3)
+
+
+def months(year):
+    for entry in recording_archive.years():
+        if entry['year'] == year:
+            return {month['month']: month['count'] for month in entry['months']}
+    return {}
+
+
+def test_record_creates_moves_and_removes_month_counts(app, catalogue):
+    with app.app_context():
+        try:
+            # First recordings of a month create its row; later ones add to it
+            recording_archive.record(None, FIRST)
+            recording_archive.record(None, FIRST)
+            assert months(2090) == {1: 2}
+
+            recording_archive.record(FIRST, SECOND)
+            assert months(2090) == {1: 1, 2: 1}
+
+            recording_archive.record(FIRST, None)
+            recording_archive.record(SECOND, None)
+            assert months(2090) == {}
+
+            # Removing from a month without a row leaves no negative count
+            recording_archive.record(date(2091, 5, 1), None)
+            assert months(2091) == {}
+        finally:
+            db.session.rollback()
+
@@ -0,0 +1,44 @@
+"""Admin writes purge every cached public response built from what they change."""
+import pytest
+from app.models import Session
+from app.services.response_cache import response_cache
+from app.services.speaker_service import SpeakerService
+
+RENAMED = 'Quillfeather'
+
+
+@pytest.mark.parametrize('url', [
+    f'/api/v1/public/sessions/upcoming/facets?search={RENAMED}',
+    f'/api/v1/public/recordings/facets?search={RENAMED}',
+])
+def test_speaker_rename_purges_facet_counts(app, client, catalogue, url):
+    response_cache.clear()
+    with app.app_context():
+        # A speaker with an upcoming published session and one with a recording
+        session_ids = (catalogue['session_id'], catalogue['session_id_with_recording'])
+        speakers = {session.speaker_id: session.speaker.name
+                    for session in Session.query.filter(Session.id.in_(session_ids))}
+
+    assert client.get(url).get_json()['total'] == 0
+    try:
+        with app.app_context():
+            for speaker_id in speakers:
+                SpeakerService.update_speaker(speaker_id, {'name': f'Dr {RENAMED}'})
+        assert client.get(url).get_json()['total'] > 0
+    finally:
+        with app.app_context():
+            for speaker_id, name in speakers.items():
+                SpeakerService.update_speaker(speaker_id, {'name': name})
+
+
+def test_view_flush_only_expires_listings_ordered_by_views(client, catalogue):
+    response_cache.clear()
+    urls = {sort_by: f'/api/v1/public/recordings?sort_by={sort_by}' for sort_by in ('newest', 'most_viewed')}
+    etags = {sort_by: client.get(url).headers['ETag'] for sort_by, url in urls.items()}
+
+    # Testing flushes every view immediately
+    client.get(f"/api/v1/public/recordings/{catalogue['recording_id']}")
+
+    assert response_cache.stats()['entries'] == 1
+    assert client.get(urls['newest']).headers['ETag'] == etags['newest']
+    assert client.get(urls['most_viewed']).headers['ETag'] != etags['most_viewed']
@@ -0,0 +1,78 @@
+"""Full-text search: relevance ordering and index maintenance on admin writes."""
+import pytest
+from app.extensions import db
+from app.models import Session, SessionListing, Tag
+from app.services.response_cache import response_cache
+from app.services.session_listings import session_listings, UPCOMING_LISTING_SORT
+from app.services.session_service import SessionService
+from app.services.tag_service import TagService
+
+TERM = 'Quokkaplasia'
+
+
+@pytest.fixture
+def title_and_abstract_matches(app, catalogue):
+    """Put TERM in the abstract of an upcoming session and the title of a later one."""
+    with app.app_context():
+        rows = session_listings.upcoming_query().order_by(*[
+            key.asc() for key, _ in UPCOMING_LISTING_SORT
+        ]).with_entities(SessionListing.session_id).limit(2).all()
+        earlier, later = (db.session.get(Session, row.session_id) for row in rows)
+        ids = earlier.id, later.id
+        originals = {
+            earlier.id: {'abstract': earlier.abstract},
+            later.id: {'title': later.title},
+        }
+        SessionService.update_session(earlier.id, {'abstract': f'{earlier.abstract} {TERM}'})
+        SessionService.update_session(later.id, {'title': f'{TERM} {later.title}'})
+    yield ids
+    with app.app_context():
+        for session_id, data in originals.items():
+            SessionService.update_session(session_id, data)
+
+
+def search_ids(client, url):
+    response_cache.clear()
+    response = client.get(url)
+    assert response.status_code == 200
+    return [item['id'] for item in response.get_json()['items']]
+
+
+def test_relevance_ranks_title_matches_first(client, title_and_abstract_matches):
+    earlier, later = title_and_abstract_matches
+    url = f'/api/v1/public/sessions/upcoming?search={TERM}'
+
+    assert search_ids(client, url) == [earlier, later]
+    assert search_ids(client, f'{url}&sort_by=relevance') == [later, earlier]
+
+
+def test_relevance_pages_by_number(client, title_and_abstract_matches):
+    url = f'/api/v1/public/sessions/upcoming?search={TERM}&sort_by=relevance&per_page=1'
+    response_cache.clear()
+    body = client.get(f'{url}&cursor=').get_json()
+
+    assert body['next_cursor'] is None
+    assert body['total'] == 2
+    assert search_ids(client, f'{url}&page=2') == [title_and_abstract_matches[0]]
+
+
+def test_relevance_without_search_keeps_default_order(client, catalogue):
+    url = '/api/v1/public/recordings?per_page=50'
+    assert search_ids(client, f'{url}&sort_by=relevance') == search_ids(client, url)
+
+
+def test_deleting_a_tag_with_replacement_reindexes_its_sessions(app, client, catalogue):
+    with app.app_context():
+        tag = (Tag.query.filter_by(category='organ')
+               .join(Session, Session.organ_tag_id == Tag.id).first())
+        tag_id = tag.id
+        TagService.update_tag(tag_id, {'label': 'Zebrafishy'})
+        replacement = TagService.create_tag({'category': 'organ', 'label': 'Replacement organ'})
+        replacement_id = replacement.id
+
+    assert search_ids(client, '/api/v1/public/recordings?search=Zebrafishy&per_page=100')
+    with app.app_context():
+        TagService.delete_tag(tag_id, replace_with_tag_id=replacement_id)
+
+    for url in ('/api/v1/public/recordings', '/api/v1/public/sessions/upcoming'):
+        assert search_ids(client, f'{url}?search=Zebrafishy') == []